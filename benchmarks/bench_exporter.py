@@ -0,0 +1,82 @@
+""" Measures finding and batch exporting thousands of placeholder Maya files without Maya.
+
+The exports are done by the stub worker, which writes a placeholder FBX file, so the time is spent in discovery,
+job scheduling, the worker processes and the export manifest.
+
+    python benchmarks/bench_exporter.py --files 5000 --workers 4
+    python benchmarks/bench_exporter.py --output exporter.json
+"""
+
+# standard library imports
+import os
+import sys
+import shutil
+import tempfile
+
+# benchmark imports
+from benchmark import BenchmarkResults, create_parser, measure, report
+from synthetic import write_scene_files
+
+# tools imports
+from tools.maya.exporter.exporter import Exporter
+from tools.maya.exporter.export_options import ExportOptions
+from tools.maya.exporter.parallel_export import StubExportWorker
+
+
+def batch_export(input_folder, output_folder, options, incremental=False):
+    """ Runs a whole batch export with the stub worker
+
+    Args:
+        input_folder (str): The folder of placeholder Maya files
+        output_folder (str): The folder to export to
+        options (argparse.Namespace): The parsed command line options
+        incremental (bool): Skip the files that did not change since the last export
+    """
+    # the default options are passed so the manifest does not have to ask Maya for the current ones
+    for _ in Exporter.batch_export_fbx(input_folder, output_folder, options.workers, StubExportWorker(),
+                                       incremental=incremental, recursive=True, options=ExportOptions()):
+        pass
+
+
+def main(args=None):
+    parser = create_parser(__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=2000, help='The number of placeholder Maya files.')
+    parser.add_argument('--folders', type=int, default=20, help='The number of sub folders to spread them over.')
+    parser.add_argument('--workers', type=int, default=4, help='The number of export processes.')
+    options = parser.parse_args(args)
+
+    results = BenchmarkResults('exporter', dict(files=options.files, folders=options.folders,
+                                                workers=options.workers))
+
+    temp_dir = tempfile.mkdtemp()
+    input_folder = os.path.join(temp_dir, 'scenes')
+    outputs = []
+
+    def output_folder():
+        outputs.append(os.path.join(temp_dir, 'fbx_{0}'.format(len(outputs))))
+        return outputs[-1]
+
+    try:
+        write_scene_files(input_folder, options.files, options.folders)
+
+        results.add('discover_files', measure(lambda: Exporter.get_maya_files(input_folder, recursive=True),
+                                              options.repeat), options.files)
+
+        results.add('batch_export_stub', measure(lambda folder: batch_export(input_folder, folder, options),
+                                                 options.repeat, output_folder), options.files)
+
+        # the manifest of the last full export is reused, so every file is skipped
+        incremental_folder = os.path.join(temp_dir, 'fbx_incremental')
+        batch_export(input_folder, incremental_folder, options, incremental=True)
+
+        results.add('batch_export_up_to_date',
+                    measure(lambda: batch_export(input_folder, incremental_folder, options, incremental=True),
+                            options.repeat), options.files)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return report(results, options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
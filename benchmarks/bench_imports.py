@@ -0,0 +1,114 @@
+""" Measures how long the tools take to import in a fresh interpreter, and how long backend detection takes.
+
+Every module is imported in a new process, so nothing is cached between the runs.
+
+    python benchmarks/bench_imports.py --repeat 5
+    python benchmarks/bench_imports.py --backend standalone --json
+"""
+
+# standard library imports
+import os
+import sys
+import json
+import argparse
+import subprocess
+from timeit import default_timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = (
+    'tools.maya.rigging.Utils',
+    'tools.maya.rigging.skeletor.skeleton',
+    'tools.maya.rigging.skeletor.skeletor',
+    'tools.maya.exporter.exporter',
+)
+
+IMPORT_SCRIPT = '''
+import sys
+from timeit import default_timer
+start = default_timer()
+import {0}
+sys.stdout.write(repr(default_timer() - start))
+'''
+
+
+def time_import(module, backend=None):
+    """ Imports a module in a new interpreter
+
+    Args:
+        module (str): The full name of the module
+        backend (str): Forces the backend of the tools, 'maya' or 'standalone'
+
+    Returns:
+        (float) The import time in seconds, or None if the import failed
+    """
+    environment = dict(os.environ)
+
+    if backend:
+        environment['TOOLS_MAYA_BACKEND'] = backend
+
+    process = subprocess.Popen([sys.executable, '-c', IMPORT_SCRIPT.format(module)], cwd=ROOT, env=environment,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output, _ = process.communicate()
+
+    if process.returncode != 0:
+        return None
+
+    return float(output)
+
+
+def time_using_maya(calls=10000):
+    """ Times calls to using_maya in this interpreter
+
+    Args:
+        calls (int): The number of calls
+
+    Returns:
+        (float) The average time of a call in seconds
+    """
+    sys.path.insert(0, ROOT)
+
+    from tools.maya.rigging.Utils import using_maya
+
+    start = default_timer()
+
+    for _ in range(calls):
+        using_maya()
+
+    return (default_timer() - start) / calls
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times every module is imported.')
+    parser.add_argument('--backend', choices=('maya', 'standalone'), help='Force the backend of the tools.')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON.')
+    options = parser.parse_args(args)
+
+    results = dict()
+
+    for module in MODULES:
+        times = [time_import(module, options.backend) for _ in range(options.repeat)]
+        times = [value for value in times if value is not None]
+
+        results[module] = {'min': min(times), 'max': max(times)} if times else None
+
+    results['using_maya_call'] = time_using_maya()
+
+    if options.json:
+        print(json.dumps(results, sort_keys=True, indent=4))
+        return
+
+    for module in MODULES:
+        result = results[module]
+
+        if result is None:
+            print('{0:<45} failed to import'.format(module))
+        else:
+            print('{0:<45} {1:8.2f} ms  (max {2:.2f} ms)'.format(module, result['min'] * 1000, result['max'] * 1000))
+
+    print('{0:<45} {1:8.3f} us'.format('using_maya() per call', results['using_maya_call'] * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+""" Measures saving, loading, querying and building synthetic skeletons without Maya.
+
+The skeletons are built against a scene that only records the created nodes, and against an InMemoryScene, so the
+time is spent in the skeleton code and not in a DCC.
+
+    python benchmarks/bench_skeletor.py --joints 5000 --depth 12 --branching 3
+    python benchmarks/bench_skeletor.py --skeletons 50 --workers 4 --output skeletor.json
+"""
+
+# standard library imports
+import os
+import sys
+import shutil
+import tempfile
+
+# benchmark imports
+from benchmark import BenchmarkResults, create_parser, measure, report
+from synthetic import GROUPS, ATTRIBUTES, generate_skeleton, write_definitions
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.skeletor import Skeletor
+from tools.maya.rigging.skeletor.definition_cache import DefinitionCache
+from tools.maya.rigging.skeletor.memory_scene import InMemoryScene
+from tools.maya.rigging.skeletor.scene_backend import set_scene_backend
+from tools.maya.rigging.skeletor.scene_skeleton import SceneSkeleton
+
+
+class MockSceneSkeleton(Skeleton):
+    """ A skeleton that records the created joints in a dictionary instead of a scene.
+    """
+
+    def __init__(self, prefix='', pooled=False):
+        """ Constructor
+
+        Args:
+            prefix (str): The prefix for the skeleton
+            pooled (bool): Store the joint data in a JointPool
+        """
+        super(MockSceneSkeleton, self).__init__(prefix, pooled)
+        self.scene = dict()
+
+    def create_level(self, joints, parents):
+        """ Records one level of the hierarchy in the scene dictionary
+
+        Args:
+            joints (list(JointData)): The joints to create
+            parents (list): The created parent node or the name of the parent for each joint
+
+        Returns:
+            list(dict): The recorded node of each joint
+        """
+        nodes = []
+
+        for joint, parent in zip(joints, parents):
+            node = {'name': joint.name, 'parent': parent, 'translation': list(joint.translation),
+                    'rotation': list(joint.rotation), 'orientation': list(joint.orientation)}
+            self.scene[joint.name] = node
+            nodes.append(node)
+
+        return nodes
+
+
+def bench_files(results, options, temp_dir):
+    """ Measures saving and loading one skeleton in both formats
+    """
+    skeleton = generate_skeleton(options.joints, options.depth, options.branching)
+    pooled = generate_skeleton(options.joints, options.depth, options.branching, pooled=True)
+
+    json_path = os.path.join(temp_dir, 'skeleton.json')
+    binary_path = os.path.join(temp_dir, 'skeleton.skb')
+
+    results.add('save_json', measure(lambda: skeleton.save(json_path), options.repeat), options.joints)
+    results.add('save_binary', measure(lambda: pooled.save(binary_path), options.repeat), options.joints)
+
+    results.add('load_json', measure(lambda: Skeleton().load(json_path), options.repeat), options.joints)
+    results.add('load_json_pooled', measure(lambda: Skeleton(pooled=True).load(json_path), options.repeat),
+                options.joints)
+    results.add('load_binary_pooled', measure(lambda: Skeleton(pooled=True).load(binary_path), options.repeat),
+                options.joints)
+    results.add('load_json_subtree', measure(lambda: Skeleton().load(json_path, root='joint_000001'),
+                                             options.repeat), options.joints)
+
+    cache = DefinitionCache()
+    Skeleton(pooled=True).load(json_path, cache=cache)
+
+    results.add('load_json_cached', measure(lambda: Skeleton(pooled=True).load(json_path, cache=cache),
+                                            options.repeat), options.joints)
+
+
+def bench_memory_scene(results, options):
+    """ Measures building a skeleton in an in-memory scene and capturing it back
+    """
+    skeleton = generate_skeleton(options.joints, options.depth, options.branching, skeleton_class=SceneSkeleton)
+    root = skeleton.roots()[0].name
+
+    def build():
+        set_scene_backend(InMemoryScene())
+        skeleton.build()
+
+    try:
+        results.add('build_memory_scene', measure(build, options.repeat), options.joints)
+        results.add('capture_memory_scene', measure(lambda: SceneSkeleton().from_hierarchy(root), options.repeat),
+                    options.joints)
+    finally:
+        set_scene_backend(None)
+
+
+def bench_skeleton(results, options):
+    """ Measures building, querying and evaluating one skeleton
+    """
+    skeleton = generate_skeleton(options.joints, options.depth, options.branching, skeleton_class=MockSceneSkeleton)
+
+    results.add('build_mock_scene', measure(lambda: skeleton.build(), options.repeat), options.joints)
+    bench_memory_scene(results, options)
+    results.add('reindex', measure(skeleton.reindex, options.repeat), options.joints)
+
+    def select():
+        for group in GROUPS:
+            for attribute in ATTRIBUTES:
+                skeleton.select(group, attribute)
+
+    queries = len(GROUPS) * len(ATTRIBUTES)
+    results.add('select_group_attribute', measure(select, options.repeat), queries)
+
+    results.add('forward_kinematics', measure(lambda: skeleton.forward_kinematics(), options.repeat), options.joints)
+
+
+def bench_build_skeletons(results, options, temp_dir):
+    """ Measures loading and building a batch of definitions through Skeletor
+    """
+    folder = os.path.join(temp_dir, 'definitions')
+    os.makedirs(folder)
+
+    paths = write_definitions(folder, options.skeletons, options.joints, options.depth, options.branching)
+    count = options.skeletons * options.joints
+
+    results.add('build_skeletons', measure(lambda: Skeletor.build_skeletons(paths, options.workers),
+                                           options.repeat), count)
+
+    cache = DefinitionCache()
+    Skeletor.load_skeletons(paths, cache=cache)
+
+    results.add('build_skeletons_cached', measure(lambda: Skeletor.build_skeletons(paths, options.workers, cache=cache),
+                                                  options.repeat), count)
+
+
+def main(args=None):
+    parser = create_parser(__doc__.splitlines()[0])
+    parser.add_argument('--joints', type=int, default=1000, help='The number of joints of every skeleton.')
+    parser.add_argument('--depth', type=int, default=10, help='The number of levels below the root joint.')
+    parser.add_argument('--branching', type=int, default=3, help='The largest number of children of a joint.')
+    parser.add_argument('--skeletons', type=int, default=10, help='The number of definitions to build in a batch.')
+    parser.add_argument('--workers', type=int, default=1, help='The number of processes to load the batch with.')
+    options = parser.parse_args(args)
+
+    parameters = dict((key, getattr(options, key)) for key in ('joints', 'depth', 'branching', 'skeletons', 'workers'))
+    results = BenchmarkResults('skeletor', parameters)
+
+    temp_dir = tempfile.mkdtemp()
+
+    try:
+        bench_files(results, options, temp_dir)
+        bench_skeleton(results, options)
+        bench_build_skeletons(results, options, temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    return report(results, options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
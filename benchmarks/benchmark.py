@@ -0,0 +1,232 @@
+""" Shared timing, result recording and comparison for the benchmark scripts.
+
+Results are saved as JSON with the git commit they were measured on, and can be compared against the results of
+another commit to find regressions:
+
+    python benchmarks/bench_skeletor.py --output before.json
+    python benchmarks/bench_skeletor.py --compare before.json --threshold 0.2
+"""
+
+# standard library imports
+import os
+import json
+import time
+import platform
+import argparse
+import subprocess
+from timeit import default_timer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FORMAT_VERSION = 1
+
+
+def measure(func, repeat=3, setup=None):
+    """ Times a function a number of times
+
+    Args:
+        func (function): The function to time, called with the return value of setup when there is one
+        repeat (int): The number of times to call the function
+        setup (function): Called before every run without being timed
+
+    Returns:
+        list(float): The time of every run in seconds
+    """
+    times = []
+
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+
+        start = default_timer()
+        func(*args)
+        times.append(default_timer() - start)
+
+    return times
+
+
+def git_commit():
+    """ Gets the commit the benchmarks are run on
+
+    Returns:
+        (str, bool) The commit hash and whether there are uncommitted changes, or (None, False) outside of git
+    """
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT, stderr=subprocess.STDOUT)
+        status = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                         stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+    return commit.decode('ascii').strip(), bool(status.strip())
+
+
+class BenchmarkResults(object):
+    def __init__(self, suite, parameters=None):
+        """ Constructor
+
+        Args:
+            suite (str): The name of the benchmark script
+            parameters (dict): The arguments the benchmarks were run with, ie. the number of joints
+        """
+        commit, dirty = git_commit()
+
+        self.suite = suite
+        self.parameters = parameters or dict()
+        self.commit = commit
+        self.dirty = dirty
+        self.python = platform.python_version()
+        self.platform = platform.platform()
+        self.timestamp = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.benchmarks = dict()
+
+    def add(self, name, times, count=None):
+        """ Records the times of a benchmark
+
+        Args:
+            name (str): The name of the benchmark
+            times (list(float)): The time of every run in seconds
+            count (int): The number of items processed in a run, ie. joints or files, to compute a rate
+        """
+        result = {
+            'min': min(times),
+            'mean': sum(times) / len(times),
+            'max': max(times),
+            'repeat': len(times),
+        }
+
+        if count:
+            result['count'] = count
+            result['per_second'] = count / result['min'] if result['min'] else None
+
+        self.benchmarks[name] = result
+
+    def as_dict(self):
+        """ Gets the results in the layout they are saved in
+
+        Returns:
+            (dict)
+        """
+        return {
+            'version': FORMAT_VERSION,
+            'suite': self.suite,
+            'parameters': self.parameters,
+            'commit': self.commit,
+            'dirty': self.dirty,
+            'python': self.python,
+            'platform': self.platform,
+            'timestamp': self.timestamp,
+            'benchmarks': self.benchmarks,
+        }
+
+    def save(self, path):
+        """ Saves the results as JSON
+
+        Args:
+            path (str): The path to the file
+        """
+        with open(path, 'w') as results_file:
+            json.dump(self.as_dict(), results_file, sort_keys=True, indent=4)
+
+    @staticmethod
+    def load(path):
+        """ Loads saved results
+
+        Args:
+            path (str): The path to the file
+
+        Returns:
+            (dict)
+        """
+        with open(path) as results_file:
+            return json.load(results_file)
+
+    def compare(self, baseline, threshold=0.1):
+        """ Compares the best time of every benchmark with saved results
+
+        Args:
+            baseline (dict): The saved results, ie. from load
+            threshold (float): How much slower a benchmark can be before it is a regression, 0.1 is 10%
+
+        Returns:
+            list((str, float, float, float, bool)) The name, the baseline and current time, the ratio between
+            them and whether it is a regression, for every benchmark in both results
+        """
+        comparison = []
+
+        for name in sorted(self.benchmarks):
+            previous = baseline.get('benchmarks', {}).get(name)
+
+            if previous is None or not previous['min']:
+                continue
+
+            current = self.benchmarks[name]['min']
+            ratio = current / previous['min']
+
+            comparison.append((name, previous['min'], current, ratio, ratio > 1.0 + threshold))
+
+        return comparison
+
+
+def create_parser(description):
+    """ Creates the argument parser with the options every benchmark script has
+
+    Args:
+        description (str): The description of the script
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--repeat', type=int, default=3, help='The number of times every benchmark is run.')
+    parser.add_argument('--output', help='Save the results as JSON to this file.')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON.')
+    parser.add_argument('--compare', help='Compare with the results saved in this file.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='How much slower a benchmark can be than the compared results, 0.1 is 10%%.')
+
+    return parser
+
+
+def report(results, options):
+    """ Prints, saves and compares the results as requested on the command line
+
+    Args:
+        results (BenchmarkResults): The results
+        options (argparse.Namespace): The parsed command line options
+
+    Returns:
+        (int) The exit code, 1 when a benchmark regressed
+    """
+    if options.output:
+        results.save(options.output)
+
+    if options.json:
+        print(json.dumps(results.as_dict(), sort_keys=True, indent=4))
+    else:
+        print('{0} at {1}{2}'.format(results.suite, results.commit or 'unknown commit', ' (dirty)' * results.dirty))
+
+        for name in sorted(results.benchmarks):
+            result = results.benchmarks[name]
+            rate = ''
+
+            if result.get('per_second'):
+                rate = '{0:12.0f} /s'.format(result['per_second'])
+
+            print('{0:<40} {1:10.2f} ms  (mean {2:.2f} ms){3}'.format(
+                name, result['min'] * 1000, result['mean'] * 1000, rate))
+
+    if not options.compare:
+        return 0
+
+    regressions = 0
+
+    print('\ncompared with {0}'.format(options.compare))
+
+    for name, previous, current, ratio, regressed in results.compare(BenchmarkResults.load(options.compare),
+                                                                     options.threshold):
+        regressions += regressed
+        print('{0:<40} {1:10.2f} ms -> {2:10.2f} ms  {3:6.2f}x{4}'.format(
+            name, previous * 1000, current * 1000, ratio, '  REGRESSION' if regressed else ''))
+
+    return 1 if regressions else 0
+
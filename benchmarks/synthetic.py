@@ -0,0 +1,180 @@
+""" Generates synthetic skeletons and scene files for the benchmarks, so they can run without Maya or production data.
+
+Everything is generated from a seed, so the same arguments always give the same data.
+"""
+
+# standard library imports
+import os
+import sys
+import random
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+
+GROUPS = ('body', 'face', 'hand', 'prop')
+
+ATTRIBUTES = ('driver', 'twist', 'ik')
+
+
+def capacity(depth, branching):
+    """ Gets the largest number of joints a skeleton of a given depth and branching can have
+
+    Args:
+        depth (int): The number of levels below the root
+        branching (int): The largest number of children of a joint
+
+    Returns:
+        (int)
+    """
+    return sum(branching ** level for level in range(depth + 1))
+
+
+def generate_joint_data(joint_count, depth=8, branching=3, seed=0):
+    """ Generates the data of a skeleton, the levels are filled breadth first from a single root
+
+    Args:
+        joint_count (int): The number of joints
+        depth (int): The number of levels below the root
+        branching (int): The largest number of children of a joint
+        seed (int): The seed of the random channel values, groups and attributes
+
+    Returns:
+        list(dict): The data of every joint, in the same layout as JointData.as_json, parents first
+    """
+    if joint_count < 1:
+        raise ValueError('Please pass at least one joint.')
+
+    if joint_count > capacity(depth, branching):
+        raise ValueError('{0} joints do not fit in a depth of {1} with {2} children per joint.'.format(
+            joint_count, depth, branching))
+
+    rng = random.Random(seed)
+
+    def vector(low, high):
+        return [rng.uniform(low, high) for _ in range(3)]
+
+    joints = []
+
+    # (joint data, depth) of the joints that can still have children
+    open_joints = deque()
+
+    for i in range(joint_count):
+        name = 'joint_{0:06d}'.format(i)
+        parent = None
+        level = 0
+
+        if open_joints:
+            parent, level = open_joints[0]
+            parent['_children'].append(name)
+            level += 1
+
+            if len(parent['_children']) >= branching:
+                open_joints.popleft()
+
+        data = {
+            '_name': name,
+            '_parent': parent['_name'] if parent is not None else '',
+            '_children': [],
+            '_translation': vector(-10.0, 10.0),
+            '_rotation': vector(-180.0, 180.0),
+            '_orientation': vector(-90.0, 90.0),
+            '_scale': [1.0, 1.0, 1.0],
+            '_group': rng.choice(GROUPS),
+            '_mirror': False,
+            '_mirrored_joint': None,
+            '_node': None,
+            '_custom_attributes': dict((key, rng.randint(0, 9)) for key in ATTRIBUTES if rng.random() < 0.25),
+        }
+
+        joints.append(data)
+
+        if level < depth:
+            open_joints.append((data, level))
+
+    return joints
+
+
+def generate_skeleton(joint_count, depth=8, branching=3, seed=0, pooled=False, skeleton_class=Skeleton):
+    """ Generates a skeleton
+
+    Args:
+        joint_count (int): The number of joints
+        depth (int): The number of levels below the root
+        branching (int): The largest number of children of a joint
+        seed (int): The seed of the random values
+        pooled (bool): Store the joints in a JointPool
+        skeleton_class (type): The Skeleton class to create
+
+    Returns:
+        Skeleton
+    """
+    skeleton = skeleton_class('bench', pooled)
+
+    for data in generate_joint_data(joint_count, depth, branching, seed):
+        joint = JointData()
+        joint.from_json(data)
+        skeleton.add_joint(joint)
+
+    return skeleton
+
+
+def write_definitions(folder, count, joint_count, depth=8, branching=3, format='json'):
+    """ Saves a number of generated skeletons, each one with a different seed
+
+    Args:
+        folder (str): The folder to save to
+        count (int): The number of definitions
+        joint_count (int): The number of joints of every skeleton
+        depth (int): The number of levels below the root
+        branching (int): The largest number of children of a joint
+        format (str): 'json' or 'binary'
+
+    Returns:
+        list(str): The paths to the definitions
+    """
+    extension = '.skb' if format == 'binary' else '.json'
+    paths = []
+
+    for i in range(count):
+        path = os.path.join(folder, 'skeleton_{0:04d}{1}'.format(i, extension))
+        generate_skeleton(joint_count, depth, branching, seed=i).save(path, format)
+        paths.append(path)
+
+    return paths
+
+
+def write_scene_files(folder, count, sub_folders=0, extension='.ma'):
+    """ Writes placeholder Maya files, spread over a number of sub folders
+
+    Args:
+        folder (str): The folder to write to
+        count (int): The number of files
+        sub_folders (int): The number of sub folders, 0 writes every file in the folder itself
+        extension (str): The extension of the files, '.ma' or '.mb'
+
+    Returns:
+        list(str): The paths to the files
+    """
+    paths = []
+
+    for i in range(count):
+        file_folder = os.path.join(folder, 'folder_{0:03d}'.format(i % sub_folders)) if sub_folders else folder
+
+        if not os.path.isdir(file_folder):
+            os.makedirs(file_folder)
+
+        path = os.path.join(file_folder, 'scene_{0:05d}{1}'.format(i, extension))
+
+        with open(path, 'w') as scene_file:
+            scene_file.write('//Maya ASCII scene placeholder {0}\n'.format(i))
+
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,188 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["ExportManifest"]
+
+# standard library imports
+import os
+import json
+import hashlib
+
+
+class ExportManifest(object):
+    """ Remembers what every source file looked like when it was last exported, so unchanged files can be skipped.
+    """
+
+    file_name = "export_manifest.json"
+
+    def __init__(self, output_folder):
+        """ Constructor.
+
+        Args:
+            output_folder (str): The folder the FBX files and the manifest are saved to.
+        """
+        self.path = os.path.join(output_folder, self.file_name)
+        self.entries = dict()
+
+        self.load()
+
+    @staticmethod
+    def get_key(source):
+        """ Get the key a source file is stored under.
+
+        Args:
+            source (str): The path to the Maya file.
+
+        returns:
+            str
+        """
+        return os.path.normcase(os.path.abspath(source)).replace("\\", "/")
+
+    @staticmethod
+    def get_file_hash(path, block_size=1024 * 1024):
+        """ Get the content hash of a file.
+
+        Args:
+            path (str): The path to the file.
+            block_size (int): The number of bytes to read at a time.
+
+        returns:
+            str
+        """
+        file_hash = hashlib.sha1()
+
+        with open(path, "rb") as hash_file:
+            block = hash_file.read(block_size)
+
+            while block:
+                file_hash.update(block)
+                block = hash_file.read(block_size)
+
+        return file_hash.hexdigest()
+
+    def load(self):
+        """ Load the manifest from the output folder.
+        """
+        self.entries = dict()
+
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r") as manifest:
+                self.entries = json.load(manifest).get("entries", dict())
+        except ValueError:
+            # a damaged manifest only means everything is exported again
+            self.entries = dict()
+
+    def save(self):
+        """ Save the manifest to the output folder.
+        """
+        dir_name = os.path.dirname(self.path)
+
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+
+        # write to a temporary file first so a crash never leaves half a manifest behind
+        temp_path = self.path + ".tmp"
+
+        with open(temp_path, "w") as manifest:
+            json.dump({"entries": self.entries}, manifest, sort_keys=True, indent=4)
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        os.rename(temp_path, self.path)
+
+    def is_dirty(self, source, output, options):
+        """ Check whether a file has to be exported.
+
+        The size and modification time are checked first, the content hash is only computed when they changed.
+
+        Args:
+            source (str): The path to the Maya file.
+            output (str): The path to the FBX file.
+            options (dict): The FBX options the file would be exported with.
+
+        returns:
+            bool
+        """
+        entry = self.entries.get(self.get_key(source))
+
+        if not entry or entry["output"] != output or entry["options"] != options or not os.path.exists(output):
+            return True
+
+        stat = os.stat(source)
+
+        if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return False
+
+        if entry["size"] != stat.st_size or self.get_file_hash(source) != entry["hash"]:
+            return True
+
+        # the file was touched but not changed
+        entry["mtime"] = stat.st_mtime
+
+        return False
+
+    @classmethod
+    def get_file_state(cls, source):
+        """ Get the size, modification time and content hash of a source file.
+
+        Args:
+            source (str): The path to the Maya file.
+
+        returns:
+            dict
+        """
+        stat = os.stat(source)
+
+        return {"size": stat.st_size, "mtime": stat.st_mtime, "hash": cls.get_file_hash(source)}
+
+    def record(self, source, output, options, state=None):
+        """ Record a successful export.
+
+        Args:
+            source (str): The path to the Maya file.
+            output (str): The path to the FBX file.
+            options (dict): The FBX options the file was exported with.
+            state (dict): The state of the source from get_file_state, taken before the export so a file that is
+                saved while it is exported is exported again next time. The current state is used if not set.
+        """
+        state = state or self.get_file_state(source)
+
+        self.entries[self.get_key(source)] = {
+            "source": source,
+            "output": output,
+            "size": state["size"],
+            "mtime": state["mtime"],
+            "hash": state["hash"],
+            "options": options,
+        }
+
+    def prune(self, sources=None, delete_outputs=True):
+        """ Remove the entries of source files that are gone, and optionally their FBX files.
+
+        Args:
+            sources (list<str>): The source files to keep, by default every source that still exists is kept.
+            delete_outputs (bool): Delete the orphaned FBX files?
+
+        returns:
+            list<str>: The FBX files of the removed entries.
+        """
+        keep = set(self.get_key(source) for source in sources) if sources is not None else None
+
+        orphans = []
+
+        for key, entry in list(self.entries.items()):
+            if (keep is None or key in keep) and os.path.exists(entry["source"]):
+                continue
+
+            del self.entries[key]
+
+            orphans.append(entry["output"])
+
+            if delete_outputs and os.path.exists(entry["output"]):
+                os.remove(entry["output"])
+
+        return orphans
@@ -0,0 +1,339 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["PHASES", "PhaseTimer", "MetricsSink", "JsonLinesSink", "MemorySink", "ExportInstrumentation",
+           "ExportTimingReport", "percentile"]
+
+# standard library imports
+import os
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from timeit import default_timer
+
+# the phases of every exported file, in the order they happen
+PHASES = ("discover", "open", "configure", "export", "write")
+
+
+def percentile(values, percent):
+    """ Get a percentile of a list of values, interpolating between the two closest values.
+
+    Args:
+        values (list<float>): The values, sorted.
+        percent (float): The percentile from 0 to 100.
+
+    returns:
+        float: 0.0 when there are no values.
+    """
+    if not values:
+        return 0.0
+
+    position = (len(values) - 1) * percent / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class PhaseTimer(object):
+    """ Adds up the time spent in every phase of exporting one file.
+    """
+
+    def __init__(self, phases=None, clock=default_timer):
+        """ Constructor.
+
+        Args:
+            phases (dict): The phases that were already timed, ie. by a worker process.
+            clock (function): Returns the current time in seconds.
+        """
+        self.phases = OrderedDict(phases or ())
+        self._clock = clock
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """ Time the code inside of the block as a phase, a phase that is entered again adds to its time.
+
+        The time of a phase inside of another phase is only counted for the inner phase.
+
+        Args:
+            name (str): The name of the phase, ie. "export".
+        """
+        # the start time and the time spent in the phases inside of this one
+        frame = [self._clock(), 0.0]
+        self._stack.append(frame)
+
+        try:
+            yield
+        finally:
+            self._stack.pop()
+
+            elapsed = self._clock() - frame[0]
+            self.add(name, elapsed - frame[1])
+
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def add(self, name, seconds):
+        """ Add time to a phase.
+
+        Args:
+            name (str): The name of the phase.
+            seconds (float): The time to add.
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @property
+    def total(self):
+        """ The time in seconds of every phase together.
+        """
+        return sum(self.phases.values())
+
+
+class MetricsSink(object):
+    """ Receives a record for every exported file.
+    """
+
+    def emit(self, record):
+        """ Store the record of a file.
+
+        Args:
+            record (dict): The source, output, success, error, worker, size, duration and phases of the file.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """ Called once the batch is done.
+        """
+        return
+
+
+class MemorySink(MetricsSink):
+    """ Keeps the records in a list, ie. for tests and for the summary of the current batch.
+    """
+
+    def __init__(self):
+        """ Constructor.
+        """
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class JsonLinesSink(MetricsSink):
+    """ Appends every record to a file as one line of JSON, the nightly exports keep one file per run.
+
+    Every line is flushed as it is written, so the records of a batch that crashed are kept.
+    """
+
+    def __init__(self, path, append=True):
+        """ Constructor.
+
+        Args:
+            path (str): The path to the file.
+            append (bool): Add to an existing file instead of replacing it.
+        """
+        dir_name = os.path.dirname(path)
+
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+
+        self.path = path
+        self._file = open(path, "a" if append else "w")
+
+    def emit(self, record):
+        self._file.write(json.dumps(record, sort_keys=True) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    @staticmethod
+    def read(path):
+        """ Read the records of a file.
+
+        Args:
+            path (str): The path to the file.
+
+        returns:
+            list<dict>: The records, a line cut off by a crash is skipped.
+        """
+        records = []
+
+        with open(path, "r") as records_file:
+            for line in records_file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        return records
+
+
+class ExportInstrumentation(object):
+    """ Sends the timings, output size and errors of every exported file to the sinks.
+    """
+
+    def __init__(self, sinks=None, clock=time.time):
+        """ Constructor.
+
+        Args:
+            sinks (list<MetricsSink>): Where the records are sent, a MemorySink is always added for the report.
+            clock (function): Returns the current time in seconds, the records are stamped with it.
+        """
+        self.memory = MemorySink()
+        self.sinks = list(sinks or []) + [self.memory]
+
+        self._clock = clock
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def record(self, result, timer=None):
+        """ Record an exported file.
+
+        Args:
+            result (ExportResult): The outcome of the export.
+            timer (PhaseTimer): The time of every phase of the file, by default only the export time is known.
+
+        returns:
+            dict: The record sent to the sinks.
+        """
+        phases = timer.phases if timer is not None else {"export": result.duration}
+
+        # the export time includes the untimed parts of the export, discovering and writing happen around it
+        duration = result.duration + phases.get("discover", 0.0) + phases.get("write", 0.0)
+
+        size = None
+
+        if result.success and os.path.exists(result.output):
+            size = os.path.getsize(result.output)
+
+        record = {
+            "time": self._clock(),
+            "source": result.source,
+            "output": result.output,
+            "success": result.success,
+            "error": result.error,
+            "worker": result.worker,
+            "size": size,
+            "duration": duration,
+            "phases": dict(phases),
+        }
+
+        for sink in self.sinks:
+            sink.emit(record)
+
+        return record
+
+    def report(self, slowest=10):
+        """ Get the timing report of the files recorded so far.
+
+        Args:
+            slowest (int): The number of slowest files to list.
+
+        returns:
+            ExportTimingReport
+        """
+        return ExportTimingReport(self.memory.records, slowest)
+
+    def close(self):
+        """ Close the sinks.
+        """
+        for sink in self.sinks:
+            sink.close()
+
+
+class ExportTimingReport(object):
+    """ The percentiles of the export time of every phase, and the slowest files of a batch.
+    """
+
+    percentiles = (50, 90, 99)
+
+    def __init__(self, records, slowest=10):
+        """ Constructor.
+
+        Args:
+            records (list<dict>): The records of the exported files, from a MemorySink or JsonLinesSink.read.
+            slowest (int): The number of slowest files to list.
+        """
+        self.count = len(records)
+        self.failed = [record for record in records if not record["success"]]
+        self.total_size = sum(record["size"] or 0 for record in records)
+
+        durations = sorted(record["duration"] for record in records)
+        self.total_time = sum(durations)
+
+        names = [phase for phase in PHASES if any(phase in record["phases"] for record in records)]
+        names.extend(sorted(set(phase for record in records for phase in record["phases"]) - set(PHASES)))
+
+        self.phases = OrderedDict()
+
+        for name in names:
+            self.phases[name] = self._summarize(sorted(record["phases"].get(name, 0.0) for record in records))
+
+        self.phases["total"] = self._summarize(durations)
+
+        self.slowest = sorted(records, key=lambda record: record["duration"], reverse=True)[:slowest]
+
+    @classmethod
+    def _summarize(cls, values):
+        """ Get the statistics of the sorted times of a phase.
+
+        Args:
+            values (list<float>): The times, sorted.
+
+        returns:
+            OrderedDict: The total, mean, percentiles and max.
+        """
+        summary = OrderedDict()
+
+        summary["total"] = sum(values)
+        summary["mean"] = summary["total"] / len(values) if values else 0.0
+
+        for percent in cls.percentiles:
+            summary["p{0}".format(percent)] = percentile(values, percent)
+
+        summary["max"] = values[-1] if values else 0.0
+
+        return summary
+
+    def as_dict(self):
+        """ Get the report as a dictionary, ie. to save it with the nightly results.
+
+        returns:
+            dict
+        """
+        return {
+            "count": self.count,
+            "failed": len(self.failed),
+            "total_size": self.total_size,
+            "total_time": self.total_time,
+            "phases": self.phases,
+            "slowest": [{"source": record["source"], "duration": record["duration"]} for record in self.slowest],
+        }
+
+    def __str__(self):
+        columns = list(self.phases.get("total", ()))
+
+        lines = ["{0} files, {1} failed, {2:.1f} MB written, {3:.3f}s".format(
+            self.count, len(self.failed), self.total_size / (1024.0 * 1024.0), self.total_time)]
+
+        lines.append("{0:<12}".format("phase") + "".join("{0:>12}".format(column) for column in columns))
+
+        for name, summary in self.phases.items():
+            lines.append("{0:<12}".format(name) + "".join("{0:>12.4f}".format(value) for value in summary.values()))
+
+        if self.slowest:
+            lines.append("slowest files:")
+            lines.extend("  {0:.3f}s {1}".format(record["duration"], record["source"]) for record in self.slowest)
+
+        for record in self.failed:
+            lines.append("failed: {0} ({1})".format(record["source"], record["error"]))
+
+        return "\n".join(lines)
@@ -0,0 +1,257 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["ExportOptions", "FbxOptionState", "SCENE_MODES"]
+
+# standard library imports
+import os
+import json
+import fnmatch
+from collections import OrderedDict
+
+# the FBX plugin MEL command that sets each option
+FBX_COMMANDS = OrderedDict([
+    ("triangulate", "FBXExportTriangulate"),
+    ("bake_animation", "FBXExportBakeComplexAnimation"),
+    ("bake_start", "FBXExportBakeComplexStart"),
+    ("bake_end", "FBXExportBakeComplexEnd"),
+    ("key_reducer", "FBXExportApplyConstantKeyReducer"),
+    ("animation_only", "FBXExportAnimationOnly"),
+    ("ascii", "FBXExportInAscii"),
+])
+
+# how each Maya file is brought into the scene to be exported
+SCENE_MODES = ("open", "reference", "import")
+
+PRESETS_FOLDER = os.path.join(os.path.dirname(__file__), "settings", "presets")
+
+
+def _mel_eval(mel_cmd):
+    """ Evaluate a MEL command in Maya.
+
+    Args:
+        mel_cmd (str): The command to run.
+    """
+    import pymel.core as pm
+    pm.mel.eval(mel_cmd)
+
+
+class FbxOptionState(object):
+    """ Tracks the FBX export options that have been set in this session, so they are only set again when they change.
+    """
+
+    applied = dict()
+
+    @classmethod
+    def apply(cls, options, evaluate=None, force=False):
+        """ Set FBX export options, skipping the ones that are already set to the same value.
+
+        Args:
+            options (dict): The option names from FBX_COMMANDS and their values.
+            evaluate (function): Runs a MEL command, defaults to pm.mel.eval.
+            force (bool): Set every option even if it looks like it is already set.
+
+        returns:
+            list<str>: The MEL commands that were run.
+        """
+        evaluate = evaluate or _mel_eval
+
+        mel_cmds = []
+
+        for option, value in options.items():
+            if not force and option in cls.applied and cls.applied[option] == value:
+                continue
+
+            if isinstance(value, bool):
+                mel_cmd = "{0} -v {1};".format(FBX_COMMANDS[option], "true" if value else "false")
+            else:
+                mel_cmd = "{0} -v {1};".format(FBX_COMMANDS[option], value)
+
+            evaluate(mel_cmd)
+
+            cls.applied[option] = value
+
+            mel_cmds.append(mel_cmd)
+
+        return mel_cmds
+
+    @classmethod
+    def reset(cls):
+        """ Forget the applied options, ie. after they were changed in the FBX export dialog.
+        """
+        cls.applied = dict()
+
+
+class ExportOptions(object):
+    def __init__(self, triangulate=False, bake_animation=False, bake_start=0, bake_end=0, key_reducer=False,
+                 animation_only=False, ascii=True, selected=True, scene_mode="open", open_patterns=None):
+        """ Constructor.
+
+        Args:
+            triangulate (bool): Triangulate meshes?
+            bake_animation (bool): Bake the animation?
+            bake_start (int): The start frame for the bake, 0 keeps the current start frame.
+            bake_end (int): The end frame for the bake, 0 keeps the current end frame.
+            key_reducer (bool): Use the constant key reducer?
+            animation_only (bool): Export the animation only?
+            ascii (bool): Export the file as an ascii?
+            selected (bool): Export selected only?
+            scene_mode (str): Open every file in a new scene, or reference or import it into one persistent scene.
+            open_patterns (list<str>): Glob patterns of files that are always opened, ie. ["*_cinematic*"].
+        """
+        if scene_mode not in SCENE_MODES:
+            raise ValueError("{0} is not a scene mode, use one of {1}.".format(scene_mode, ", ".join(SCENE_MODES)))
+
+        self.triangulate = triangulate
+        self.bake_animation = bake_animation
+        self.bake_start = bake_start
+        self.bake_end = bake_end
+        self.key_reducer = key_reducer
+        self.animation_only = animation_only
+        self.ascii = ascii
+        self.selected = selected
+        self.scene_mode = scene_mode
+        self.open_patterns = list(open_patterns or [])
+
+    def __eq__(self, other):
+        return isinstance(other, ExportOptions) and self.as_dict() == other.as_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "ExportOptions({0})".format(", ".join("{0}={1}".format(key, value)
+                                                     for key, value in sorted(self.as_dict().items())))
+
+    def as_dict(self):
+        """ Get the options as a dictionary.
+
+        returns:
+            dict
+        """
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Create the options from a dictionary.
+
+        Args:
+            data (dict): The option values, missing options keep their defaults.
+
+        returns:
+            ExportOptions
+        """
+        defaults = cls().__dict__
+
+        for key in data:
+            if key not in defaults:
+                raise ValueError("{0} is not an export option.".format(key))
+
+        return cls(**dict((str(key), value) for key, value in data.items()))
+
+    def get_fbx_options(self):
+        """ Get the FBX plugin options to set.
+
+        returns:
+            OrderedDict
+        """
+        fbx_options = OrderedDict((option, getattr(self, option)) for option in FBX_COMMANDS)
+
+        # the bake range is only set when baking, and 0 keeps the current frame
+        for option in ("bake_start", "bake_end"):
+            if not self.bake_animation or not fbx_options[option]:
+                del fbx_options[option]
+
+        return fbx_options
+
+    def get_scene_mode(self, m_file):
+        """ Get how a Maya file is brought into the scene.
+
+        Args:
+            m_file (str): The path to the Maya file.
+
+        returns:
+            str: One of SCENE_MODES.
+        """
+        file_name = os.path.basename(m_file)
+
+        if any(fnmatch.fnmatch(file_name, pattern) for pattern in self.open_patterns):
+            return "open"
+
+        return self.scene_mode
+
+    def apply(self, evaluate=None, force=False):
+        """ Set the FBX plugin options, only the options that changed are set.
+
+        Args:
+            evaluate (function): Runs a MEL command, defaults to pm.mel.eval.
+            force (bool): Set every option even if it looks like it is already set.
+
+        returns:
+            list<str>: The MEL commands that were run.
+        """
+        return FbxOptionState.apply(self.get_fbx_options(), evaluate, force)
+
+    @staticmethod
+    def get_preset_path(name, folder=None):
+        """ Get the path to a preset file.
+
+        Args:
+            name (str): The name of the preset.
+            folder (str): The folder the presets are saved in.
+
+        returns:
+            str
+        """
+        return os.path.join(folder or PRESETS_FOLDER, name + ".json")
+
+    def save_preset(self, name, folder=None):
+        """ Save the options as a named preset.
+
+        Args:
+            name (str): The name of the preset.
+            folder (str): The folder to save the preset in.
+        """
+        preset_path = self.get_preset_path(name, folder)
+
+        if not os.path.exists(os.path.dirname(preset_path)):
+            os.makedirs(os.path.dirname(preset_path))
+
+        with open(preset_path, "w") as preset:
+            json.dump(self.as_dict(), preset, sort_keys=True, indent=4)
+
+    @classmethod
+    def load_preset(cls, name, folder=None):
+        """ Load a named preset.
+
+        Args:
+            name (str): The name of the preset.
+            folder (str): The folder the presets are saved in.
+
+        returns:
+            ExportOptions
+        """
+        preset_path = cls.get_preset_path(name, folder)
+
+        if not os.path.exists(preset_path):
+            raise IOError("Unable to find the preset {0}".format(preset_path))
+
+        with open(preset_path, "r") as preset:
+            return cls.from_dict(json.load(preset))
+
+    @staticmethod
+    def list_presets(folder=None):
+        """ Get the names of the saved presets.
+
+        Args:
+            folder (str): The folder the presets are saved in.
+
+        returns:
+            list<str>
+        """
+        folder = folder or PRESETS_FOLDER
+
+        if not os.path.isdir(folder):
+            return []
+
+        return sorted(os.path.splitext(file_name)[0] for file_name in os.listdir(folder) if file_name.endswith(".json"))
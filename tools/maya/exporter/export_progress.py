@@ -0,0 +1,132 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["ExportProgress"]
+
+# standard library imports
+import time
+
+
+class ExportProgress(object):
+    """ Tracks the throughput of a batch export and estimates the time it has left.
+    """
+
+    def __init__(self, clock=time.time):
+        """ Constructor.
+
+        Args:
+            clock (function): Returns the current time in seconds.
+        """
+        self._clock = clock
+
+        self.start_time = 0.0
+        self.percent = 0.0
+        self.exported = 0
+        self.failed = 0
+
+        self._paused_time = 0.0
+        self._pause_start = None
+
+        self.start()
+
+    def start(self):
+        """ Start timing a new batch.
+        """
+        self.start_time = self._clock()
+        self.percent = 0.0
+        self.exported = 0
+        self.failed = 0
+
+        self._paused_time = 0.0
+        self._pause_start = None
+
+    def pause(self):
+        """ Stop the clock while the batch is paused.
+        """
+        if self._pause_start is None:
+            self._pause_start = self._clock()
+
+    def resume(self):
+        """ Start the clock again after a pause.
+        """
+        if self._pause_start is not None:
+            self._paused_time += self._clock() - self._pause_start
+            self._pause_start = None
+
+    def record(self, success):
+        """ Record a finished file.
+
+        Args:
+            success (bool): Did the export work?
+        """
+        if success:
+            self.exported += 1
+        else:
+            self.failed += 1
+
+    def update(self, percent):
+        """ Set how far the batch is.
+
+        Args:
+            percent (float): The progress of the batch from 0 to 100.
+        """
+        self.percent = percent
+
+    @property
+    def paused(self):
+        return self._pause_start is not None
+
+    @property
+    def elapsed(self):
+        """ The time in seconds the batch has been running, without the time it was paused.
+        """
+        end_time = self._pause_start if self._pause_start is not None else self._clock()
+
+        return max(end_time - self.start_time - self._paused_time, 0.0)
+
+    @property
+    def files_per_minute(self):
+        """ The number of files exported or failed per minute.
+        """
+        elapsed = self.elapsed
+
+        if not elapsed:
+            return 0.0
+
+        return (self.exported + self.failed) / elapsed * 60.0
+
+    @property
+    def eta(self):
+        """ The estimated time in seconds the batch has left, None until the first file is done.
+        """
+        if self.percent <= 0:
+            return None
+
+        return self.elapsed * (100.0 - min(self.percent, 100.0)) / self.percent
+
+    @staticmethod
+    def format_time(seconds):
+        """ Format a number of seconds as hours, minutes and seconds.
+
+        Args:
+            seconds (float): The time to format.
+
+        returns:
+            str
+        """
+        if seconds is None:
+            return "--:--:--"
+
+        minutes, seconds = divmod(int(round(seconds)), 60)
+        hours, minutes = divmod(minutes, 60)
+
+        return "{0:02d}:{1:02d}:{2:02d}".format(hours, minutes, seconds)
+
+    def __str__(self):
+        status = "{0} exported, {1} failed, {2:.1f} files/min, {3} left".format(
+            self.exported, self.failed, self.files_per_minute, self.format_time(self.eta))
+
+        if self.paused:
+            status += " (paused)"
+
+        return status
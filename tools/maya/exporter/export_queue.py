@@ -0,0 +1,414 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["ExportJobQueue", "ExportJob", "PENDING", "RUNNING", "DONE", "FAILED"]
+
+# standard library imports
+import os
+import time
+import errno
+import socket
+import sqlite3
+from contextlib import contextmanager
+
+# internal imports
+from export_manifest import ExportManifest
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+STATUSES = (PENDING, RUNNING, DONE, FAILED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    output TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    worker TEXT NOT NULL DEFAULT '',
+    queued REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    duration REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, attempts, id);
+"""
+
+COLUMNS = ("id", "source", "output", "status", "attempts", "error", "worker", "queued", "started", "finished",
+           "duration")
+
+
+def _process_running(pid):
+    """ Check if a process of this machine is still running.
+
+    Args:
+        pid (int): The id of the process.
+
+    returns:
+        bool: True if the process is running.
+    """
+    if os.name == "nt":
+        # os.kill terminates the process on windows, so the process is opened instead
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+
+        if not handle:
+            # a process that exists but belongs to another user can not be opened
+            return ctypes.GetLastError() == 5  # ERROR_ACCESS_DENIED
+
+        exit_code = ctypes.c_ulong()
+        running = kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        running = running and exit_code.value == 259  # STILL_ACTIVE
+        kernel32.CloseHandle(handle)
+        return bool(running)
+
+    try:
+        os.kill(pid, 0)
+    except OSError as error:
+        return error.errno == errno.EPERM
+
+    return True
+
+
+class ExportJob(object):
+    def __init__(self, id, source, output, status=PENDING, attempts=0, error="", worker="", queued=None,
+                 started=None, finished=None, duration=0.0):
+        """ Constructor
+
+        Args:
+            id (int): The id of the job in the queue.
+            source (str): The Maya file to export.
+            output (str): The FBX file to write.
+            status (str): PENDING, RUNNING, DONE or FAILED.
+            attempts (int): The number of times the export was started.
+            error (str): The error of the last failed attempt.
+            worker (str): The worker that ran the last attempt.
+            queued (float): The time the job was added.
+            started (float): The time the last attempt started.
+            finished (float): The time the last attempt finished.
+            duration (float): The time in seconds the last attempt took.
+        """
+        self.id = id
+        self.source = source
+        self.output = output
+        self.status = status
+        self.attempts = attempts
+        self.error = error
+        self.worker = worker
+        self.queued = queued
+        self.started = started
+        self.finished = finished
+        self.duration = duration
+
+    def __repr__(self):
+        return "ExportJob({0}, {1})".format(self.source, self.status)
+
+
+class ExportJobQueue(object):
+    """ A queue of export jobs stored in a SQLite file, so a batch can be resumed after a crash.
+
+    Every job is claimed inside of a write transaction, so several sessions on the same machine can pull from the
+    same queue without exporting a file twice.  Keep the file on a local disk, SQLite locking is not reliable on
+    network shares, so the queue can not be shared between machines.
+    """
+
+    def __init__(self, path, max_attempts=3, timeout=30.0):
+        """ Constructor.
+
+        Args:
+            path (str): The path to the queue file, it is created when it does not exist.
+            max_attempts (int): The number of times a job is started before it stays failed, crashes count too.
+            timeout (float): The time in seconds to wait for another session to finish writing.
+        """
+        dir_name = os.path.dirname(path)
+
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+
+        self.path = path
+        self.max_attempts = max(1, max_attempts)
+
+        # the transactions are started by hand, so a claim can lock the file before it reads
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        """ Close the queue file.
+        """
+        self._connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        """ Run the statements inside of the block as one write transaction.
+
+        yields:
+            sqlite3.Connection
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        self._connection.execute("COMMIT")
+
+    @staticmethod
+    def _job(row):
+        """ Create a job from a row of the queue.
+
+        Args:
+            row (tuple): The values of COLUMNS.
+
+        returns:
+            ExportJob
+        """
+        return ExportJob(*row)
+
+    def add(self, jobs, reset=False):
+        """ Add jobs to the queue, a file that is already queued keeps its status.
+
+        Args:
+            jobs (iterable<tuple>): The (source, output) path of every file to export.
+            reset (bool): Queue the files that were already done or failed again.
+
+        returns:
+            int: The number of jobs that were added or reset.
+        """
+        now = time.time()
+        rows = [(ExportManifest.get_key(source), source, output, PENDING, now) for source, output in jobs]
+
+        if not rows:
+            return 0
+
+        with self._transaction() as connection:
+            count = connection.executemany("INSERT OR IGNORE INTO jobs (key, source, output, status, queued) "
+                                           "VALUES (?, ?, ?, ?, ?)", rows).rowcount
+
+            if reset:
+                count += connection.executemany(
+                    "UPDATE jobs SET status = ?, attempts = 0, error = '', output = ?, queued = ? "
+                    "WHERE key = ? AND status IN (?, ?)",
+                    [(PENDING, row[2], now, row[0], DONE, FAILED) for row in rows]).rowcount
+
+        return count
+
+    def claim(self, worker=None):
+        """ Take the next pending job and mark it as running.
+
+        Args:
+            worker (str): The name of the worker taking the job, defaults to the host and process id.
+
+        returns:
+            ExportJob: None when there are no pending jobs left.
+        """
+        worker = worker or "{0}:{1}".format(socket.gethostname(), os.getpid())
+
+        with self._transaction() as connection:
+            row = connection.execute("SELECT {0} FROM jobs WHERE status = ? ORDER BY attempts, id LIMIT 1".format(
+                ", ".join(COLUMNS)), (PENDING,)).fetchone()
+
+            if row is None:
+                return None
+
+            job = self._job(row)
+
+            job.status = RUNNING
+            job.attempts += 1
+            job.worker = worker
+            job.started = time.time()
+
+            connection.execute("UPDATE jobs SET status = ?, attempts = ?, worker = ?, started = ?, finished = NULL "
+                               "WHERE id = ?", (job.status, job.attempts, job.worker, job.started, job.id))
+
+        return job
+
+    def complete(self, job, duration=None):
+        """ Mark a job as done.
+
+        Args:
+            job (ExportJob): The claimed job.
+            duration (float): The time in seconds the export took, defaults to the time since it was claimed.
+        """
+        self._finish(job, DONE, "", duration)
+
+    def fail(self, job, error="", duration=None):
+        """ Mark a job as failed, it is queued again while it has attempts left.
+
+        Args:
+            job (ExportJob): The claimed job.
+            error (str): Why the export failed.
+            duration (float): The time in seconds the export took, defaults to the time since it was claimed.
+        """
+        self._finish(job, PENDING if job.attempts < self.max_attempts else FAILED, error, duration)
+
+    def release(self, job):
+        """ Put a claimed job back in the queue without counting the attempt, ie. when the batch is stopped.
+
+        Args:
+            job (ExportJob): The claimed job.
+        """
+        job.status = PENDING
+        job.attempts = max(0, job.attempts - 1)
+
+        with self._transaction() as connection:
+            connection.execute("UPDATE jobs SET status = ?, attempts = ? WHERE id = ?",
+                               (job.status, job.attempts, job.id))
+
+    def _finish(self, job, status, error, duration):
+        """ Store the outcome of a job.
+
+        Args:
+            job (ExportJob): The claimed job.
+            status (str): The new status.
+            error (str): The error message.
+            duration (float): The time in seconds the export took, None uses the time since it was claimed.
+        """
+        job.finished = time.time()
+        job.duration = duration if duration is not None else job.finished - (job.started or job.finished)
+        job.status = status
+        job.error = error
+
+        with self._transaction() as connection:
+            connection.execute("UPDATE jobs SET status = ?, error = ?, finished = ?, duration = ? WHERE id = ?",
+                               (job.status, job.error, job.finished, job.duration, job.id))
+
+    def recover(self, stale_after=None, dead_workers=False):
+        """ Queue the jobs that were left running by a session that crashed or was stopped.
+
+        Args:
+            stale_after (float): Only recover the jobs that were started more than this many seconds ago, use it
+                when other sessions may still be exporting from the queue. By default every running job is recovered.
+            dead_workers (bool): Recover the jobs of the sessions on this machine as soon as their process is gone
+                and never while it is still running, the jobs claimed with another worker name are only recovered
+                once they are older than stale_after.
+
+        returns:
+            int: The number of recovered jobs, the jobs without attempts left are failed instead.
+        """
+        now = time.time()
+        error = "The export was interrupted."
+        host = socket.gethostname()
+
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT id, worker, attempts, started FROM jobs WHERE status = ?",
+                                      (RUNNING,)).fetchall()
+            recovered = []
+
+            for job_id, worker, attempts, started in rows:
+                worker_host, _, pid = (worker or "").rpartition(":")
+
+                if dead_workers and worker_host == host and pid.isdigit():
+                    lost = not _process_running(int(pid))
+                elif dead_workers and stale_after is None:
+                    lost = False
+                else:
+                    lost = (started or 0.0) <= now - (stale_after or 0.0)
+
+                if lost:
+                    recovered.append((FAILED if attempts >= self.max_attempts else PENDING, error, job_id))
+
+            connection.executemany("UPDATE jobs SET status = ?, error = ? WHERE id = ?", recovered)
+
+        return len(recovered)
+
+    def retry(self, sources=None):
+        """ Queue failed jobs again with all of their attempts.
+
+        Args:
+            sources (list<str>): The Maya files to retry, by default every failed job is retried.
+
+        returns:
+            int: The number of jobs queued again.
+        """
+        with self._transaction() as connection:
+            if sources is None:
+                return connection.execute("UPDATE jobs SET status = ?, attempts = 0 WHERE status = ?",
+                                          (PENDING, FAILED)).rowcount
+
+            return connection.executemany("UPDATE jobs SET status = ?, attempts = 0 WHERE key = ? AND status = ?",
+                                          [(PENDING, ExportManifest.get_key(source), FAILED)
+                                           for source in sources]).rowcount
+
+    def clear(self, status=None):
+        """ Remove jobs from the queue.
+
+        Args:
+            status (str): Only remove the jobs with this status, ie. DONE.
+        """
+        with self._transaction() as connection:
+            if status is None:
+                connection.execute("DELETE FROM jobs")
+            else:
+                connection.execute("DELETE FROM jobs WHERE status = ?", (status,))
+
+    def get(self, source):
+        """ Get the job of a Maya file.
+
+        Args:
+            source (str): The Maya file.
+
+        returns:
+            ExportJob: None when the file is not queued.
+        """
+        row = self._connection.execute("SELECT {0} FROM jobs WHERE key = ?".format(", ".join(COLUMNS)),
+                                       (ExportManifest.get_key(source),)).fetchone()
+
+        return self._job(row) if row is not None else None
+
+    def jobs(self, status=None):
+        """ Get the jobs in the order they were added.
+
+        Args:
+            status (str): Only get the jobs with this status.
+
+        returns:
+            list<ExportJob>
+        """
+        query = "SELECT {0} FROM jobs".format(", ".join(COLUMNS))
+
+        if status is None:
+            rows = self._connection.execute(query + " ORDER BY id")
+        else:
+            rows = self._connection.execute(query + " WHERE status = ? ORDER BY id", (status,))
+
+        return [self._job(row) for row in rows]
+
+    def counts(self):
+        """ Get the number of jobs with every status.
+
+        returns:
+            dict
+        """
+        counts = dict((status, 0) for status in STATUSES)
+        counts.update(self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+
+        return counts
+
+    def progress(self):
+        """ Get the percentage of the jobs that are done or failed.
+
+        returns:
+            float
+        """
+        counts = self.counts()
+        total = sum(counts.values())
+
+        return float(counts[DONE] + counts[FAILED]) / total * 100 if total else 100.0
@@ -5,10 +5,24 @@ __all__ = ["Exporter"]
 
 # standard library imports
 import os
+import re
 import sys
+import traceback
+from collections import OrderedDict
+from timeit import default_timer
+from contextlib import contextmanager
 
-# Maya specific imports
-import pymel.core as pm
+# internal imports
+from lazy_module import lazy_import
+from parallel_export import ParallelExporter, MayaExportWorker, ExportResult
+from export_queue import ExportJobQueue
+from export_metrics import PhaseTimer
+from export_manifest import ExportManifest
+from file_discovery import iter_files, FileDiscovery
+from export_options import ExportOptions, FbxOptionState
+
+# Maya specific imports, PyMEL is only imported once the exporter talks to Maya
+pm = lazy_import("pymel.core")
 
 
 class Exporter(object):
@@ -20,14 +34,7 @@ class Exporter(object):
             use_triangles (bool): Triangulate meshes?
         """
 
-        mel_cmd = "FBXExportTriangulate -v "
-
-        if use_triangles:
-            mel_cmd += "true;"
-        else:
-            mel_cmd += "false;"
-
-        pm.mel.eval(mel_cmd)
+        FbxOptionState.apply({"triangulate": bool(use_triangles)}, pm.mel.eval)
 
     @staticmethod
     def bake_animation(bake_keys=True, start=0, end=0):
@@ -39,21 +46,11 @@ class Exporter(object):
             end (int): The end frame for the bake.
         """
 
-        mel_cmd = "FBXExportBakeComplexAnimation -v "
-
-        if bake_keys:
-            mel_cmd += "true;"
-        else:
-            mel_cmd += "false;"
-
-        pm.mel.eval(mel_cmd)
+        options = ExportOptions(bake_animation=bool(bake_keys), bake_start=start, bake_end=end).get_fbx_options()
 
         # set the start and end keyframe to bake if necessary.
-        if start != 0 and bake_keys:
-            pm.mel.eval("FBXExportBakeComplexStart -v {0};".format(start))
-
-        if end != 0 and bake_keys:
-            pm.mel.eval("FBXExportBakeComplexEnd -v {0};".format(end))
+        FbxOptionState.apply(OrderedDict((key, value) for key, value in options.items() if key.startswith("bake")),
+                             pm.mel.eval)
 
     @staticmethod
     def apply_key_reducer(use_reducer=True):
@@ -63,14 +60,7 @@ class Exporter(object):
             use_reducer (bool): True or False whether to use the constant key reducer.
         """
 
-        mel_cmd = "FBXExportApplyConstantKeyReducer -v "
-
-        if use_reducer:
-            mel_cmd += "true;"
-        else:
-            mel_cmd += "false;"
-
-        pm.mel.eval(mel_cmd)
+        FbxOptionState.apply({"key_reducer": bool(use_reducer)}, pm.mel.eval)
 
     @staticmethod
     def set_export_animation_only(animation_only=True):
@@ -80,56 +70,183 @@ class Exporter(object):
             animation_only (bool): True or False whether to export animation only for this FBX.
         """
 
-        mel_cmd = "FBXExportAnimationOnly -v "
+        FbxOptionState.apply({"animation_only": bool(animation_only)}, pm.mel.eval)
 
-        if animation_only:
-            mel_cmd += "true;"
-        else:
-            mel_cmd += "false;"
+    @staticmethod
+    def get_fbx_options():
+        """ Get the FBX export options that are currently set.
 
-        pm.mel.eval(mel_cmd)
+        returns:
+            dict
+        """
+        return {
+            "triangulate": bool(pm.mel.eval("FBXExportTriangulate -q;")),
+            "bake_animation": bool(pm.mel.eval("FBXExportBakeComplexAnimation -q;")),
+            "bake_start": pm.mel.eval("FBXExportBakeComplexStart -q;"),
+            "bake_end": pm.mel.eval("FBXExportBakeComplexEnd -q;"),
+            "key_reducer": bool(pm.mel.eval("FBXExportApplyConstantKeyReducer -q;")),
+            "animation_only": bool(pm.mel.eval("FBXExportAnimationOnly -q;")),
+            "ascii": bool(pm.mel.eval("FBXExportInAscii -q;")),
+        }
 
     @staticmethod
-    def export_fbx(output_path, selected=True, ascii=True):
+    def export_fbx(output_path, selected=True, ascii=True, timer=None):
         """ Export the FBX to the set path.
 
         Args:
             output_path (str): The path to export the FBX to.
             selected (bool): Export selected only?
             ascii (bool): Export the file as an ascii?
+            timer (PhaseTimer): Times the "configure" and "export" phases.
         """
+        timer = timer or PhaseTimer()
+
+        with timer.phase("configure"):
+            # check that the file is a valid FBX file path.
+            if not output_path.endswith(".fbx"):
+                raise IOError("Path {0} is not an FBX file.".format(output_path))
+
+            dir_name = os.path.dirname(output_path)
+
+            # make any necessary directories to avoid IO errors later.
+            if not os.path.exists(dir_name):
+                os.makedirs(dir_name)
 
-        # check that the file is a valid FBX file path.
-        if not output_path.endswith(".fbx"):
-            raise IOError("Path {0} is not an FBX file.".format(output_path))
+            FbxOptionState.apply({"ascii": bool(ascii)}, pm.mel.eval)
 
-        dir_name = os.path.dirname(output_path)
+            output_path = output_path.replace("\\", "/")
 
-        # make any necessary directories to avoid IO errors later.
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
+            mel_export_cmd = 'FBXExport -f "{0}";'.format(output_path)
 
-        if ascii:
-            pm.mel.eval("FBXExportInAscii -v true;")
+            # if export selected is chosen add the selected flag.
+            if selected and pm.ls(sl=True):
+                mel_export_cmd += " -s;"
+            else:
+                mel_export_cmd += ";"
 
-        output_path = output_path.replace("\\", "/")
+        with timer.phase("export"):
+            pm.mel.eval(mel_export_cmd)
 
-        mel_export_cmd = 'FBXExport -f "{0}";'.format(output_path)
+    @staticmethod
+    @contextmanager
+    def reuse_scene(m_file, scene_mode="reference"):
+        """ Reference or import a Maya file into the current scene under its own namespace, and remove it again
+        when done.
+
+        Args:
+            m_file (str): The path to the Maya file.
+            scene_mode (str): "reference" or "import".
+
+        yields:
+            list<PyNode>: The top level transforms of the file.
+        """
+        base_namespace = "export_" + re.sub(r"\W", "_", os.path.splitext(os.path.basename(m_file))[0])
+        namespace = base_namespace
+        count = 1
 
-        # if export selected is chosen add the selected flag.
-        if selected and pm.ls(sl=True):
-            mel_export_cmd += " -s;"
+        while pm.namespace(exists=namespace):
+            namespace = "{0}{1}".format(base_namespace, count)
+            count += 1
+
+        reference = None
+
+        if scene_mode == "reference":
+            reference = pm.createReference(m_file, namespace=namespace)
+            nodes = reference.nodes()
         else:
-            mel_export_cmd += ";"
+            nodes = pm.importFile(m_file, namespace=namespace, returnNewNodes=True)
+
+        try:
+            yield [node for node in pm.ls(nodes, type="transform") if node.getParent() is None]
+        finally:
+            if reference is not None:
+                reference.remove()
+
+            if pm.namespace(exists=namespace):
+                pm.namespace(removeNamespace=namespace, deleteNamespaceContent=True)
+
+    @classmethod
+    def export_scene(cls, m_file, output_path, options=None, timer=None):
+        """ Bring a Maya file into the scene and export it as an FBX file.
+
+        Referenced and imported files share one scene, and only the nodes of the file are exported. Files that
+        fail to load that way are opened in a new scene instead.
+
+        Args:
+            m_file (str): The path to the Maya file.
+            output_path (str): The path to export the FBX to.
+            options (ExportOptions): The options to export with, the current FBX options are used if not set.
+            timer (PhaseTimer): Times the "open", "configure" and "export" phases, loading and removing the file
+                both count as opening it.
+
+        returns:
+            str: The scene mode the file was exported with.
+        """
+        options = options or ExportOptions()
+        timer = timer or PhaseTimer()
 
-        pm.mel.eval(mel_export_cmd)
+        scene_mode = options.get_scene_mode(m_file)
+
+        if scene_mode != "open":
+            loaded = False
+
+            try:
+                with timer.phase("open"), cls.reuse_scene(m_file, scene_mode) as nodes:
+                    if not nodes:
+                        raise RuntimeError("{0} has no nodes to export.".format(m_file))
+
+                    loaded = True
+
+                    with timer.phase("configure"):
+                        pm.select(nodes, replace=True)
+
+                    cls.export_fbx(output_path, selected=True, ascii=options.ascii, timer=timer)
+
+                return scene_mode
+            except RuntimeError:
+                # only a file that fails to load falls back to being opened, ie. a file that relies on its own scene
+                # settings, a failed FBXExport is a MelError too and is not retried
+                if loaded:
+                    raise
+
+        with timer.phase("open"):
+            pm.newFile(f=True)
+
+            pm.openFile(m_file, f=True)
+
+        cls.export_fbx(output_path, selected=options.selected, ascii=options.ascii, timer=timer)
+
+        if options.scene_mode != "open":
+            with timer.phase("open"):
+                # leave an empty scene for the next file to be loaded into
+                pm.newFile(f=True)
+
+        return "open"
 
     @staticmethod
-    def get_maya_files(folder):
+    def iter_maya_files(folder, recursive=False, include=None, exclude=None):
+        """ Find the Maya files in a folder, yielding them as they are found.
+
+        Args:
+            folder (str): The folder to search for Maya files.
+            recursive (bool): Search the sub folders?
+            include (list<str>): Glob patterns a file has to match, ie. ["characters/*"].
+            exclude (list<str>): Glob patterns of files and folders to skip, ie. ["*_backup*"].
+
+        yields:
+            str
+        """
+        return iter_files(folder, (".ma", ".mb"), recursive, include, exclude)
+
+    @classmethod
+    def get_maya_files(cls, folder, recursive=False, include=None, exclude=None):
         """ Get the list of Maya files in a particular folder.
 
         Args:
             folder (str): The folder to search for Maya files.
+            recursive (bool): Search the sub folders?
+            include (list<str>): Glob patterns a file has to match.
+            exclude (list<str>): Glob patterns of files and folders to skip.
 
         returns:
             list<string>
@@ -138,52 +255,323 @@ class Exporter(object):
         if not os.path.isdir(folder):
             raise IOError("{0} is not a folder".format(folder))
 
-        maya_files = [os.path.join(folder, mfile) for mfile in os.listdir(folder) if
-                      mfile.endswith(".ma") or mfile.endswith(".mb")]
+        return list(cls.iter_maya_files(folder, recursive, include, exclude))
 
-        return maya_files
+    @staticmethod
+    def get_output_path(maya_file, output_folder, input_folder=None):
+        """ Get the FBX path a Maya file is exported to.
+
+        Args:
+            maya_file (str): The Maya file to export.
+            output_folder (str): The folder to save the FBX files to.
+            input_folder (str): The folder the Maya files were found in, its sub folders are kept in the output.
+
+        returns:
+            str
+        """
+        file_name = os.path.splitext(os.path.basename(maya_file))[0]
+
+        if input_folder:
+            sub_folder = os.path.relpath(os.path.dirname(maya_file), input_folder)
+
+            if sub_folder != os.curdir:
+                output_folder = os.path.join(output_folder, sub_folder)
+
+        return os.path.join(output_folder, file_name + ".fbx")
 
     @classmethod
-    def batch_export_fbx(cls, input_folder, output_folder):
+    def resolve_options(cls, options=None, workers=1, worker=None):
+        """ Get the options a batch is exported with.
+
+        Args:
+            options (ExportOptions): The options passed to the batch.
+            workers (int): The number of headless Maya processes the batch is exported with.
+            worker (ExportWorker): The worker the processes export with.
+
+        returns:
+            ExportOptions: The options, when not set these are the current FBX options for a batch exported in this
+                session and the default options for a batch exported by worker processes.
+        """
+        if options is not None:
+            return options
+
+        if workers > 1 or worker is not None:
+            return ExportOptions()
+
+        return ExportOptions.from_dict(cls.get_fbx_options())
+
+    @classmethod
+    def _export_jobs(cls, jobs, workers=1, worker=None, options=None, on_start=None):
+        """ Export a list of files, in this session or across worker processes.
+
+        Args:
+            jobs (list<tuple>): The (source, output) path of every file to export.
+            workers (int): The number of headless Maya processes to export with, 1 exports in this session unless
+                a worker is given.
+            worker (ExportWorker): The worker the processes export with, defaults to a MayaExportWorker when
+                exporting with more than one process.
+            options (ExportOptions): The FBX options to export with, the current options are used if not set.
+            on_start (function): Called with the source and output of every file when its export starts.
+
+        yields:
+            ExportResult: The outcome of every file.
+        """
+        if workers > 1 or worker is not None:
+            if worker is None:
+                worker = MayaExportWorker(options)
+
+            for result in ParallelExporter(workers, worker).run(jobs, on_start):
+                yield result
+
+            return
+
+        if options is not None and options.scene_mode != "open":
+            # the files are referenced or imported into this scene
+            pm.newFile(f=True)
+
+        for m_file, output_path in jobs:
+            timer = PhaseTimer()
+            start = default_timer()
+
+            if on_start is not None:
+                on_start(m_file, output_path)
+
+            try:
+                cls.export_scene(m_file, output_path, options, timer)
+            except Exception as error:
+                # a file that breaks the export fails on its own, like it does in a worker process
+                yield ExportResult(m_file, output_path, success=False, error=str(error) or traceback.format_exc(),
+                                   duration=default_timer() - start, phases=timer.phases)
+                continue
+
+            yield ExportResult(m_file, output_path, duration=default_timer() - start, phases=timer.phases)
+
+    @classmethod
+    def batch_export_fbx(cls, input_folder, output_folder, workers=1, worker=None, incremental=False, prune=False,
+                         recursive=False, include=None, exclude=None, options=None, on_file=None,
+                         instrumentation=None):
         """ Batch export a folder of Maya files as FBX files.
 
+        The files are exported while the folder is still being searched, so the progress is measured against
+        the number of files found so far.
+
         Args;
             input_folder (str): The folder where the Maya files are located.
             output_folder (str): The folder to save the FBX files to.
+            workers (int): The number of headless Maya processes to export with, 1 exports in this session unless
+                a worker is given.
+            worker (ExportWorker): The worker the processes export with, defaults to a MayaExportWorker when
+                exporting with more than one process.
+            incremental (bool): Skip the files that have not changed since they were last exported.
+            prune (bool): Delete the FBX files of Maya files that no longer exist, when exporting incrementally.
+            recursive (bool): Export the Maya files in the sub folders as well, keeping the folder layout.
+            include (list<str>): Glob patterns a Maya file has to match to be exported.
+            exclude (list<str>): Glob patterns of Maya files and folders to skip.
+            options (ExportOptions): The FBX options to export with, see resolve_options when not set.
+            on_file (function): Called with the source, output and whether the export worked after every file.
+            instrumentation (ExportInstrumentation): Records the time of every phase, the output size and the error
+                of every exported file.
         """
 
         if output_folder == "":
             return
 
+        if not os.path.isdir(input_folder):
+            raise IOError("{0} is not a folder".format(input_folder))
+
         if not os.path.isdir(output_folder):
             os.makedirs(output_folder)
 
-        maya_files = cls.get_maya_files(input_folder)
+        discovery = FileDiscovery(cls.iter_maya_files(input_folder, recursive, include, exclude))
 
-        if not maya_files:
-            return
+        # the manifest records the same options the files are exported with
+        options = cls.resolve_options(options, workers, worker)
 
-        for i, m_file in enumerate(maya_files):
-            pm.newFile(f=True)
+        manifest = None
+        manifest_options = None
 
-            pm.openFile(m_file)
+        if workers <= 1 and worker is None:
+            # set every option once, the files only set the options they changed after that
+            options.apply(pm.mel.eval, force=True)
 
-            file_name = os.path.basename(m_file)
+        if incremental:
+            manifest = ExportManifest(output_folder)
+            manifest_options = options.as_dict()
 
-            file_ext = m_file[m_file.index("."):]
+        skipped = [0]
+        discovered = dict()
+        source_states = dict()
 
-            output_path = r"{0}\{1}".format(output_folder, file_name.replace(file_ext, ".fbx"))
+        def get_jobs():
+            start = default_timer()
 
-            try:
-                cls.export_fbx(output_path)
-            except IOError:
-                continue
+            for m_file in discovery:
+                output_path = cls.get_output_path(m_file, output_folder, input_folder)
+
+                if manifest is not None and not manifest.is_dirty(m_file, output_path, manifest_options):
+                    skipped[0] += 1
+                    continue
+
+                if manifest is not None:
+                    # the source is recorded as it was before the export, so changes saved during it are not lost
+                    source_states[m_file] = manifest.get_file_state(m_file)
+
+                # the time spent finding and checking the skipped files counts for the next exported file
+                discovered[m_file] = default_timer() - start
+
+                yield m_file, output_path
+
+                start = default_timer()
+
+        progress = 0.0
+
+        try:
+            for i, result in enumerate(cls._export_jobs(get_jobs(), workers, worker, options)):
+                timer = PhaseTimer(result.phases)
+                timer.add("discover", discovered.pop(result.source, 0.0))
+
+                with timer.phase("write"):
+                    state = source_states.pop(result.source, None)
+
+                    if manifest is not None and result.success:
+                        manifest.record(result.source, result.output, manifest_options, state)
 
-            yield float(i + 1) / len(maya_files) * 100
+                if instrumentation is not None:
+                    instrumentation.record(result, timer)
+
+                if on_file is not None:
+                    on_file(result.source, result.output, result.success)
+
+                progress = float(skipped[0] + i + 1) / max(discovery.count, 1) * 100
+
+                yield progress
+
+            if manifest is not None and prune:
+                manifest.prune()
+        finally:
+            # stop searching when the batch is stopped early
+            discovery.stop()
+
+            if manifest is not None:
+                manifest.save()
+
+        # the files found after the last export were all skipped
+        if discovery.count and progress < 100:
+            yield 100.0
+
+    @classmethod
+    def queue_batch(cls, queue, input_folder, output_folder, recursive=False, include=None, exclude=None,
+                    reset=False):
+        """ Add the Maya files of a folder to an export queue, export them with export_queue.
+
+        Args:
+            queue (ExportJobQueue): The queue to add the files to.
+            input_folder (str): The folder where the Maya files are located.
+            output_folder (str): The folder to save the FBX files to.
+            recursive (bool): Queue the Maya files in the sub folders as well, keeping the folder layout.
+            include (list<str>): Glob patterns a Maya file has to match to be queued.
+            exclude (list<str>): Glob patterns of Maya files and folders to skip.
+            reset (bool): Queue the files that were already exported or failed again.
+
+        returns:
+            int: The number of files that were added to the queue.
+        """
+        if not os.path.isdir(input_folder):
+            raise IOError("{0} is not a folder".format(input_folder))
+
+        return queue.add(((m_file, cls.get_output_path(m_file, output_folder, input_folder))
+                          for m_file in cls.iter_maya_files(input_folder, recursive, include, exclude)), reset)
+
+    @classmethod
+    def export_queue(cls, queue, workers=1, worker=None, options=None, on_file=None, worker_name=None,
+                     instrumentation=None):
+        """ Export the pending jobs of an export queue until none are left.
+
+        Every job is claimed right before it is exported and its outcome is stored in the queue as soon as it
+        finishes, so a batch that crashed can be resumed with ExportJobQueue.recover, and several sessions can
+        export from the same queue.
+
+        Args:
+            queue (ExportJobQueue): The queue to export from.
+            workers (int): The number of headless Maya processes to export with, 1 exports in this session unless
+                a worker is given.
+            worker (ExportWorker): The worker the processes export with, defaults to a MayaExportWorker when
+                exporting with more than one process.
+            options (ExportOptions): The FBX options to export with, see resolve_options when not set.
+            on_file (function): Called with the source, output and whether the export worked after every file.
+            worker_name (str): The name the jobs are claimed with, defaults to the host and process id.
+            instrumentation (ExportInstrumentation): Records the time of every phase, the output size and the error
+                of every exported file, claiming a job counts as discovering it.
+
+        yields:
+            float: The percentage of the jobs in the queue that are done or failed.
+        """
+        options = cls.resolve_options(options, workers, worker)
+
+        if workers <= 1 and worker is None:
+            # set every option once, the files only set the options they changed after that
+            options.apply(pm.mel.eval, force=True)
+
+        claimed = dict()
+        started = set()
+
+        def get_jobs():
+            start = default_timer()
+            job = queue.claim(worker_name)
+
+            while job is not None:
+                claimed[job.source] = (job, default_timer() - start)
+                yield job.source, job.output
+
+                start = default_timer()
+                job = queue.claim(worker_name)
+
+        try:
+            for result in cls._export_jobs(get_jobs(), workers, worker, options,
+                                           lambda source, output: started.add(source)):
+                job, claim_time = claimed.pop(result.source)
+                started.discard(result.source)
+
+                timer = PhaseTimer(result.phases)
+                timer.add("discover", claim_time)
+
+                with timer.phase("write"):
+                    if result.success:
+                        queue.complete(job, result.duration)
+                    else:
+                        queue.fail(job, result.error, result.duration)
+
+                if instrumentation is not None:
+                    instrumentation.record(result, timer)
+
+                if on_file is not None:
+                    on_file(result.source, result.output, result.success)
+
+                yield queue.progress()
+        finally:
+            # when the iteration is stopped early the exports that were started count as an attempt, so a file that
+            # keeps stopping the batch ends up failed, the jobs that were only claimed are queued again as they were
+            for source, (job, _) in claimed.items():
+                if source in started:
+                    queue.fail(job, "The export was stopped before it finished.")
+                else:
+                    queue.release(job)
 
 
 if __name__ == '__main__':
-    if len(sys.argv) == 3:
+    if len(sys.argv) in (3, 4):
         input_path = sys.argv[1]
         fbx_path = sys.argv[2]
-        Exporter.batch_export_fbx(input_path, input_path)
+
+        if len(sys.argv) == 3:
+            for _ in Exporter.batch_export_fbx(input_path, fbx_path):
+                pass
+        else:
+            # a queue file makes the batch resumable, run the same command again to finish an interrupted batch
+            with ExportJobQueue(sys.argv[3]) as export_queue:
+                # other sessions can be exporting from the same queue, only their lost jobs are taken over
+                export_queue.recover(stale_after=24 * 60 * 60, dead_workers=True)
+                Exporter.queue_batch(export_queue, input_path, fbx_path)
+
+                for _ in Exporter.export_queue(export_queue):
+                    pass
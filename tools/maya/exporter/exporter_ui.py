@@ -1,41 +1,176 @@
 __author__ = "Michael Graessle"
 __copyright__ = "Copyright 2017"
 
-__all__ = ["ExporterUI"]
+__all__ = ["ExporterUI", "ExportThread"]
 
 # standard library imports
 import sys
 import json
 import os
+import threading
+import traceback
 
 # PySide imports
-from PySide2 import QtWidgets
-import shiboken2
-
-# Maya imports
-import maya.OpenMayaUI as mui
+from PySide2 import QtWidgets, QtCore
 
 # internal imports
 from exporter import *
+from export_options import ExportOptions
+from export_progress import ExportProgress
+from parallel_export import MayaExportWorker
 
 
 def get_maya_window():
     """ Get the main Maya window as a Qt instance.
     """
+    # only needed inside of Maya, so the UI can also run standalone
+    import shiboken2
+    import maya.OpenMayaUI as mui
+
     ptr = mui.MQtUtil.mainWindow()
     return shiboken2.wrapInstance(long(ptr), QtWidgets.QDialog)
 
 
 class ExporterSettings(object):
-    def __init__(self, out_path='', in_path=''):
+    def __init__(self, out_path='', in_path='', workers=1):
         """ constructor
 
         Args:
             out_path (str): The output path setting.
             in_path (str): The input path settings.
+            workers (int): The number of headless Maya processes to export with.
         """
         self.output_path = out_path
         self.input_path = in_path
+        self.workers = workers
+
+
+class ExportThread(QtCore.QThread):
+    """ Runs a batch export off the main thread so the UI stays responsive.
+
+    Maya scenes can only be used from the main thread.  With more than one worker the files are exported by
+    headless mayapy processes and this thread only hands out the files and reports back, with one worker every
+    file is exported in this session on the main thread.
+    """
+
+    progress = QtCore.Signal(float)
+
+    # the source, output and whether the export worked
+    file_status = QtCore.Signal(str, str, bool)
+
+    # the files per minute and the estimated seconds left, -1 when unknown
+    throughput = QtCore.Signal(float, float)
+
+    error = QtCore.Signal(str)
+
+    def __init__(self, input_folder, output_folder, workers=1, options=None, parent=None):
+        """ Constructor.
+
+        Args:
+            input_folder (str): The folder where the Maya files are located.
+            output_folder (str): The folder to save the FBX files to.
+            workers (int): The number of headless Maya processes to export with, 1 exports in this session.
+            options (ExportOptions): The FBX options to export with.
+            parent (QObject): The parent of the thread.
+        """
+        super(ExportThread, self).__init__(parent)
+
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.workers = workers
+        self.options = options or ExportOptions()
+
+        self.export_progress = ExportProgress()
+
+        self._cancelled = False
+
+        self._running = threading.Event()
+        self._running.set()
+
+    def cancel(self):
+        """ Stop the batch after the files that are being exported.
+        """
+        self._cancelled = True
+        self._running.set()
+
+    def pause(self):
+        """ Stop handing out files until the batch is resumed.
+        """
+        self.export_progress.pause()
+        self._running.clear()
+
+    def resume(self):
+        """ Continue a paused batch.
+        """
+        self.export_progress.resume()
+        self._running.set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def on_file(self, m_file, output_path, success):
+        """ Report a finished file.
+
+        Args:
+            m_file (str): The Maya file that was exported.
+            output_path (str): The FBX file that was written.
+            success (bool): Did the export work?
+        """
+        self.export_progress.record(success)
+
+        self.file_status.emit(m_file, output_path, success)
+
+    def next_progress(self, batch):
+        """ Export the next file of the batch.
+
+        Args:
+            batch (generator): The batch export.
+
+        returns:
+            float or None: The progress, None when the batch is done.
+        """
+        if self.workers > 1:
+            return next(batch, None)
+
+        # the file is exported in this session, which has to happen on the main thread
+        import maya.utils
+
+        return maya.utils.executeInMainThreadWithResult(next, batch, None)
+
+    def run(self):
+        """ Run the batch export.
+        """
+        self.export_progress.start()
+
+        worker = MayaExportWorker(self.options) if self.workers > 1 else None
+
+        batch = Exporter.batch_export_fbx(self.input_folder, self.output_folder, self.workers, worker,
+                                          options=self.options, on_file=self.on_file)
+
+        try:
+            for progress in iter(lambda: self.next_progress(batch), None):
+                self.export_progress.update(progress)
+
+                eta = self.export_progress.eta
+
+                self.progress.emit(progress)
+                self.throughput.emit(self.export_progress.files_per_minute, eta if eta is not None else -1.0)
+
+                # pause and cancel between files
+                self._running.wait()
+
+                if self._cancelled:
+                    break
+        except Exception:
+            self.error.emit(traceback.format_exc())
+        finally:
+            # stops the export processes and saves the manifest
+            batch.close()
 
 
 class ExporterUI(QtWidgets.QDialog):
@@ -45,7 +180,7 @@ class ExporterUI(QtWidgets.QDialog):
         super(ExporterUI, self).__init__(parent=parent)
 
         self.setWindowTitle("Fbx Exporter")
-        self.setFixedSize(400, 200)
+        self.setFixedSize(400, 270)
 
         self.main_layout = QtWidgets.QVBoxLayout()
 
@@ -53,8 +188,24 @@ class ExporterUI(QtWidgets.QDialog):
 
         self.output_path = None
 
+        self.workers = None
+
+        self.ok_button = None
+
+        self.pause_button = None
+
+        self.cancel_button = None
+
+        self.export_thread = None
+
+        self.close_requested = False
+
         self.progress_bar = QtWidgets.QProgressBar()
 
+        self.status_label = QtWidgets.QLabel()
+
+        self.last_file_status = ""
+
         self.setup_ui()
 
         self.settings_path = os.path.dirname(__file__) + r"\settings\exporter_settings.json"
@@ -68,6 +219,8 @@ class ExporterUI(QtWidgets.QDialog):
 
         self.setup_output_layout()
 
+        self.setup_workers_layout()
+
         self.setup_buttons()
 
         self.progress_bar.setValue(0)
@@ -75,6 +228,10 @@ class ExporterUI(QtWidgets.QDialog):
 
         self.main_layout.addWidget(self.progress_bar)
 
+        self.status_label.setVisible(False)
+
+        self.main_layout.addWidget(self.status_label)
+
         self.setLayout(self.main_layout)
 
     def save_settings(self):
@@ -85,7 +242,7 @@ class ExporterUI(QtWidgets.QDialog):
         if not os.path.exists(settings_dir):
             os.makedirs(settings_dir)
 
-        settings_data = ExporterSettings(self.output_path.text(), self.input_path.text())
+        settings_data = ExporterSettings(self.output_path.text(), self.input_path.text(), self.workers.value())
 
         with open(self.settings_path, 'w') as settings:
             json.dump(settings_data.__dict__, settings, sort_keys=True, indent=4)
@@ -102,12 +259,15 @@ class ExporterUI(QtWidgets.QDialog):
 
             exporter_settings = ExporterSettings()
 
-            exporter_settings.__dict__ = settings_data
+            # update instead of replacing so settings saved by older versions keep the defaults
+            exporter_settings.__dict__.update(settings_data)
 
             self.output_path.setText(exporter_settings.output_path)
 
             self.input_path.setText(exporter_settings.input_path)
 
+            self.workers.setValue(exporter_settings.workers)
+
             settings.close()
 
     def setup_input_layout(self):
@@ -152,26 +312,54 @@ class ExporterUI(QtWidgets.QDialog):
 
         self.main_layout.addLayout(output_layout)
 
+    def setup_workers_layout(self):
+        """ Setup the layout for the number of export processes.
+        """
+        workers_layout = QtWidgets.QHBoxLayout()
+
+        workers_label = QtWidgets.QLabel("Export Processes:")
+
+        workers_layout.addWidget(workers_label)
+
+        self.workers = QtWidgets.QSpinBox()
+        self.workers.setRange(1, 32)
+        self.workers.setToolTip("The number of headless mayapy processes that export the files, 1 exports them in this "
+                                "Maya session.")
+
+        workers_layout.addWidget(self.workers)
+
+        self.main_layout.addLayout(workers_layout)
+
     def setup_buttons(self):
         """ Setup the buttons for running the export process and canceling the process.
         """
         button_layout = QtWidgets.QHBoxLayout()
 
-        ok_button = QtWidgets.QCommandLinkButton("OK")
+        self.ok_button = QtWidgets.QCommandLinkButton("OK")
+
+        self.ok_button.setFixedHeight(50)
 
-        ok_button.setFixedHeight(50)
+        self.ok_button.clicked.connect(self.on_export)
 
-        ok_button.clicked.connect(self.on_export)
+        button_layout.addWidget(self.ok_button)
 
-        button_layout.addWidget(ok_button)
+        self.pause_button = QtWidgets.QCommandLinkButton("Pause")
 
-        cancel_button = QtWidgets.QCommandLinkButton("Cancel")
+        self.pause_button.setFixedHeight(50)
 
-        cancel_button.setFixedHeight(50)
+        self.pause_button.setEnabled(False)
 
-        cancel_button.clicked.connect(self.close)
+        self.pause_button.clicked.connect(self.on_pause)
 
-        button_layout.addWidget(cancel_button)
+        button_layout.addWidget(self.pause_button)
+
+        self.cancel_button = QtWidgets.QCommandLinkButton("Cancel")
+
+        self.cancel_button.setFixedHeight(50)
+
+        self.cancel_button.clicked.connect(self.on_cancel)
+
+        button_layout.addWidget(self.cancel_button)
 
         self.main_layout.addLayout(button_layout)
 
@@ -186,21 +374,143 @@ class ExporterUI(QtWidgets.QDialog):
         self.input_path.setText(QtWidgets.QFileDialog.getExistingDirectory())
 
     def on_export(self):
-        """ Run the export process.
+        """ Start the export process in the background.
         """
+        if self.export_thread is not None:
+            return
+
         output_directory = self.output_path.text()
 
         input_directory = self.input_path.text()
 
+        # the options are read here because Maya can only be used from the main thread
+        options = ExportOptions.from_dict(Exporter.get_fbx_options())
+
+        self.export_thread = ExportThread(input_directory, output_directory, self.workers.value(), options, self)
+
+        self.export_thread.progress.connect(self.on_progress)
+        self.export_thread.file_status.connect(self.on_file_status)
+        self.export_thread.throughput.connect(self.on_throughput)
+        self.export_thread.error.connect(self.on_error)
+        self.export_thread.finished.connect(self.on_export_finished)
+
+        self.ok_button.setEnabled(False)
+        self.pause_button.setEnabled(True)
+        self.workers.setEnabled(False)
+
         self.progress_bar.setVisible(True)
+        self.last_file_status = ""
+        self.status_label.setText("Searching for Maya files...")
+        self.status_label.setVisible(True)
+
+        self.save_settings()
+
+        self.export_thread.start()
+
+    def on_pause(self):
+        """ Pause or resume the export process.
+        """
+        if self.export_thread is None:
+            return
+
+        if self.export_thread.paused:
+            self.export_thread.resume()
+            self.pause_button.setText("Pause")
+        else:
+            self.export_thread.pause()
+            self.pause_button.setText("Resume")
+
+        self.status_label.setText(str(self.export_thread.export_progress))
+
+    def on_cancel(self):
+        """ Cancel the export process, or close the UI if nothing is being exported.
+        """
+        if self.export_thread is None:
+            self.close()
+            return
+
+        self.export_thread.cancel()
 
-        for progress in Exporter.batch_export_fbx(input_directory, output_directory):
-            self.progress_bar.setValue(progress)
+        self.cancel_button.setEnabled(False)
+        self.pause_button.setEnabled(False)
+        self.status_label.setText("Cancelling after the current files...")
+
+    def on_progress(self, progress):
+        """ Show the progress of the export.
+
+        Args:
+            progress (float): The progress from 0 to 100.
+        """
+        self.progress_bar.setValue(progress)
+
+    def on_file_status(self, m_file, output_path, success):
+        """ Show the file that was exported last.
+
+        Args:
+            m_file (str): The Maya file that was exported.
+            output_path (str): The FBX file that was written.
+            success (bool): Did the export work?
+        """
+        if not success:
+            sys.stderr.write("Failed to export {0}\n".format(m_file))
+
+        self.last_file_status = "{0} {1}".format("Exported" if success else "Failed", os.path.basename(m_file))
+
+    def on_throughput(self, files_per_minute, eta):
+        """ Show the export speed and the time left.
+
+        Args:
+            files_per_minute (float): The number of files exported per minute.
+            eta (float): The estimated seconds left, -1 when unknown.
+        """
+        if self.export_thread is None or self.export_thread.cancelled:
+            return
+
+        self.status_label.setText("{0}\n{1:.1f} files/min, {2} left".format(
+            self.last_file_status, files_per_minute, ExportProgress.format_time(eta if eta >= 0 else None)))
+
+    def on_error(self, message):
+        """ Show why the export process stopped.
+
+        Args:
+            message (str): The error.
+        """
+        sys.stderr.write(message)
+
+        QtWidgets.QMessageBox.warning(self, "Fbx Exporter", message.strip().splitlines()[-1])
+
+    def on_export_finished(self):
+        """ Reset the UI after the export process stopped.
+        """
+        export_progress = self.export_thread.export_progress
+
+        self.export_thread = None
 
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
 
-        self.save_settings()
+        self.status_label.setText("{0} exported, {1} failed".format(export_progress.exported, export_progress.failed))
+
+        self.ok_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.pause_button.setText("Pause")
+        self.cancel_button.setEnabled(True)
+        self.workers.setEnabled(True)
+
+        if self.close_requested:
+            self.close()
+
+    def closeEvent(self, event):
+        """ Stop the export process when the UI is closed, the UI closes once the current files are done.
+        """
+        if self.export_thread is not None:
+            # waiting for the thread here would hang Maya, with one worker the thread waits on the main thread
+            self.close_requested = True
+            self.on_cancel()
+            event.ignore()
+            return
+
+        super(ExporterUI, self).closeEvent(event)
 
 
 def main(standalone=False):
@@ -0,0 +1,175 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["iter_files", "FileDiscovery"]
+
+# standard library imports
+import os
+import sys
+import fnmatch
+import threading
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        # the scandir backport for python 2
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+
+def _list_folder(folder):
+    """ List the entries of a folder.
+
+    Args:
+        folder (str): The folder to list.
+
+    yields:
+        tuple: The name of the entry and whether it is a folder.
+    """
+    if scandir is not None:
+        for entry in scandir(folder):
+            yield entry.name, entry.is_dir()
+
+        return
+
+    for name in os.listdir(folder):
+        yield name, os.path.isdir(os.path.join(folder, name))
+
+
+def _matches(relative_path, patterns):
+    """ Check a path against a list of glob patterns.
+
+    Args:
+        relative_path (str): The path relative to the folder being searched, with forward slashes.
+        patterns (list<str>): The glob patterns, matched against the relative path and the file name.
+
+    returns:
+        bool
+    """
+    file_name = relative_path.rsplit("/", 1)[-1]
+
+    return any(fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(file_name, pattern)
+               for pattern in patterns)
+
+
+def iter_files(folder, extensions, recursive=True, include=None, exclude=None):
+    """ Walk a folder and yield the files with the given extensions as they are found.
+
+    Args:
+        folder (str): The folder to search.
+        extensions (tuple<str>): The file extensions to find, ie. (".ma", ".mb").
+        recursive (bool): Search the sub folders?
+        include (list<str>): Glob patterns a file has to match, ie. ["characters/*"].
+        exclude (list<str>): Glob patterns of files and folders to skip, ie. ["*_backup*", "incrementalSave"].
+
+    yields:
+        str: The path to every file found.
+    """
+    if not os.path.isdir(folder):
+        raise IOError("{0} is not a folder".format(folder))
+
+    folders = [("", folder)]
+
+    while folders:
+        relative_folder, current_folder = folders.pop()
+
+        sub_folders = []
+
+        for name, is_folder in sorted(_list_folder(current_folder)):
+            relative_path = relative_folder + "/" + name if relative_folder else name
+
+            if exclude and _matches(relative_path, exclude):
+                continue
+
+            if is_folder:
+                if recursive:
+                    sub_folders.append((relative_path, os.path.join(current_folder, name)))
+
+                continue
+
+            if not name.endswith(extensions):
+                continue
+
+            if include and not _matches(relative_path, include):
+                continue
+
+            yield os.path.join(current_folder, name)
+
+        # walk the sub folders in alphabetical order
+        folders.extend(reversed(sub_folders))
+
+
+class FileDiscovery(object):
+    """ Runs a file search on a background thread so the files can be used while the search continues.
+
+    The search stops when the files stop being used, ie. when the batch is cancelled, or when stop is called.
+    """
+
+    _done = object()
+
+    def __init__(self, files):
+        """ Constructor.
+
+        Args:
+            files (iterable<str>): The file search to run, ie. iter_files(...).
+        """
+        self.count = 0
+        self.finished = False
+
+        self._error = None
+        self._queue = Queue()
+        self._stopped = threading.Event()
+
+        self._thread = threading.Thread(target=self._run, args=(files,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, files):
+        """ Run the search and queue the files as they are found.
+
+        Args:
+            files (iterable<str>): The file search to run.
+        """
+        try:
+            for file_path in files:
+                if self._stopped.is_set():
+                    break
+
+                self.count += 1
+                self._queue.put(file_path)
+        except Exception:
+            self._error = sys.exc_info()
+        finally:
+            if hasattr(files, "close"):
+                files.close()
+
+            self.finished = True
+            self._queue.put(self._done)
+
+    def stop(self):
+        """ Stop the search after the file it is checking.
+        """
+        self._stopped.set()
+
+    def __iter__(self):
+        try:
+            while True:
+                file_path = self._queue.get()
+
+                if file_path is self._done:
+                    break
+
+                yield file_path
+        finally:
+            # nothing reads the files that are still found
+            self.stop()
+
+        if self._error is not None:
+            raise self._error[1]
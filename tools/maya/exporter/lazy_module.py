@@ -0,0 +1,58 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["LazyModule", "lazy_import"]
+
+# standard library imports
+import sys
+import importlib
+
+
+class LazyModule(object):
+    """ A module that is only imported the first time one of its attributes is used, so tools that never touch
+    Maya do not pay for importing PyMEL.
+    """
+
+    def __init__(self, name):
+        """ Constructor.
+
+        Args:
+            name (str): The full name of the module, ie. "pymel.core".
+        """
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        """ Import the module if it has not been imported yet.
+
+        returns:
+            module
+        """
+        if self._module is None:
+            self.__dict__["_module"] = importlib.import_module(self._name)
+
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+
+    def __repr__(self):
+        return "LazyModule({0}, imported={1})".format(self._name, self._module is not None)
+
+
+def lazy_import(name):
+    """ Get a module that is imported the first time it is used.
+
+    Args:
+        name (str): The full name of the module, ie. "pymel.core".
+
+    returns:
+        LazyModule or module: The module itself when it was already imported.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return LazyModule(name)
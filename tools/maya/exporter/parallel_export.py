@@ -0,0 +1,501 @@
+__author__ = "Michael Graessle"
+__copyright__ = "Copyright 2017"
+
+__all__ = ["ParallelExporter", "ExportResult", "ExportWorker", "MayaExportWorker", "StubExportWorker"]
+
+# standard library imports
+import os
+import sys
+import time
+import threading
+import traceback
+import subprocess
+from timeit import default_timer
+
+try:
+    import cPickle as pickle
+    from Queue import Queue, Empty
+except ImportError:
+    import pickle
+    from queue import Queue, Empty
+
+# internal imports
+from export_metrics import PhaseTimer
+
+
+class ExportResult(object):
+    def __init__(self, source, output, success=True, error='', duration=0.0, worker=-1, phases=None):
+        """ Constructor
+
+        Args:
+            source (str): The Maya file that was exported.
+            output (str): The FBX file that was written.
+            success (bool): Whether the export worked.
+            error (str): The error message when the export failed.
+            duration (float): The time in seconds the export took.
+            worker (int): The worker process that exported the file.
+            phases (dict): The time in seconds of every phase of the export, ie. "open" and "export".
+        """
+        self.source = source
+        self.output = output
+        self.success = success
+        self.error = error
+        self.duration = duration
+        self.worker = worker
+        self.phases = phases or dict()
+
+    def __repr__(self):
+        return "ExportResult({0}, {1})".format(self.source, "ok" if self.success else self.error)
+
+
+class ExportWorker(object):
+    """ Exports files inside of a worker process.
+    """
+
+    def setup(self):
+        """ Called once when the worker process starts.
+        """
+        return
+
+    def export(self, source, output, timer):
+        """ Export a single Maya file.
+
+        Args:
+            source (str): The Maya file to export.
+            output (str): The FBX file to write.
+            timer (PhaseTimer): Times the phases of the export, the phases timed before an error are kept.
+        """
+        raise NotImplementedError
+
+    def teardown(self):
+        """ Called once before the worker process exits.
+        """
+        return
+
+
+class MayaExportWorker(ExportWorker):
+    """ Exports files with the Exporter in a headless mayapy session.
+    """
+
+    def __init__(self, options=None):
+        """ Constructor
+
+        Args:
+            options (ExportOptions): The FBX options to export with, set once when the worker starts.
+        """
+        self.options = options
+        self._exporter = None
+
+    def setup(self):
+        """ Start Maya and load the FBX plugin.
+        """
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+
+        import pymel.core as pm
+        pm.loadPlugin("fbxmaya", quiet=True)
+
+        from exporter import Exporter
+        from export_options import ExportOptions
+        self._exporter = Exporter
+
+        if self.options is None:
+            self.options = ExportOptions()
+
+        # every export in this worker reuses the options, so they are only set here
+        self.options.apply(force=True)
+
+    def export(self, source, output, timer):
+        """ Bring the Maya file into the scene and export it.
+
+        Args:
+            source (str): The Maya file to export.
+            output (str): The FBX file to write.
+            timer (PhaseTimer): Times the phases of the export.
+        """
+        self._exporter.export_scene(source, output, self.options, timer)
+
+    def teardown(self):
+        """ Shut down Maya.
+        """
+        import maya.standalone
+        maya.standalone.uninitialize()
+
+
+class StubExportWorker(ExportWorker):
+    """ Writes a placeholder file instead of exporting, used to run batches without Maya.
+    """
+
+    def __init__(self, delay=0.0, fail_on=None, crash_on=None):
+        """ Constructor
+
+        Args:
+            delay (float): The time in seconds each export takes.
+            fail_on (str): Files with this text in their name raise an IOError.
+            crash_on (str): Files with this text in their name kill the worker process.
+        """
+        self.delay = delay
+        self.fail_on = fail_on
+        self.crash_on = crash_on
+
+    def export(self, source, output, timer):
+        """ Write a placeholder FBX file.
+
+        Args:
+            source (str): The Maya file to export.
+            output (str): The FBX file to write.
+            timer (PhaseTimer): Times the phases of the export.
+        """
+        with timer.phase("configure"):
+            if not output.endswith(".fbx"):
+                raise IOError("Path {0} is not an FBX file.".format(output))
+
+            dir_name = os.path.dirname(output)
+
+            if dir_name and not os.path.exists(dir_name):
+                try:
+                    os.makedirs(dir_name)
+                except OSError:
+                    # another worker made the folder first
+                    pass
+
+        with timer.phase("export"):
+            if self.delay:
+                time.sleep(self.delay)
+
+            file_name = os.path.basename(source)
+
+            if self.crash_on and self.crash_on in file_name:
+                os._exit(1)
+
+            if self.fail_on and self.fail_on in file_name:
+                raise IOError("Unable to export {0}".format(source))
+
+            with open(output, "w") as output_file:
+                output_file.write("; FBX placeholder for {0}\n".format(source))
+
+
+def _open_pipe(fd, mode):
+    """ Open a file descriptor the pickled messages are sent over.
+
+    Args:
+        fd (int): The file descriptor.
+        mode (str): "rb" or "wb".
+
+    returns:
+        file
+    """
+    if sys.platform == "win32":
+        import msvcrt
+        msvcrt.setmode(fd, os.O_BINARY)
+
+    return os.fdopen(fd, mode)
+
+
+def _worker_main(worker_id, worker, get_job, send):
+    """ The loop run by every worker process.
+
+    Args:
+        worker_id (int): The number of the worker.
+        worker (ExportWorker): The worker doing the exports.
+        get_job (function): Returns the next (source, output) job, None stops the worker.
+        send (function): Sends a message back to the exporter.
+    """
+    try:
+        worker.setup()
+    except Exception:
+        send(("setup_failed", worker_id, traceback.format_exc()))
+        return
+
+    try:
+        while True:
+            job = get_job()
+
+            if job is None:
+                break
+
+            source, output = job
+
+            # the timer is kept outside of the export, so a failed file still reports the phases it got through
+            timer = PhaseTimer()
+            start = default_timer()
+
+            try:
+                worker.export(source, output, timer)
+                result = ExportResult(source, output, duration=default_timer() - start, worker=worker_id,
+                                      phases=timer.phases)
+            except Exception as error:
+                result = ExportResult(source, output, success=False, error=str(error) or traceback.format_exc(),
+                                      duration=default_timer() - start, worker=worker_id, phases=timer.phases)
+
+            send(("done", worker_id, result))
+    finally:
+        worker.teardown()
+
+
+def _worker_process():
+    """ The entry point of a worker process.
+
+    The worker id and the worker are read from stdin, followed by the jobs.  The messages are sent back on the
+    original stdout, and stdout itself is pointed at stderr so anything the exports print, ie. Maya, does not end
+    up in between the messages.
+    """
+    sys.stdout.flush()
+
+    jobs = _open_pipe(os.dup(0), "rb")
+    messages = _open_pipe(os.dup(1), "wb")
+    os.dup2(2, 1)
+
+    def send(message):
+        pickle.dump(message, messages, 2)
+        messages.flush()
+
+    worker_id, worker = pickle.load(jobs)
+
+    _worker_main(worker_id, worker, lambda: pickle.load(jobs), send)
+
+
+class _WorkerProcess(object):
+    """ A worker process and the thread that reads its messages.
+
+    The process is started with subprocess instead of multiprocessing, which forks the calling process on Linux
+    and macOS.  Inside of the Maya application that would copy the whole UI session into every worker.
+    """
+
+    def __init__(self, worker_id, worker, executable, messages):
+        """ Constructor.
+
+        Args:
+            worker_id (int): The number of the worker.
+            worker (ExportWorker): The worker doing the exports, it is pickled and sent to the process.
+            executable (str): The interpreter to start the process with.
+            messages (Queue.Queue): The queue the messages of the process are put on, followed by
+                ("exited", worker_id) once the process stops.
+        """
+        self.worker_id = worker_id
+
+        # the process imports this module and the worker from the same paths as this session
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join(os.path.abspath(path or os.curdir) for path in sys.path)
+
+        command = "import {0}; {0}._worker_process()".format(__name__)
+
+        self.process = subprocess.Popen([executable, "-c", command], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        env=environment, close_fds=os.name != "nt")
+
+        self.send((worker_id, worker))
+
+        self._thread = threading.Thread(target=self._read, args=(messages,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _read(self, messages):
+        """ Put the messages of the process on the queue until it exits.
+
+        Args:
+            messages (Queue.Queue): The queue to put the messages on.
+        """
+        try:
+            while True:
+                messages.put(pickle.load(self.process.stdout))
+        except Exception:
+            # the end of the pipe, or the last message was cut off by a crash
+            pass
+        finally:
+            self.process.stdout.close()
+            messages.put(("exited", self.worker_id))
+
+    def send(self, message):
+        """ Send a message to the process.
+
+        Args:
+            message: The job, or None to stop the process.
+
+        returns:
+            bool: False when the process already exited.
+        """
+        try:
+            pickle.dump(message, self.process.stdin, 2)
+            self.process.stdin.flush()
+        except (IOError, OSError):
+            return False
+
+        return True
+
+    def stop(self):
+        """ Ask the process to exit after its current export.
+        """
+        if self.send(None):
+            try:
+                self.process.stdin.close()
+            except (IOError, OSError):
+                pass
+
+    def join(self, timeout):
+        """ Wait for the process to exit, and kill it when it does not exit in time.
+
+        Args:
+            timeout (float): The time in seconds to wait.
+
+        returns:
+            int: The exit code of the process.
+        """
+        end = time.time() + timeout
+
+        while self.process.poll() is None and time.time() < end:
+            time.sleep(0.05)
+
+        if self.process.poll() is None:
+            self.process.kill()
+
+        return self.process.wait()
+
+
+def default_executable():
+    """ Get the interpreter the worker processes are started with, inside of Maya this is mayapy.
+
+    returns:
+        str
+    """
+    executable = sys.executable
+    file_name = os.path.basename(executable).lower()
+
+    if file_name.startswith("maya") and not file_name.startswith("mayapy"):
+        mayapy = os.path.join(os.path.dirname(executable), "mayapy" + os.path.splitext(file_name)[1])
+
+        if os.path.exists(mayapy):
+            return mayapy
+
+    return executable
+
+
+class ParallelExporter(object):
+    def __init__(self, workers=4, worker=None, executable=None):
+        """ Constructor.
+
+        Args:
+            workers (int): The number of worker processes.
+            worker (ExportWorker): The worker that does the exports, defaults to a MayaExportWorker.
+            executable (str): The interpreter to start the workers with, defaults to mayapy inside of Maya.
+        """
+        self.workers = max(1, workers)
+        self.worker = worker if worker is not None else MayaExportWorker()
+        self.executable = executable or default_executable()
+        self.results = []
+
+        self._processes = dict()
+        self._messages = None
+        self._next_id = 0
+
+    @property
+    def failures(self):
+        """ Get the exports that failed.
+
+        returns:
+            list<ExportResult>
+        """
+        return [result for result in self.results if not result.success]
+
+    def _start_worker(self):
+        """ Start a new worker process.
+
+        returns:
+            int: The id of the worker.
+        """
+        worker_id = self._next_id
+        self._next_id += 1
+
+        self._processes[worker_id] = _WorkerProcess(worker_id, self.worker, self.executable, self._messages)
+
+        return worker_id
+
+    def run(self, jobs, on_start=None):
+        """ Export the files across the worker processes.
+
+        Every worker is handed one file at a time, so a worker that crashes only fails the file it was
+        exporting and stopping the iteration early does not leave queued work behind.
+
+        Args:
+            jobs (iterable<tuple>): The (source, output) path of every file to export.
+            on_start (function): Called with the source and output of every file when it is handed to a worker.
+
+        yields:
+            ExportResult for every file as it finishes.
+        """
+        jobs = iter(jobs)
+
+        self.results = []
+        self._messages = Queue()
+
+        idle = []
+        assigned = dict()
+        exhausted = False
+
+        try:
+            while True:
+                # a job is only taken once a worker is free to start it, so the jobs can still be being discovered
+                # and a job queue never has a job claimed that no worker is exporting
+                while not exhausted and (idle or len(self._processes) < self.workers):
+                    job = next(jobs, None)
+
+                    if job is None:
+                        exhausted = True
+                        break
+
+                    worker_id = idle.pop() if idle else self._start_worker()
+
+                    # a worker that already exited fails the job once its exit message arrives
+                    self._processes[worker_id].send(job)
+                    assigned[worker_id] = job
+
+                    if on_start is not None:
+                        on_start(*job)
+
+                if not assigned:
+                    break
+
+                try:
+                    message = self._messages.get(timeout=0.5)
+                except Empty:
+                    continue
+
+                if message[0] == "setup_failed":
+                    raise RuntimeError("Unable to start the export worker:\n{0}".format(message[2]))
+
+                if message[0] == "exited":
+                    # a worker that died in the middle of an export fails that file and is replaced
+                    worker_id = message[1]
+                    exit_code = self._processes.pop(worker_id).join(5)
+
+                    if worker_id in idle:
+                        idle.remove(worker_id)
+
+                    if worker_id in assigned:
+                        source, output = assigned.pop(worker_id)
+                        result = ExportResult(source, output, success=False, worker=worker_id,
+                                              error="Worker exited with code {0}".format(exit_code))
+                        self.results.append(result)
+                        yield result
+
+                    continue
+
+                _, worker_id, result = message
+
+                assigned.pop(worker_id, None)
+                idle.append(worker_id)
+
+                self.results.append(result)
+                yield result
+        finally:
+            self._stop_workers()
+
+    def _stop_workers(self):
+        """ Stop all of the worker processes.
+        """
+        for process in self._processes.values():
+            process.stop()
+
+        for process in self._processes.values():
+            process.join(5)
+
+        self._processes = dict()
@@ -1,15 +1,242 @@
+# standard library imports
+import os
+import sys
+import pkgutil
+import importlib
+
+# set to 'maya' or 'standalone' to skip detecting whether Maya is available
+BACKEND_ENVIRONMENT_VARIABLE = 'TOOLS_MAYA_BACKEND'
+
+BACKENDS = ('maya', 'standalone')
+
+_backend = {'override': None, 'detected': None}
+
+
+def _find_module(name):
+    """ returns whether a module can be imported, without importing it
+
+    Args:
+        name (str): The name of the top level module
+
+    Returns:
+        True or False
+    """
+    try:
+        return pkgutil.find_loader(name) is not None
+    except ImportError:
+        return False
+
+
+def set_backend(backend=None):
+    """ forces the tools to use Maya or to run standalone
+
+    Args:
+        backend (str): 'maya', 'standalone' or None to detect it again
+    """
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError("Please pass 'maya', 'standalone' or None as the backend.")
+
+    _backend['override'] = backend
+    _backend['detected'] = None
+
+
+def get_backend():
+    """ returns the backend the tools use, it is only detected once
+
+    Returns:
+        (str) 'maya' or 'standalone'
+    """
+    if _backend['override'] is not None:
+        return _backend['override']
+
+    if _backend['detected'] is None:
+        backend = os.environ.get(BACKEND_ENVIRONMENT_VARIABLE, '').lower()
+
+        if backend not in BACKENDS:
+            # PyMel takes seconds to import, so only check that it could be imported
+            backend = 'maya' if 'pymel.core' in sys.modules or (_find_module('maya') and _find_module('pymel')) \
+                else 'standalone'
+
+        _backend['detected'] = backend
+
+    return _backend['detected']
+
+
 def using_maya():
     """ returns whether Maya is being used
 
     Returns:
         True if using Maya and able to import PyMel
     """
+    return get_backend() == 'maya'
+
+
+class LazyModule(object):
+    """ A module that is only imported the first time one of its attributes is used
+    """
+
+    def __init__(self, name):
+        """ constructor
+
+        Args:
+            name (str): The full name of the module, ie. 'pymel.core'
+        """
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        """ imports the module if it has not been imported yet
+
+        Returns:
+            module
+        """
+        if self._module is None:
+            self.__dict__['_module'] = importlib.import_module(self._name)
+
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+
+    def __repr__(self):
+        return 'LazyModule({0}, imported={1})'.format(self._name, self._module is not None)
+
+
+def lazy_import(name):
+    """ returns a module that is imported the first time it is used
+
+    Args:
+        name (str): The full name of the module, ie. 'pymel.core'
+
+    Returns:
+        LazyModule or module: The module itself when it was already imported
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    return LazyModule(name)
+
+
+def python_executable():
+    """ returns the python interpreter to start worker processes with
+
+    Inside of the Maya application sys.executable is Maya itself, so mayapy is used instead.
+
+    Returns:
+        (str) The path to the interpreter
+    """
+    executable = sys.executable
+    file_name = os.path.basename(executable).lower()
+
+    if file_name.startswith('maya') and not file_name.startswith('mayapy'):
+        extension = os.path.splitext(file_name)[1]
+        mayapy = os.path.join(os.path.dirname(executable), 'mayapy' + extension)
+
+        if os.path.exists(mayapy):
+            return mayapy
+
+    return executable
+
+
+def process_map(function, items, workers):
+    """ calls a function for every item across worker processes started with python_executable()
+
+    The processes are started with subprocess instead of multiprocessing, which forks the calling process on Linux
+    and macOS.  Inside of the Maya application that would copy the whole UI session into every worker.
+
+    Args:
+        function (function): A function at the top level of a module, it is imported again by the workers
+        items (list): The arguments to call the function with, they have to be picklable
+        workers (int): The number of processes to start
+
+    Returns:
+        list: The result of every item, in the order of the items
+    """
+    import subprocess
 
     try:
-        import pymel.core as pm
-        return True
+        import cPickle as pickle
     except ImportError:
-        return False
+        import pickle
+
+    workers = max(1, min(workers, len(items)))
+
+    # the processes import the function from the same paths as this session
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(os.path.abspath(path or os.curdir) for path in sys.path)
+
+    command = 'import {0}; {0}._process_main()'.format(__name__)
+    processes = []
+
+    for worker in range(workers):
+        process = subprocess.Popen([python_executable(), '-c', command], stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE, env=environment, close_fds=os.name != 'nt')
+
+        # every worker takes every n-th item, so the slow items are spread over the workers
+        pickle.dump((function, items[worker::workers]), process.stdin, 2)
+        process.stdin.close()
+
+        processes.append(process)
+
+    results = [None] * len(items)
+    errors = []
+
+    for worker, process in enumerate(processes):
+        try:
+            error, worker_results = pickle.load(process.stdout)
+        except Exception:
+            error, worker_results = 'The worker process exited with code {0}'.format(process.wait()), []
+
+        process.stdout.close()
+        process.wait()
+
+        if error:
+            errors.append(error)
+
+        results[worker::workers] = worker_results or results[worker::workers]
+
+    if errors:
+        raise RuntimeError('\n'.join(errors))
+
+    return results
+
+
+def _process_main():
+    """ the entry point of the worker processes of process_map
+
+    The function and the items are read from stdin and the results are written to the original stdout, stdout itself
+    is pointed at stderr so anything the function prints does not end up in the results.
+    """
+    try:
+        import cPickle as pickle
+    except ImportError:
+        import pickle
+
+    sys.stdout.flush()
+
+    stdin_fd, stdout_fd = os.dup(0), os.dup(1)
+    os.dup2(2, 1)
+
+    if sys.platform == 'win32':
+        import msvcrt
+        msvcrt.setmode(stdin_fd, os.O_BINARY)
+        msvcrt.setmode(stdout_fd, os.O_BINARY)
+
+    stdin = os.fdopen(stdin_fd, 'rb')
+    stdout = os.fdopen(stdout_fd, 'wb')
+
+    try:
+        function, items = pickle.load(stdin)
+        message = (None, [function(item) for item in items])
+    except Exception:
+        import traceback
+        message = (traceback.format_exc(), None)
+
+    pickle.dump(message, stdout, 2)
+    stdout.flush()
 
 
 class NodeVector(object):
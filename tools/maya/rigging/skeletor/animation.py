@@ -0,0 +1,604 @@
+__all__ = ['ANIMATION_EXTENSION', 'ANIMATED_CHANNELS', 'AnimationCurve', 'AnimationClip', 'animation_path',
+           'frame_range']
+
+# standard library imports
+import os
+import mmap
+import json
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# skeletor imports
+from joint_pool import CHANNELS, _channel_key
+from binary_format import FLOAT_TYPES, _StringTable, _encode, _to_bytes, _read_array
+
+# the extension of the binary clip files saved next to the skeleton definitions
+ANIMATION_EXTENSION = '.ska'
+
+# the channels that are captured by default, the joint orient is not keyed
+ANIMATED_CHANNELS = ('_translation', '_rotation', '_scale')
+
+MAGIC = b'SKAN'
+VERSION = 1
+
+# magic, version, float size, flags, joint count, curve count, key count, string bytes, extra bytes
+HEADER = struct.Struct('<4sHBBIIIII')
+
+
+def animation_path(data_path, name):
+    """ Gets the path of a clip saved next to a skeleton definition, ie. character.json and walk give character.walk.ska
+
+    Args:
+        data_path (str): The path to the skeleton definition
+        name (str): The name of the clip
+
+    Returns:
+        (str)
+    """
+    return '{0}.{1}{2}'.format(os.path.splitext(data_path)[0], name, ANIMATION_EXTENSION)
+
+
+def frame_range(start, end, step=1.0):
+    """ Gets the frames from start to end, both included
+
+    Args:
+        start (float): The first frame
+        end (float): The last frame
+        step (float): The time between the frames
+
+    Returns:
+        list(float)
+    """
+    if step <= 0:
+        raise ValueError("Please pass a step larger than 0.")
+
+    if end < start:
+        raise ValueError("The end frame {0} is before the start frame {1}.".format(end, start))
+
+    # the count is rounded so a range that does not divide evenly does not lose its last frame to float error
+    count = int(round((end - start) / float(step))) + 1
+
+    return [start + i * step for i in range(count)]
+
+
+class AnimationCurve(object):
+    """ The keys of one channel of one joint.
+
+    The times and the values are stored in two flat arrays, three values per key, so a curve of thousands of keys is
+    two buffers instead of an object per key.  The keys are always sorted by time.
+    """
+
+    __slots__ = ('times', 'values')
+
+    def __init__(self, times=None, values=None):
+        """ Constructor
+
+        Args:
+            times (list(float)): The time of every key, sorted
+            values (list(float)): The values of the keys, three per key
+        """
+        self.times = array('d', () if times is None else times)
+        self.values = array('d', () if values is None else values)
+
+        if len(self.values) != len(self.times) * 3:
+            raise ValueError("Please pass three values for every key.")
+
+    def __len__(self):
+        return len(self.times)
+
+    def __repr__(self):
+        return 'AnimationCurve({0} keys)'.format(len(self.times))
+
+    def __eq__(self, other):
+        return isinstance(other, AnimationCurve) and self.times == other.times and self.values == other.values
+
+    def __ne__(self, other):
+        return not self == other
+
+    def copy(self):
+        """ Copies the curve
+
+        Returns:
+            AnimationCurve
+        """
+        return AnimationCurve(self.times, self.values)
+
+    def key(self, index):
+        """ Gets a key
+
+        Args:
+            index (int): The index of the key
+
+        Returns:
+            (float, list(float)) The time and the value of the key
+        """
+        index = range(len(self.times))[index]
+        return self.times[index], self.values[index * 3:index * 3 + 3].tolist()
+
+    def add_key(self, time, value):
+        """ Adds a key, a key at the same time is replaced
+
+        Args:
+            time (float): The time of the key
+            value (list(float)): The three values of the key
+        """
+        if len(value) != 3:
+            raise ValueError("Please pass three values for the key.")
+
+        value = array('d', [float(v) for v in value])
+
+        # capturing appends every key after the last one, which does not have to search the times
+        if not self.times or time > self.times[-1]:
+            self.times.append(time)
+            self.values.extend(value)
+            return
+
+        index = bisect_left(self.times, time)
+
+        if self.times[index] == time:
+            self.values[index * 3:index * 3 + 3] = value
+            return
+
+        self.times.insert(index, time)
+        self.values[index * 3:index * 3] = value
+
+    def remove_key(self, index):
+        """ Removes a key
+
+        Args:
+            index (int): The index of the key
+        """
+        index = range(len(self.times))[index]
+
+        del self.times[index]
+        del self.values[index * 3:index * 3 + 3]
+
+    def evaluate(self, time):
+        """ Gets the value of the curve at a time, interpolating linearly between the keys
+
+        Args:
+            time (float): The time
+
+        Returns:
+            list(float): The three values, the first or last key outside of the keyed range
+        """
+        return self.sample([time]).tolist()
+
+    def sample(self, times):
+        """ Gets the values of the curve at several times with a single walk over the keys
+
+        Args:
+            times (list(float)): The times, sorted
+
+        Returns:
+            array.array: Three values per time
+        """
+        keys = self.times
+        values = self.values
+        count = len(keys)
+
+        if not count:
+            raise ValueError("Unable to sample a curve without keys.")
+
+        result = array('d')
+        index = 0
+
+        for time in times:
+            if index and time < keys[index - 1]:
+                # the times are not sorted, search instead of walking
+                index = bisect_right(keys, time)
+
+            while index < count and keys[index] <= time:
+                index += 1
+
+            if index == 0:
+                result.extend(values[0:3])
+            elif index == count:
+                result.extend(values[count * 3 - 3:count * 3])
+            else:
+                start = keys[index - 1]
+                weight = (time - start) / (keys[index] - start)
+                before = (index - 1) * 3
+
+                result.extend(values[before + i] + (values[before + 3 + i] - values[before + i]) * weight
+                              for i in range(3))
+
+        return result
+
+    def resample(self, times):
+        """ Gets a copy of the curve with keys at the given times
+
+        Args:
+            times (list(float)): The times of the keys, sorted
+
+        Returns:
+            AnimationCurve
+        """
+        return AnimationCurve(times, self.sample(times))
+
+    @property
+    def start(self):
+        """ Gets the time of the first key
+
+        Returns:
+            (float) None when the curve has no keys
+        """
+        return self.times[0] if self.times else None
+
+    @property
+    def end(self):
+        """ Gets the time of the last key
+
+        Returns:
+            (float) None when the curve has no keys
+        """
+        return self.times[-1] if self.times else None
+
+
+class AnimationClip(object):
+    """ The animation curves of the joints of a skeleton, keyed by joint name and channel.
+
+    The times of the keys are in frames, the frame rate is stored with the clip.  The rotations are interpolated
+    per axis, like the euler curves of a baked Maya clip.
+
+    The values are in the same space as the joints of the skeleton they were captured from, so a clip can pose the
+    skeleton it was saved next to.  Clips captured from Maya store world translations and rotations, like the
+    definitions saved with MayaSkeleton, and scales relative to the parent.
+    """
+
+    def __init__(self, name='', frame_rate=30.0):
+        """ Constructor
+
+        Args:
+            name (str): The name of the clip, ie. 'walk'
+            frame_rate (float): The number of frames per second
+        """
+        self._name = name
+        self._frame_rate = float(frame_rate)
+        self._curves = OrderedDict()
+
+    def __str__(self):
+        return 'AnimationClip({0})'.format(self._name)
+
+    def __len__(self):
+        return sum(len(channels) for channels in self._curves.values())
+
+    def __iter__(self):
+        """ Iterates over the curves
+
+        Yields:
+            (str, str, AnimationCurve) The joint name, the channel and the curve
+        """
+        for joint, channels in self._curves.items():
+            for channel, curve in channels.items():
+                yield joint, channel, curve
+
+    @classmethod
+    def capture(cls, skeleton, start, end, step=1.0, name='', frame_rate=30.0, channels=ANIMATED_CHANNELS):
+        """ Captures the animation of a skeleton over a frame range, every channel of every joint is read at once
+        for each frame
+
+        Args:
+            skeleton (Skeleton): The skeleton to capture, the pose is read with Skeleton.sample_pose
+            start (float): The first frame
+            end (float): The last frame
+            step (float): The time between the captured frames
+            name (str): The name of the clip
+            frame_rate (float): The number of frames per second
+            channels (list(str)): The channels to capture
+
+        Returns:
+            AnimationClip
+        """
+        channels = [_channel_key(channel) for channel in channels]
+        frames = frame_range(start, end, step)
+
+        names = [joint.name for joint in skeleton.joints]
+        stride = len(names) * 3
+
+        # the poses are stored frame after frame and split in to curves once the range is captured
+        poses = dict((channel, array('d')) for channel in channels)
+
+        for frame in frames:
+            pose = skeleton.sample_pose(frame, channels)
+
+            for channel in channels:
+                if len(pose[channel]) != stride:
+                    raise ValueError("The pose of frame {0} does not have a value for every joint.".format(frame))
+
+                poses[channel].extend(pose[channel])
+
+        clip = cls(name, frame_rate)
+
+        for i, joint in enumerate(names):
+            clip._curves[joint] = curves = OrderedDict()
+
+            for channel in channels:
+                values = array('d')
+                pose = poses[channel]
+
+                for offset in range(i * 3, len(pose), stride):
+                    values.extend(pose[offset:offset + 3])
+
+                curves[channel] = AnimationCurve(frames, values)
+
+        return clip
+
+    def curve(self, joint, channel):
+        """ Gets the curve of a channel of a joint
+
+        Args:
+            joint (str): The name of the joint
+            channel (str): The channel name, ie. 'translation'
+
+        Returns:
+            AnimationCurve: None when the channel is not animated
+        """
+        return self._curves.get(joint, {}).get(_channel_key(channel))
+
+    def set_curve(self, joint, channel, curve):
+        """ Sets the curve of a channel of a joint
+
+        Args:
+            joint (str): The name of the joint
+            channel (str): The channel name, ie. 'translation'
+            curve (AnimationCurve): The curve
+        """
+        if not isinstance(curve, AnimationCurve):
+            raise ValueError("Please pass an AnimationCurve.")
+
+        self._curves.setdefault(joint, OrderedDict())[_channel_key(channel)] = curve
+
+    def remove_joint(self, joint):
+        """ Removes the curves of a joint
+
+        Args:
+            joint (str): The name of the joint
+        """
+        self._curves.pop(joint, None)
+
+    def pose(self, skeleton, time):
+        """ Sets the joints of a skeleton to the pose of the clip at a time, the joints without curves keep their pose
+
+        Args:
+            skeleton (Skeleton): The skeleton to pose
+            time (float): The time
+        """
+        for joint_name, channels in self._curves.items():
+            joint = skeleton.find(joint_name)
+
+            if joint is None:
+                continue
+
+            for channel, curve in channels.items():
+                if curve.times:
+                    setattr(joint, channel[1:], curve.evaluate(time))
+
+    def resample(self, step=1.0, start=None, end=None):
+        """ Gets a copy of the clip with every curve keyed at the same evenly spaced frames
+
+        Args:
+            step (float): The time between the keys
+            start (float): The first frame, defaults to the start of the clip
+            end (float): The last frame, defaults to the end of the clip
+
+        Returns:
+            AnimationClip
+        """
+        clip = AnimationClip(self._name, self._frame_rate)
+
+        if self.start is None:
+            return clip
+
+        times = frame_range(self.start if start is None else start, self.end if end is None else end, step)
+
+        for joint, channels in self._curves.items():
+            clip._curves[joint] = OrderedDict((channel, curve.resample(times) if curve.times else curve.copy())
+                                              for channel, curve in channels.items())
+
+        return clip
+
+    def copy(self):
+        """ Copies the clip and its curves
+
+        Returns:
+            AnimationClip
+        """
+        clip = AnimationClip(self._name, self._frame_rate)
+
+        for joint, channels in self._curves.items():
+            clip._curves[joint] = OrderedDict((channel, curve.copy()) for channel, curve in channels.items())
+
+        return clip
+
+    def pack(self, float_size=8):
+        """ Packs the clip in to the binary format
+
+        Args:
+            float_size (int): 8 to store the values as doubles, 4 to store them as floats which loses precision, the
+                times are always stored as doubles
+
+        Returns:
+            (bytes)
+        """
+        if float_size not in FLOAT_TYPES:
+            raise ValueError("Please pass 4 or 8 as the float size.")
+
+        joints = _StringTable()
+
+        curve_joints = array('i')
+        curve_channels = array('b')
+        key_offsets = array('I', [0])
+
+        times = array('d')
+        values = array('d')
+
+        for joint, channel, curve in self:
+            curve_joints.append(joints.add(joint))
+            curve_channels.append(CHANNELS.index(channel))
+
+            times.extend(curve.times)
+            values.extend(curve.values)
+            key_offsets.append(len(times))
+
+        if float_size == 4:
+            values = array('f', values)
+
+        encoded = [_encode(joint) for joint in joints.strings]
+        string_offsets = array('I', [0])
+
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+
+        extra = _encode(json.dumps({'_name': self._name, '_frame_rate': self._frame_rate}))
+
+        header = HEADER.pack(MAGIC, VERSION, float_size, 0, len(encoded), len(curve_joints), len(times),
+                             string_offsets[-1], len(extra))
+
+        return b''.join([header, _to_bytes(string_offsets), b''.join(encoded), _to_bytes(curve_joints),
+                         _to_bytes(curve_channels), _to_bytes(key_offsets), _to_bytes(times), _to_bytes(values),
+                         extra])
+
+    @classmethod
+    def unpack(cls, buffer):
+        """ Unpacks a clip from the binary format
+
+        Args:
+            buffer: The bytes or memory map holding the packed clip
+
+        Returns:
+            AnimationClip
+        """
+        magic, version, float_size, _, joint_count, curve_count, key_count, string_bytes, extra_bytes = \
+            HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC:
+            raise IOError("The data is not a binary animation file.")
+
+        if version > VERSION or float_size not in FLOAT_TYPES:
+            raise IOError("Unsupported binary animation version {0}.".format(version))
+
+        offset = HEADER.size
+
+        string_offsets, offset = _read_array('I', buffer, offset, joint_count + 1)
+        blob = buffer[offset:offset + string_bytes]
+        offset += string_bytes
+
+        joints = [blob[string_offsets[i]:string_offsets[i + 1]].decode('utf-8') for i in range(joint_count)]
+
+        curve_joints, offset = _read_array('i', buffer, offset, curve_count)
+        curve_channels, offset = _read_array('b', buffer, offset, curve_count)
+        key_offsets, offset = _read_array('I', buffer, offset, curve_count + 1)
+        times, offset = _read_array('d', buffer, offset, key_count)
+        values, offset = _read_array(FLOAT_TYPES[float_size], buffer, offset, key_count * 3)
+
+        extra = json.loads(buffer[offset:offset + extra_bytes].decode('utf-8'))
+
+        clip = cls(extra['_name'], extra['_frame_rate'])
+
+        for i in range(curve_count):
+            first, last = key_offsets[i], key_offsets[i + 1]
+            curve = AnimationCurve(times[first:last], values[first * 3:last * 3])
+
+            clip._curves.setdefault(joints[curve_joints[i]], OrderedDict())[CHANNELS[curve_channels[i]]] = curve
+
+        return clip
+
+    def save(self, path, float_size=8):
+        """ Saves the clip to a binary file, use animation_path to save it next to the skeleton definition
+
+        Args:
+            path (str): The path to the file
+            float_size (int): 8 to store the values as doubles, 4 to store them as floats which loses precision
+        """
+        with open(path, 'wb') as outfile:
+            outfile.write(self.pack(float_size))
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """ Loads a clip from a binary file
+
+        Args:
+            path (str): The path to the file
+            use_mmap (bool): Memory map the file instead of reading it in to memory first
+
+        Returns:
+            AnimationClip
+        """
+        with open(path, 'rb') as data_file:
+            if not use_mmap or os.path.getsize(path) == 0:
+                return cls.unpack(data_file.read())
+
+            data_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                return cls.unpack(data_map)
+            finally:
+                data_map.close()
+
+    @property
+    def name(self):
+        """ Gets the name of the clip
+
+        Returns:
+            (str)
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """ Sets the name of the clip
+
+        Args:
+            value (str): The name
+        """
+        self._name = value
+
+    @property
+    def frame_rate(self):
+        """ Gets the number of frames per second
+
+        Returns:
+            (float)
+        """
+        return self._frame_rate
+
+    @property
+    def joints(self):
+        """ Gets the names of the animated joints
+
+        Returns:
+            list(str)
+        """
+        return list(self._curves)
+
+    @property
+    def key_count(self):
+        """ Gets the number of keys of every curve together
+
+        Returns:
+            (int)
+        """
+        return sum(len(curve) for _, _, curve in self)
+
+    @property
+    def start(self):
+        """ Gets the first keyed frame
+
+        Returns:
+            (float) None when the clip has no keys
+        """
+        starts = [curve.times[0] for _, _, curve in self if curve.times]
+        return min(starts) if starts else None
+
+    @property
+    def end(self):
+        """ Gets the last keyed frame
+
+        Returns:
+            (float) None when the clip has no keys
+        """
+        ends = [curve.times[-1] for _, _, curve in self if curve.times]
+        return max(ends) if ends else None
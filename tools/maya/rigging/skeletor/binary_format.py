@@ -0,0 +1,274 @@
+__all__ = ['BINARY_EXTENSIONS', 'is_binary_path', 'pack_pool', 'unpack_pool', 'write_binary', 'read_binary']
+
+# standard library imports
+import os
+import sys
+import mmap
+import json
+import struct
+from array import array
+
+# skeletor imports
+from joint_pool import JointPool, CHANNELS
+
+# file extensions that are saved and loaded with the binary format
+BINARY_EXTENSIONS = ('.skb',)
+
+MAGIC = b'SKEL'
+VERSION = 1
+
+# magic, version, float size, flags, joint count, string count, string bytes, child count, extra bytes
+HEADER = struct.Struct('<4sHBBIIIII')
+
+FLOAT_TYPES = {4: 'f', 8: 'd'}
+
+
+def is_binary_path(path):
+    """ Returns whether a path should use the binary format based on its extension
+
+    Args:
+        path (str): The path to the data file
+
+    Returns:
+        True or False
+    """
+    return os.path.splitext(path)[1].lower() in BINARY_EXTENSIONS
+
+
+def _encode(value):
+    """ Encodes a string as utf-8 bytes
+
+    Args:
+        value (str): The string to encode
+
+    Returns:
+        (bytes)
+    """
+    return value if isinstance(value, bytes) else value.encode('utf-8')
+
+
+def _little_endian(values):
+    """ Makes sure an array is stored little endian, the byte order used by the file
+
+    Args:
+        values (array.array): The array to convert, it is changed in place
+
+    Returns:
+        array.array
+    """
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def _to_bytes(values):
+    """ Gets the little endian bytes of an array
+
+    Args:
+        values (array.array): The array to convert
+
+    Returns:
+        (bytes)
+    """
+    values = _little_endian(array(values.typecode, values))
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def _read_array(typecode, buffer, offset, count):
+    """ Reads an array from a buffer
+
+    Args:
+        typecode (str): The array type code
+        buffer: The bytes or memory map to read from
+        offset (int): The position to start reading at
+        count (int): The number of items to read
+
+    Returns:
+        (array.array, int) The array and the position after it
+    """
+    values = array(typecode)
+    end = offset + count * values.itemsize
+
+    if hasattr(values, 'frombytes'):
+        values.frombytes(buffer[offset:end])
+    else:
+        values.fromstring(buffer[offset:end])
+
+    return _little_endian(values), end
+
+
+class _StringTable(object):
+    """ Collects the unique strings of a skeleton, None is stored as -1.
+    """
+
+    def __init__(self):
+        self.strings = []
+        self._lookup = dict()
+
+    def add(self, value):
+        if value is None:
+            return -1
+
+        index = self._lookup.get(value)
+
+        if index is None:
+            index = len(self.strings)
+            self._lookup[value] = index
+            self.strings.append(value)
+
+        return index
+
+
+def pack_pool(pool, prefix='', data_path='', float_size=8):
+    """ Packs the joint data of a pool in to the binary format
+
+    Args:
+        pool (JointPool): The joint data to pack
+        prefix (str): The prefix of the skeleton
+        data_path (str): The path of the skeleton data
+        float_size (int): 8 to store the transforms as doubles, 4 to store them as floats which loses precision
+
+    Returns:
+        (bytes)
+    """
+    if float_size not in FLOAT_TYPES:
+        raise ValueError("Please pass 4 or 8 as the float size.")
+
+    count = len(pool)
+    strings = _StringTable()
+
+    # the empty string is always the first string
+    strings.add('')
+
+    references = array('i')
+
+    for column in (pool.names, pool.parents, pool.groups, pool.mirrored_joints):
+        references.extend(strings.add(value) for value in column)
+
+    child_offsets = array('i', [0])
+    child_references = array('i')
+
+    for children in pool.children:
+        if children:
+            child_references.extend(strings.add(child) for child in children)
+
+        child_offsets.append(len(child_references))
+
+    encoded = [_encode(value) for value in strings.strings]
+    string_offsets = array('I', [0])
+
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    transforms = array('d')
+
+    for channel in CHANNELS:
+        transforms.extend(pool.channel(channel))
+
+    if float_size == 4:
+        transforms = array('f', transforms)
+
+    extra = _encode(json.dumps({
+        '_prefix': prefix,
+        '_data_path': data_path,
+        '_custom_attributes': dict((str(row), attributes) for row, attributes in pool.custom_attributes.items()
+                                   if attributes),
+    }))
+
+    header = HEADER.pack(MAGIC, VERSION, float_size, 0, count, len(encoded), string_offsets[-1],
+                         len(child_references), len(extra))
+
+    return b''.join([header, _to_bytes(string_offsets), b''.join(encoded), _to_bytes(references),
+                     _to_bytes(array('b', pool.mirror_flags)), _to_bytes(child_offsets),
+                     _to_bytes(child_references), _to_bytes(transforms), extra])
+
+
+def unpack_pool(buffer):
+    """ Unpacks the binary format in to a pool, the joints are never turned in to dictionaries
+
+    Args:
+        buffer: The bytes or memory map holding the packed skeleton
+
+    Returns:
+        (JointPool, dict) The joint data and the skeleton data, ie. the prefix
+    """
+    magic, version, float_size, _, count, string_count, string_bytes, child_count, extra_bytes = \
+        HEADER.unpack_from(buffer, 0)
+
+    if magic != MAGIC:
+        raise IOError("The data is not a binary skeleton file.")
+
+    if version > VERSION or float_size not in FLOAT_TYPES:
+        raise IOError("Unsupported binary skeleton version {0}.".format(version))
+
+    offset = HEADER.size
+
+    string_offsets, offset = _read_array('I', buffer, offset, string_count + 1)
+    blob = buffer[offset:offset + string_bytes]
+    offset += string_bytes
+
+    strings = [blob[string_offsets[i]:string_offsets[i + 1]].decode('utf-8') for i in range(string_count)]
+
+    references, offset = _read_array('i', buffer, offset, count * 4)
+    columns = [[strings[reference] if reference >= 0 else None for reference in references[i * count:(i + 1) * count]]
+               for i in range(4)]
+
+    mirror, offset = _read_array('b', buffer, offset, count)
+    child_offsets, offset = _read_array('i', buffer, offset, count + 1)
+    child_references, offset = _read_array('i', buffer, offset, child_count)
+
+    children = [[strings[reference] for reference in child_references[child_offsets[i]:child_offsets[i + 1]]] or None
+                for i in range(count)]
+
+    transforms, offset = _read_array(FLOAT_TYPES[float_size], buffer, offset, count * 3 * len(CHANNELS))
+
+    channels = dict()
+
+    for i, channel in enumerate(CHANNELS):
+        channels[channel] = array('d', transforms[i * count * 3:(i + 1) * count * 3])
+
+    extra = json.loads(buffer[offset:offset + extra_bytes].decode('utf-8'))
+
+    custom_attributes = dict((int(row), attributes) for row, attributes in extra.pop('_custom_attributes').items())
+
+    pool = JointPool.from_columns(channels, columns[0], columns[1], columns[2], mirror, columns[3], children,
+                                  custom_attributes)
+
+    return pool, extra
+
+
+def write_binary(path, pool, prefix='', data_path='', float_size=8):
+    """ Writes joint data to a binary skeleton file
+
+    Args:
+        path (str): The path to the file
+        pool (JointPool): The joint data to write
+        prefix (str): The prefix of the skeleton
+        data_path (str): The path of the skeleton data
+        float_size (int): 8 to store the transforms as doubles, 4 to store them as floats which loses precision
+    """
+    with open(path, 'wb') as outfile:
+        outfile.write(pack_pool(pool, prefix, data_path, float_size))
+
+
+def read_binary(path, use_mmap=True):
+    """ Reads joint data from a binary skeleton file
+
+    Args:
+        path (str): The path to the file
+        use_mmap (bool): Memory map the file instead of reading it in to memory first
+
+    Returns:
+        (JointPool, dict) The joint data and the skeleton data, ie. the prefix
+    """
+    with open(path, 'rb') as data_file:
+        if not use_mmap or os.path.getsize(path) == 0:
+            return unpack_pool(data_file.read())
+
+        data_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return unpack_pool(data_map)
+        finally:
+            data_map.close()
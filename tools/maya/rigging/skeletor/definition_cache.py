@@ -0,0 +1,364 @@
+__all__ = ['DefinitionCache', 'CacheStats', 'get_definition_cache']
+
+# standard library imports
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+# the default memory budget of the process wide cache, in bytes
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _file_hash(path):
+    """ Hashes the content of a file
+
+    Args:
+        path (str): The path to the file
+
+    Returns:
+        (str) The sha1 hex digest
+    """
+    digest = hashlib.sha1()
+
+    with open(path, 'rb') as data_file:
+        for chunk in iter(lambda: data_file.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class CacheStats(object):
+    def __init__(self, hits=0, misses=0, evictions=0, invalidations=0, entries=0, size=0, max_size=0):
+        """ Constructor
+
+        Args:
+            hits (int): The number of definitions handed out from the cache
+            misses (int): The number of definitions that had to be read from disk
+            evictions (int): The number of definitions dropped to stay under the memory budget
+            invalidations (int): The number of definitions dropped because their file changed
+            entries (int): The number of cached definitions
+            size (int): The memory used by the cached definitions in bytes
+            max_size (int): The memory budget in bytes
+        """
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.invalidations = invalidations
+        self.entries = entries
+        self.size = size
+        self.max_size = max_size
+
+    def __str__(self):
+        return 'CacheStats({0} hits, {1} misses, {2:.0%} hit rate, {3} entries, {4}/{5} bytes)'.format(
+            self.hits, self.misses, self.hit_rate, self.entries, self.size, self.max_size)
+
+    @property
+    def hit_rate(self):
+        """ Gets the share of the lookups that were served from the cache
+
+        Returns:
+            (float)
+        """
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else 0.0
+
+
+class _CacheEntry(object):
+    __slots__ = ('packed', 'errors', 'mtime', 'size', 'digest')
+
+    def __init__(self, packed, errors, mtime, size, digest):
+        self.packed = packed
+        self.errors = errors
+        self.mtime = mtime
+        self.size = size
+        self.digest = digest
+
+
+class DefinitionCache(object):
+    """ Keeps the parsed skeleton definitions of a process in memory.
+
+    Definitions are keyed by their absolute path and are only handed out while the modification time and size of
+    the file are unchanged, optionally also checking a hash of the content when the time changed.  Every definition
+    is stored packed in the binary format, which is immutable, and every hand out unpacks it in to a new skeleton,
+    so a caller changing its skeleton never changes what the next caller gets.  The least recently used definitions
+    are dropped when the packed data grows past the memory budget.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, use_hash=False):
+        """ Constructor
+
+        Args:
+            max_bytes (int): The memory budget for the packed definitions in bytes
+            use_hash (bool): Keep a definition whose file was touched but still has the same content
+        """
+        self._max_bytes = max_bytes
+        self._use_hash = use_hash
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return self._key(path) in self._entries
+
+    @staticmethod
+    def _key(path):
+        """ Gets the key a file is cached under
+
+        Args:
+            path (str): The path to the definition
+
+        Returns:
+            (str)
+        """
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def file_stat(path):
+        """ Gets the modification time and size of a file
+
+        Args:
+            path (str): The path to the file
+
+        Returns:
+            (float, int) or None if the file does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_size
+
+    def get(self, path):
+        """ Gets the packed data of a cached definition, as long as the file did not change
+
+        Args:
+            path (str): The path to the definition
+
+        Returns:
+            (bytes, list(str)) The packed skeleton and the errors stored with it, which are None when the definition
+            was not validated, or None when it is not cached
+        """
+        key = self._key(path)
+        stat = self.file_stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and (stat is None or not self._is_current(entry, key, stat)):
+                self._drop(key)
+                self._invalidations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries[key] = self._entries.pop(key)
+            self._hits += 1
+
+            return entry.packed, entry.errors
+
+    def _is_current(self, entry, key, stat):
+        """ Checks a cached definition against its file, a matching hash refreshes the stored time
+
+        Args:
+            entry (_CacheEntry): The cached definition
+            key (str): The path to the definition
+            stat ((float, int)): The modification time and size of the file
+
+        Returns:
+            True or False
+        """
+        if (entry.mtime, entry.size) == stat:
+            return True
+
+        if not self._use_hash or entry.size != stat[1] or entry.digest is None:
+            return False
+
+        try:
+            digest = _file_hash(key)
+        except IOError:
+            return False
+
+        if digest != entry.digest:
+            return False
+
+        entry.mtime = stat[0]
+
+        return True
+
+    def put(self, path, packed, errors=None, stat=None):
+        """ Stores the packed data of a definition
+
+        Args:
+            path (str): The path to the definition
+            packed (bytes): The packed skeleton, ie. from Skeleton.pack
+            errors (list(str)): The validation errors of the skeleton, None when it was not validated
+            stat ((float, int)): The modification time and size of the file from before it was read, so that a
+                file changed while it was being read is not cached as current
+
+        Returns:
+            True if the definition was cached, False if it is larger than the memory budget
+        """
+        key = self._key(path)
+        stat = stat or self.file_stat(key)
+
+        if stat is None:
+            return False
+
+        digest = None
+
+        if self._use_hash:
+            try:
+                digest = _file_hash(key)
+            except IOError:
+                return False
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            if len(packed) > self._max_bytes:
+                return False
+
+            self._entries[key] = _CacheEntry(packed, errors, stat[0], stat[1], digest)
+            self._size += len(packed)
+
+            self._evict()
+
+        return True
+
+    def load(self, skeleton, path, format=None):
+        """ Loads a definition in to a skeleton, from the cache when the file did not change
+
+        Args:
+            skeleton (Skeleton): The skeleton to load in to
+            path (str): The path to the definition
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+
+        Returns:
+            True if the definition came from the cache
+        """
+        cached = self.get(path)
+
+        if cached is not None:
+            skeleton.unpack(cached[0])
+            skeleton.data_path = path
+            return True
+
+        stat = self.file_stat(path)
+
+        skeleton.load(path, format)
+
+        if stat is not None:
+            self.put(path, skeleton.pack(), stat=stat)
+
+        return False
+
+    def invalidate(self, path):
+        """ Drops a definition from the cache
+
+        Args:
+            path (str): The path to the definition
+
+        Returns:
+            True if the definition was cached
+        """
+        key = self._key(path)
+
+        with self._lock:
+            if key not in self._entries:
+                return False
+
+            self._drop(key)
+            self._invalidations += 1
+
+        return True
+
+    def clear(self):
+        """ Drops all of the definitions and resets the statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def _drop(self, key):
+        """ Removes an entry, the lock has to be held
+
+        Args:
+            key (str): The key of the entry
+        """
+        entry = self._entries.pop(key)
+        self._size -= len(entry.packed)
+
+    def _evict(self):
+        """ Drops the least recently used entries until the cache is within its memory budget, the lock has to be held
+        """
+        while self._size > self._max_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    @property
+    def stats(self):
+        """ Gets the hit and miss counts and the memory used
+
+        Returns:
+            CacheStats
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._invalidations,
+                              len(self._entries), self._size, self._max_bytes)
+
+    @property
+    def max_bytes(self):
+        """ Gets the memory budget in bytes
+
+        Returns:
+            (int)
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        """ Sets the memory budget in bytes, entries are evicted right away if the cache is over it
+
+        Args:
+            value (int): The memory budget
+        """
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def use_hash(self):
+        """ Gets whether the content hash is checked when the modification time of a file changed
+
+        Returns:
+            True or False
+        """
+        return self._use_hash
+
+
+_definition_cache = DefinitionCache()
+
+
+def get_definition_cache():
+    """ Gets the definition cache shared by the whole process
+
+    Returns:
+        DefinitionCache
+    """
+    return _definition_cache
@@ -73,10 +73,10 @@ class JointData(Transform):
 
     @property
     def mirrored_joint(self):
-        """ Gets the mirrored joint
+        """ Gets the name of the mirrored joint
 
         Returns:
-            JointData
+            (str) or None
         """
         return self._mirrored_joint
 
@@ -138,7 +138,13 @@ class JointData(Transform):
         self._custom_attributes[key] = value
 
     @abc.abstractmethod
-    def create(self):
+    def create(self, parent=None):
         """ Create a joint based on the current data
+
+        Args:
+            parent: The created parent node, or the name of the parent, defaults to the parent of the joint
+
+        Returns:
+            The created node
         """
         return
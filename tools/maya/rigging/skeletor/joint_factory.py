@@ -3,11 +3,16 @@ __all__ = ['SkeletonJoint']
 # skeletor imports
 from joint_data import JointData
 from maya_joint_data import MayaJointData
+from scene_joint_data import SceneJointData
+from scene_backend import get_scene_backend
 from ..Utils import using_maya
 
 
 class SkeletonJoint(object):
     def __new__(cls, node=None):
+        if get_scene_backend() is not None:
+            return SceneJointData(node)
+
         if using_maya():
             return MayaJointData(node)
 
@@ -0,0 +1,595 @@
+__all__ = ['JointPool', 'PooledJointData', 'ChannelVector']
+
+# standard library imports
+from array import array
+
+# skeletor imports
+from joint_data import JointData
+
+try:
+    # numpy is optional, it is only used to expose the channels as N x 3 arrays
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# the transform channels stored as contiguous float blocks
+CHANNELS = ('_translation', '_rotation', '_scale', '_orientation')
+
+CHANNEL_DEFAULTS = {
+    '_translation': (0.0, 0.0, 0.0),
+    '_rotation': (0.0, 0.0, 0.0),
+    '_scale': (1.0, 1.0, 1.0),
+    '_orientation': (0.0, 0.0, 0.0),
+}
+
+
+def _channel_key(channel):
+    """ Returns the internal key for a channel name
+
+    Args:
+        channel (str): The channel name, ie. 'translation' or '_translation'
+
+    Returns:
+        (str)
+    """
+    key = channel if channel.startswith('_') else '_' + channel
+
+    if key not in CHANNEL_DEFAULTS:
+        raise ValueError("{0} is not a valid transform channel.".format(channel))
+
+    return key
+
+
+class ChannelVector(list):
+    """ The three values of a channel of a pooled joint.
+
+    The vector is a copy of the values, like the list held by a regular JointData, but assigning an item
+    writes the value back in to the pool so in place edits such as joint.translation[0] = x are kept.
+    """
+
+    def __init__(self, pool, channel, index):
+        """ Constructor
+
+        Args:
+            pool (JointPool): The pool that stores the joint
+            channel (str): The internal channel key
+            index (int): The row of the joint in the pool
+        """
+        super(ChannelVector, self).__init__(pool.get_vector(channel, index))
+
+        self._pool = pool
+        self._channel = channel
+        self._index = index
+
+    def __setitem__(self, key, value):
+        values = list(self)
+        values[key] = value
+
+        # validate and write the pool first so a bad edit leaves both untouched
+        self._pool.set_vector(self._channel, self._index, values)
+        super(ChannelVector, self).__setitem__(slice(None), self._pool.get_vector(self._channel, self._index))
+
+    def __setslice__(self, start, stop, value):
+        # python 2 routes simple slice assignments here instead of __setitem__
+        self.__setitem__(slice(start, stop), value)
+
+    def __reduce__(self):
+        # copies and pickles are detached plain lists, they should not drag the pool along
+        return list, (list(self),)
+
+
+def _channel_property(channel):
+    """ Creates a property reading and writing a channel of the pool
+
+    Args:
+        channel (str): The internal channel key
+
+    Returns:
+        property
+    """
+
+    def getter(self):
+        return ChannelVector(self._pool, channel, self._index)
+
+    def setter(self, value):
+        self._pool.set_vector(channel, self._index, value)
+
+    return property(getter, setter)
+
+
+def _column_property(column):
+    """ Creates a property reading and writing a per joint column of the pool
+
+    Args:
+        column (str): The name of the list attribute on the pool
+
+    Returns:
+        property
+    """
+
+    def getter(self):
+        return getattr(self._pool, column)[self._index]
+
+    def setter(self, value):
+        getattr(self._pool, column)[self._index] = value
+
+    return property(getter, setter)
+
+
+class PooledJointData(JointData):
+    """ A lightweight view of a single joint stored in a JointPool.
+
+    The view only holds the pool and the row index, all of the joint data lives in the pool.
+    """
+
+    # map the private attributes used by Transform and JointData on to the pool so that
+    # the inherited properties and setters keep working unchanged
+    _translation = _channel_property('_translation')
+    _rotation = _channel_property('_rotation')
+    _scale = _channel_property('_scale')
+    _orientation = _channel_property('_orientation')
+    _name = _column_property('_names')
+    _parent = _column_property('_parents')
+    _group = _column_property('_groups')
+    _mirrored_joint = _column_property('_mirrored_joints')
+    _node = _column_property('_nodes')
+
+    def __init__(self, pool, index):
+        """ Constructor
+
+        Args:
+            pool (JointPool): The pool that stores the joint
+            index (int): The row of the joint in the pool
+        """
+        # the base constructors are skipped on purpose, they would allocate the per joint lists
+        self._pool = pool
+        self._index = index
+
+    def __repr__(self):
+        return 'JointData({0})'.format(self._name)
+
+    @property
+    def pool(self):
+        """ Gets the pool the joint is stored in
+
+        Returns:
+            JointPool
+        """
+        return self._pool
+
+    @property
+    def index(self):
+        """ Gets the row of the joint in the pool
+
+        Returns:
+            (int)
+        """
+        return self._index
+
+    @property
+    def _mirror(self):
+        return bool(self._pool._mirror[self._index])
+
+    @_mirror.setter
+    def _mirror(self, value):
+        self._pool._mirror[self._index] = 1 if value else 0
+
+    @property
+    def _children(self):
+        children = self._pool._children[self._index]
+
+        # empty children lists are only allocated when they are asked for
+        if children is None:
+            children = []
+            self._pool._children[self._index] = children
+
+        return children
+
+    @_children.setter
+    def _children(self, value):
+        self._pool._children[self._index] = list(value) if value else None
+
+    @property
+    def _custom_attributes(self):
+        return self._pool._custom_attributes.setdefault(self._index, dict())
+
+    @_custom_attributes.setter
+    def _custom_attributes(self, value):
+        if value:
+            self._pool._custom_attributes[self._index] = dict(value)
+        else:
+            self._pool._custom_attributes.pop(self._index, None)
+
+    def as_json(self):
+        """ Returns a dictionary to be saved out for jSON
+
+        Returns:
+            (dict)
+        """
+        return self._pool.row_as_json(self._index)
+
+    def from_json(self, data):
+        """ Loads data from a dictionary
+
+        Args:
+            data (dict): The dictionary data for the joint
+        """
+        self._pool.set_row_from_json(self._index, data)
+
+    def create(self, parent=None):
+        """ Create a joint based on the current data
+
+        The pool only stores data, so a full joint is created from the row and asked to create itself.
+
+        Args:
+            parent: The created parent node, or the name of the parent, defaults to the parent of the joint
+
+        Returns:
+            The created node
+        """
+        # import here to avoid a circular import with the joint factory
+        from joint_factory import SkeletonJoint
+
+        joint = SkeletonJoint()
+        joint.from_json(self.as_json())
+
+        self._node = joint.create(parent)
+
+        return self._node
+
+
+class JointPool(object):
+    """ Structure of arrays storage for joint data.
+
+    Every transform channel of every joint is stored in one contiguous block of doubles, three values
+    per joint, so the memory used per joint stays small and the channels can be processed in bulk.
+    """
+
+    def __init__(self):
+        """ Constructor
+        """
+        self._channels = dict((channel, array('d')) for channel in CHANNELS)
+        self._names = []
+        self._parents = []
+        self._groups = []
+        self._mirrored_joints = []
+        self._nodes = []
+        self._mirror = array('b')
+
+        # children lists and custom attributes are sparse, most joints do not need one
+        self._children = []
+        self._custom_attributes = dict()
+
+        self._views = []
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def __getitem__(self, index):
+        return self._views[index]
+
+    @classmethod
+    def from_joints(cls, joints):
+        """ Creates a pool holding a copy of the data of the given joints
+
+        Args:
+            joints (list(JointData)): The joints to copy
+
+        Returns:
+            JointPool
+        """
+        pool = cls()
+
+        for joint in joints:
+            pool.append(joint)
+
+        return pool
+
+    @classmethod
+    def from_columns(cls, channels, names, parents, groups, mirror, mirrored_joints, children, custom_attributes):
+        """ Creates a pool directly from per joint columns, without going through a dictionary per joint
+
+        Args:
+            channels (dict): The flat array('d') block for every channel in CHANNELS
+            names (list(str)): The name of every joint
+            parents (list(str)): The parent name of every joint
+            groups (list(str)): The group of every joint
+            mirror (array.array): The mirror flag of every joint as an array('b')
+            mirrored_joints (list(str)): The mirrored joint of every joint
+            children (list(list(str))): The children of every joint, None for a joint without children
+            custom_attributes (dict): The custom attributes keyed by the row of the joint
+
+        Returns:
+            JointPool
+        """
+        count = len(names)
+
+        for channel in CHANNELS:
+            if len(channels[channel]) != count * 3:
+                raise ValueError("The {0} channel does not match the number of joints.".format(channel))
+
+        pool = cls()
+        pool._channels = dict((channel, channels[channel]) for channel in CHANNELS)
+        pool._names = names
+        pool._parents = parents
+        pool._groups = groups
+        pool._mirror = mirror
+        pool._mirrored_joints = mirrored_joints
+        pool._children = children
+        pool._custom_attributes = custom_attributes
+        pool._nodes = [None] * count
+        pool._views = [PooledJointData(pool, index) for index in range(count)]
+
+        return pool
+
+    def append(self, joint=None):
+        """ Adds a new joint to the pool
+
+        Args:
+            joint (JointData): Optional joint to copy the data from
+
+        Returns:
+            PooledJointData: The view of the new joint
+        """
+        index = len(self._names)
+
+        for channel in CHANNELS:
+            self._channels[channel].extend(CHANNEL_DEFAULTS[channel])
+
+        self._names.append('')
+        self._parents.append(None)
+        self._groups.append('')
+        self._mirrored_joints.append(None)
+        self._nodes.append(None)
+        self._mirror.append(0)
+        self._children.append(None)
+
+        view = PooledJointData(self, index)
+        self._views.append(view)
+
+        if joint is not None:
+            view.from_json(joint.as_json())
+
+        return view
+
+    def remove(self, index):
+        """ Removes a joint from the pool, the views of the joints after it are moved down one row
+
+        Args:
+            index (int): The row of the joint to remove
+        """
+        for channel in CHANNELS:
+            del self._channels[channel][index * 3:index * 3 + 3]
+
+        for column in (self._names, self._parents, self._groups, self._mirrored_joints, self._nodes,
+                       self._mirror, self._children):
+            del column[index]
+
+        custom_attributes = dict()
+
+        for row, attributes in self._custom_attributes.items():
+            if row != index:
+                custom_attributes[row - 1 if row > index else row] = attributes
+
+        self._custom_attributes = custom_attributes
+
+        del self._views[index]
+
+        for row in range(index, len(self._views)):
+            self._views[row]._index = row
+
+    @property
+    def names(self):
+        """ Gets the name of every joint
+
+        Returns:
+            list(str)
+        """
+        return self._names
+
+    @property
+    def parents(self):
+        """ Gets the parent name of every joint
+
+        Returns:
+            list(str)
+        """
+        return self._parents
+
+    @property
+    def groups(self):
+        """ Gets the group of every joint
+
+        Returns:
+            list(str)
+        """
+        return self._groups
+
+    @property
+    def mirror_flags(self):
+        """ Gets the mirror flag of every joint
+
+        Returns:
+            array.array
+        """
+        return self._mirror
+
+    @property
+    def mirrored_joints(self):
+        """ Gets the mirrored joint of every joint
+
+        Returns:
+            list(str)
+        """
+        return self._mirrored_joints
+
+    @property
+    def children(self):
+        """ Gets the children of every joint, None for a joint without children
+
+        Returns:
+            list(list(str))
+        """
+        return self._children
+
+    @property
+    def custom_attributes(self):
+        """ Gets the custom attributes keyed by the row of the joint, joints without attributes are left out
+
+        Returns:
+            dict
+        """
+        return self._custom_attributes
+
+    def channel(self, channel):
+        """ Gets the flat block of values for a channel, three values per joint
+
+        Args:
+            channel (str): The channel name, ie. 'translation'
+
+        Returns:
+            array.array
+        """
+        return self._channels[_channel_key(channel)]
+
+    def channel_array(self, channel):
+        """ Gets a copy of a channel as an N x 3 numpy array, changing it does not change the pool
+
+        Args:
+            channel (str): The channel name, ie. 'translation'
+
+        Returns:
+            numpy.ndarray
+        """
+        return self._channel_view(channel).copy()
+
+    def _channel_view(self, channel):
+        """ Gets a channel as an N x 3 numpy array sharing memory with the pool
+
+        The view must not outlive the call that uses it, adding joints grows the array the view points at, which
+        raises a BufferError while a view is alive on Python 3 and leaves the view pointing at freed memory on
+        Python 2.
+
+        Args:
+            channel (str): The channel name, ie. 'translation'
+
+        Returns:
+            numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError("numpy is required to access the channels as arrays.")
+
+        values = self.channel(channel)
+
+        if not values:
+            return numpy.zeros((0, 3), dtype=numpy.float64)
+
+        return numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 3)
+
+    def get_vector(self, channel, index):
+        """ Gets the three values of a channel for a joint
+
+        Args:
+            channel (str): The channel name
+            index (int): The row of the joint
+
+        Returns:
+            list(float)
+        """
+        start = index * 3
+        return self._channels[_channel_key(channel)][start:start + 3].tolist()
+
+    def set_vector(self, channel, index, value):
+        """ Sets the three values of a channel for a joint
+
+        Args:
+            channel (str): The channel name
+            index (int): The row of the joint
+            value (list(float)): The three values to set
+        """
+        if value is None or len(value) != 3:
+            raise ValueError("Please pass three values for the {0} channel.".format(channel))
+
+        start = index * 3
+        self._channels[_channel_key(channel)][start:start + 3] = array('d', [float(v) for v in value])
+
+    def offset_channel(self, channel, offset):
+        """ Adds an offset to a channel of every joint in the pool
+
+        Args:
+            channel (str): The channel name
+            offset (list(float)): The three values to add
+        """
+        if numpy is not None:
+            self._channel_view(channel)[:] += offset
+            return
+
+        values = self.channel(channel)
+
+        for i in range(len(values)):
+            values[i] += offset[i % 3]
+
+    def scale_channel(self, channel, factor):
+        """ Multiplies a channel of every joint in the pool
+
+        Args:
+            channel (str): The channel name
+            factor (list(float)): The three values to multiply by
+        """
+        if numpy is not None:
+            self._channel_view(channel)[:] *= factor
+            return
+
+        values = self.channel(channel)
+
+        for i in range(len(values)):
+            values[i] *= factor[i % 3]
+
+    def row_as_json(self, index):
+        """ Returns the dictionary representation of a joint, matching JointData.as_json
+
+        Args:
+            index (int): The row of the joint
+
+        Returns:
+            (dict)
+        """
+        data = dict((channel, self.get_vector(channel, index)) for channel in CHANNELS)
+
+        data['_name'] = self._names[index]
+        data['_parent'] = self._parents[index]
+        data['_children'] = list(self._children[index] or [])
+        data['_group'] = self._groups[index]
+        data['_mirror'] = bool(self._mirror[index])
+        data['_mirrored_joint'] = self._mirrored_joints[index]
+        data['_custom_attributes'] = dict(self._custom_attributes.get(index, {}))
+        data['_node'] = None
+
+        return data
+
+    def set_row_from_json(self, index, data):
+        """ Sets the data of a joint from its dictionary representation
+
+        Args:
+            index (int): The row of the joint
+            data (dict): The dictionary data for the joint
+        """
+        for channel in CHANNELS:
+            self.set_vector(channel, index, data.get(channel, CHANNEL_DEFAULTS[channel]))
+
+        self._names[index] = data.get('_name', '')
+        self._parents[index] = data.get('_parent')
+        self._children[index] = list(data['_children']) if data.get('_children') else None
+        self._groups[index] = data.get('_group', '')
+        self._mirror[index] = 1 if data.get('_mirror') else 0
+        self._mirrored_joints[index] = data.get('_mirrored_joint')
+        self._nodes[index] = None
+
+        if data.get('_custom_attributes'):
+            self._custom_attributes[index] = dict(data['_custom_attributes'])
+        else:
+            self._custom_attributes.pop(index, None)
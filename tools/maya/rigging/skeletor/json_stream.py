@@ -0,0 +1,216 @@
+__all__ = ['iter_skeleton_json', 'filter_joints']
+
+# standard library imports
+import re
+import json
+import numbers
+
+WHITESPACE = re.compile(r'\s*')
+
+NUMBER_CHARACTERS = frozenset('0123456789.eE+-')
+
+_decoder = json.JSONDecoder()
+
+
+class _StreamBuffer(object):
+    """ A read buffer over a text file that decodes one JSON value at a time.
+    """
+
+    def __init__(self, data_file, chunk_size):
+        """ Constructor
+
+        Args:
+            data_file (file): The open file
+            chunk_size (int): The number of characters to read at a time
+        """
+        self._file = data_file
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def _read(self):
+        """ Reads the next chunk of the file, dropping the part of the buffer that was already decoded
+
+        Returns:
+            True if more data was read
+        """
+        if self._eof:
+            return False
+
+        chunk = self._file.read(self._chunk_size)
+
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+        return True
+
+    def peek(self):
+        """ Gets the next character that is not whitespace without consuming it
+
+        Returns:
+            (str) The character or an empty string at the end of the file
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._read():
+                return ''
+
+    def expect(self, characters):
+        """ Consumes the next character that is not whitespace
+
+        Args:
+            characters (str): The characters that are allowed
+
+        Returns:
+            (str) The consumed character
+        """
+        character = self.peek()
+
+        if not character or character not in characters:
+            raise ValueError('Expected one of {0!r} at character {1} but found {2!r}.'.format(
+                characters, self._position, character))
+
+        self._position += 1
+
+        return character
+
+    def decode(self):
+        """ Decodes the next JSON value, more of the file is read until the value is complete
+
+        Returns:
+            The decoded value
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+            except ValueError:
+                if not self._read():
+                    raise
+                continue
+
+            # a number at the end of the buffer might continue in the next chunk
+            if isinstance(value, numbers.Number) and (end == len(self._buffer) or
+                                                      self._buffer[end] in NUMBER_CHARACTERS) and self._read():
+                continue
+
+            self._position = end
+
+            return value
+
+
+def iter_skeleton_json(data_file, data=None, chunk_size=1 << 16):
+    """ Decodes the joints of a skeleton definition one at a time, without loading the whole file
+
+    Args:
+        data_file (file): The open definition file
+        data (dict): Filled with the other values of the definition, ie. the prefix, as they are read
+        chunk_size (int): The number of characters to read at a time
+
+    Yields:
+        dict: The data of every joint, in the order of the file
+    """
+    data = data if data is not None else dict()
+    stream = _StreamBuffer(data_file, chunk_size)
+
+    stream.expect('{')
+
+    if stream.peek() == '}':
+        return
+
+    while True:
+        key = stream.decode()
+        stream.expect(':')
+
+        if key == '_joints' and stream.peek() == '[':
+            stream.expect('[')
+
+            if stream.peek() == ']':
+                stream.expect(']')
+            else:
+                while True:
+                    yield stream.decode()
+
+                    if stream.expect(',]') == ']':
+                        break
+        else:
+            data[key] = stream.decode()
+
+        if stream.expect(',}') == '}':
+            return
+
+
+def filter_joints(joints, groups=None, prefix=None, root=None):
+    """ Keeps the joints of a subset of a skeleton while they are being read
+
+    Args:
+        joints (iterable(dict)): The joint data, ie. from iter_skeleton_json
+        groups (list(str)): Only keep the joints in these groups
+        prefix (str): Only keep the joints whose name starts with the prefix
+        root (str): Only keep this joint and the joints below it
+
+    Yields:
+        dict: The data of the joints in the subset
+    """
+    groups = set(groups) if groups else None
+
+    def matches(joint_data):
+        if groups is not None and joint_data.get('_group') not in groups:
+            return False
+
+        return not prefix or joint_data.get('_name', '').startswith(prefix)
+
+    if root is None:
+        for joint_data in joints:
+            if matches(joint_data):
+                yield joint_data
+
+        return
+
+    # only the names are kept of the joints outside of the subtree
+    seen = set()
+    included = set()
+
+    # joints whose parent has not been read yet, keyed by the parent name
+    pending = dict()
+
+    for joint_data in joints:
+        name = joint_data.get('_name')
+        parent = joint_data.get('_parent')
+
+        seen.add(name)
+
+        if name != root and parent not in included:
+            if parent and parent not in seen:
+                pending.setdefault(parent, []).append(joint_data)
+                continue
+
+            # the joint is outside of the subtree, and so are the joints waiting for it
+            stack = [name]
+
+            while stack:
+                stack.extend(child.get('_name') for child in pending.pop(stack.pop(), []))
+
+            continue
+
+        # the joints waiting for this one are released with it, parents first
+        stack = [joint_data]
+
+        while stack:
+            current = stack.pop()
+            included.add(current.get('_name'))
+
+            if matches(current):
+                yield current
+
+            stack.extend(reversed(pending.pop(current.get('_name'), [])))
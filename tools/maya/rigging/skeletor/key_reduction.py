@@ -0,0 +1,265 @@
+__all__ = ['DEFAULT_TOLERANCES', 'KeyReducer', 'ReductionReport', 'reduce_curve']
+
+# standard library imports
+import multiprocessing
+from array import array
+from timeit import default_timer
+
+# skeletor imports
+from animation import AnimationClip, AnimationCurve
+from joint_pool import _channel_key
+from ..Utils import process_map
+
+INFINITY = float('inf')
+
+# the largest difference a removed key may have on each value of a channel, in centimeters, degrees and scale
+DEFAULT_TOLERANCES = {
+    '_translation': 0.001,
+    '_rotation': 0.01,
+    '_scale': 0.0001,
+    '_orientation': 0.01,
+}
+
+
+def _max_error(curve, times, values):
+    """ Gets the largest difference between a curve and the keys it was reduced from
+
+    Args:
+        curve (AnimationCurve): The reduced curve
+        times (array.array): The times of the original keys
+        values (array.array): The values of the original keys, three per key
+
+    Returns:
+        (float)
+    """
+    if not times:
+        return 0.0
+
+    sampled = curve.sample(times)
+    return max(abs(a - b) for a, b in zip(sampled, values))
+
+
+def reduce_curve(curve, tolerance):
+    """ Removes the keys of a curve that are constant or on the line between their neighbours
+
+    A curve that stays within the tolerance of its first key is reduced to that key.  Otherwise every segment is
+    grown from the last kept key for as long as all of the keys it skips are within the tolerance of the line.
+
+    The keys a line from the last kept key may skip limit its slope on every axis to a corridor, so each key is only
+    checked against the lowest and highest slope allowed by the keys before it, and a curve is reduced in one pass.
+
+    Args:
+        curve (AnimationCurve): The curve to reduce, it is not changed
+        tolerance (float): The largest difference a removed key may have on any of its values
+
+    Returns:
+        (AnimationCurve, float) The reduced curve and the largest difference to the original keys
+    """
+    times = curve.times
+    values = curve.values
+    count = len(times)
+
+    if any(times[i] == times[i - 1] for i in range(1, count)):
+        # a key at the same time replaces the one before it, like AnimationCurve.add_key does, so no segment has a
+        # duration of zero
+        merged = [i for i in range(count) if i == count - 1 or times[i + 1] != times[i]]
+        merged_curve = AnimationCurve([times[i] for i in merged],
+                                      [value for i in merged for value in values[i * 3:i * 3 + 3]])
+
+        reduced, _ = reduce_curve(merged_curve, tolerance)
+        return reduced, _max_error(reduced, times, values)
+
+    if count <= 2:
+        return curve.copy(), 0.0
+
+    # constant curves are the most common in baked clips, they are found with one pass over the values
+    error = max(abs(value - values[i % 3]) for i, value in enumerate(values))
+
+    if error <= tolerance:
+        return AnimationCurve(times[:1], values[:3]), error
+
+    kept = [0]
+    anchor_time = times[0]
+    anchor_values = values[0:3]
+    low = [-INFINITY] * 3
+    high = [INFINITY] * 3
+    index = 1
+
+    while index < count:
+        duration = times[index] - anchor_time
+        offset = index * 3
+        slopes = [(values[offset + i] - anchor_values[i]) / duration for i in range(3)]
+
+        if all(low[i] <= slopes[i] <= high[i] for i in range(3)):
+            # the key is skipped by the lines to the keys after it, so they have to pass within its tolerance
+            for i in range(3):
+                low[i] = max(low[i], (values[offset + i] - tolerance - anchor_values[i]) / duration)
+                high[i] = min(high[i], (values[offset + i] + tolerance - anchor_values[i]) / duration)
+
+            index += 1
+            continue
+
+        # the line to this key misses a skipped key, so the segment ends at the key before it, the key after a
+        # kept key always fits, so index is checked again against the new anchor
+        anchor = index - 1
+        kept.append(anchor)
+
+        anchor_time = times[anchor]
+        anchor_values = values[anchor * 3:anchor * 3 + 3]
+        low = [-INFINITY] * 3
+        high = [INFINITY] * 3
+
+    kept.append(count - 1)
+
+    reduced_values = array('d')
+
+    for index in kept:
+        reduced_values.extend(values[index * 3:index * 3 + 3])
+
+    reduced = AnimationCurve([times[index] for index in kept], reduced_values)
+
+    return reduced, _max_error(reduced, times, values)
+
+
+def _reduce_clip(args):
+    """ Reduces a clip, this runs in the worker processes
+
+    Args:
+        args (tuple): The packed clip or None, the path to the saved clip or None, and the tolerances
+
+    Returns:
+        (bytes, ReductionReport) The packed reduced clip and the report
+    """
+    packed, path, tolerances = args
+    clip = AnimationClip.unpack(packed) if packed is not None else AnimationClip.load(path)
+
+    reduced, report = KeyReducer(tolerances).reduce(clip)
+
+    # the packed clip is much smaller to send back than the pickled curves
+    return reduced.pack(), report
+
+
+class ReductionReport(object):
+    """ The result of reducing the keys of a clip.
+    """
+
+    def __init__(self, name=''):
+        """ Constructor
+
+        Args:
+            name (str): The name of the clip
+        """
+        self.name = name
+        self.keys_before = 0
+        self.keys_after = 0
+        self.curves = 0
+        self.constant_curves = 0
+        self.channel_errors = dict()
+        self.time = 0.0
+
+    def __str__(self):
+        return '{0}: {1} to {2} keys ({3:.1f}x), {4} of {5} curves constant, max error {6:.6f}, {7:.3f}s'.format(
+            self.name, self.keys_before, self.keys_after, self.compression_ratio, self.constant_curves, self.curves,
+            self.max_error, self.time)
+
+    @property
+    def compression_ratio(self):
+        """ Gets how many times fewer keys the reduced clip has
+
+        Returns:
+            (float)
+        """
+        return self.keys_before / float(self.keys_after) if self.keys_after else 1.0
+
+    @property
+    def max_error(self):
+        """ Gets the largest difference between the reduced clip and the original keys in any channel
+
+        Returns:
+            (float)
+        """
+        return max(self.channel_errors.values()) if self.channel_errors else 0.0
+
+
+class KeyReducer(object):
+    """ Removes the constant and linearly interpolated keys of captured clips within a tolerance per channel.
+    """
+
+    def __init__(self, tolerances=None):
+        """ Constructor
+
+        Args:
+            tolerances (dict): The channel name, ie. 'rotation', to the largest allowed difference, the channels that
+                are not given use DEFAULT_TOLERANCES
+        """
+        self._tolerances = dict(DEFAULT_TOLERANCES)
+
+        for channel, tolerance in (tolerances or {}).items():
+            if tolerance < 0:
+                raise ValueError("Please pass a tolerance of 0 or more for {0}.".format(channel))
+
+            self._tolerances[_channel_key(channel)] = float(tolerance)
+
+    @property
+    def tolerances(self):
+        """ Gets the tolerance of every channel
+
+        Returns:
+            dict
+        """
+        return dict(self._tolerances)
+
+    def reduce(self, clip):
+        """ Reduces every curve of a clip
+
+        Args:
+            clip (AnimationClip): The clip to reduce, it is not changed
+
+        Returns:
+            (AnimationClip, ReductionReport) The reduced clip and what was removed
+        """
+        start = default_timer()
+
+        reduced = AnimationClip(clip.name, clip.frame_rate)
+        report = ReductionReport(clip.name)
+
+        for joint, channel, curve in clip:
+            reduced_curve, error = reduce_curve(curve, self._tolerances[channel])
+            reduced.set_curve(joint, channel, reduced_curve)
+
+            report.curves += 1
+            report.keys_before += len(curve)
+            report.keys_after += len(reduced_curve)
+            report.constant_curves += len(reduced_curve) == 1
+            report.channel_errors[channel] = max(error, report.channel_errors.get(channel, 0.0))
+
+        report.time = default_timer() - start
+
+        return reduced, report
+
+    def reduce_clips(self, clips, workers=1):
+        """ Reduces several clips, in parallel when more than one worker is used
+
+        Args:
+            clips (list): The AnimationClip objects or the paths to the saved clips
+            workers (int): The number of processes to reduce with, None uses one per CPU
+
+        Returns:
+            list((AnimationClip, ReductionReport)) The reduced clip and the report of every clip, in the order they
+                were passed
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+
+        if workers <= 1 or len(clips) <= 1:
+            return [self.reduce(clip if isinstance(clip, AnimationClip) else AnimationClip.load(clip))
+                    for clip in clips]
+
+        # the clips are sent packed, the workers unpack them again
+        tasks = [(clip.pack(), None, self._tolerances) if isinstance(clip, AnimationClip) else
+                 (None, clip, self._tolerances) for clip in clips]
+
+        # the workers are new mayapy processes instead of forks of this session, the results keep the order
+        results = process_map(_reduce_clip, tasks, workers)
+
+        return [(AnimationClip.unpack(packed), report) for packed, report in results]
@@ -0,0 +1,315 @@
+__all__ = ['ForwardKinematics', 'local_matrix', 'multiply_matrices']
+
+# standard library imports
+import math
+from itertools import groupby
+
+try:
+    # numpy is optional, without it the matrices are computed one joint at a time
+    import numpy
+except ImportError:
+    numpy = None
+
+IDENTITY = ((1.0, 0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0, 0.0),
+            (0.0, 0.0, 1.0, 0.0),
+            (0.0, 0.0, 0.0, 1.0))
+
+SPACES = ('local', 'world')
+
+
+def _rotation_matrix(rotation):
+    """ Gets the 3 x 3 matrix of an xyz euler rotation, using Maya's row vector convention
+
+    Args:
+        rotation (list(float)): The rotation in degrees
+
+    Returns:
+        list(list(float))
+    """
+    sx, sy, sz = [math.sin(math.radians(value)) for value in rotation]
+    cx, cy, cz = [math.cos(math.radians(value)) for value in rotation]
+
+    # Rx * Ry * Rz
+    return [[cy * cz, cy * sz, -sy],
+            [sx * sy * cz - cx * sz, sx * sy * sz + cx * cz, sx * cy],
+            [cx * sy * cz + sx * sz, cx * sy * sz - sx * cz, cx * cy]]
+
+
+def multiply_matrices(a, b):
+    """ Multiplies two square matrices stored as lists of rows
+
+    Args:
+        a (list(list(float))): The left matrix
+        b (list(list(float))): The right matrix
+
+    Returns:
+        list(list(float))
+    """
+    columns = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, column)) for column in columns] for row in a]
+
+
+def local_matrix(translation, rotation, scale, orientation=(0.0, 0.0, 0.0)):
+    """ Composes the 4 x 4 local matrix of a joint as scale * rotation * joint orient * translation
+
+    Args:
+        translation (list(float)): The translation
+        rotation (list(float)): The xyz rotation in degrees
+        scale (list(float)): The scale
+        orientation (list(float)): The joint orient in degrees
+
+    Returns:
+        list(list(float))
+    """
+    linear = multiply_matrices(_rotation_matrix(rotation), _rotation_matrix(orientation))
+
+    matrix = [[value * scale[row] for value in linear[row]] + [0.0] for row in range(3)]
+    matrix.append([float(value) for value in translation] + [1.0])
+
+    return matrix
+
+
+def _rotation_matrices(rotations):
+    """ Gets the 3 x 3 matrices of an N x 3 array of xyz euler rotations
+
+    Args:
+        rotations (numpy.ndarray): The rotations in degrees
+
+    Returns:
+        numpy.ndarray: An N x 3 x 3 array
+    """
+    radians = numpy.radians(rotations)
+    sx, sy, sz = numpy.sin(radians).T
+    cx, cy, cz = numpy.cos(radians).T
+
+    matrices = numpy.empty((len(rotations), 3, 3))
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = cy * sz
+    matrices[:, 0, 2] = -sy
+    matrices[:, 1, 0] = sx * sy * cz - cx * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = sx * cy
+    matrices[:, 2, 0] = cx * sy * cz + sx * sz
+    matrices[:, 2, 1] = cx * sy * sz - sx * cz
+    matrices[:, 2, 2] = cx * cy
+
+    return matrices
+
+
+class ForwardKinematics(object):
+    """ Computes the world matrices of the joints of a skeleton outside of Maya.
+
+    The matrices use Maya's row vector convention, the translation is stored in the last row and a world matrix is
+    the local matrix multiplied by the world matrix of the parent.  With numpy every level of the hierarchy is
+    computed in one batch, otherwise one joint at a time.
+    """
+
+    def __init__(self, skeleton, space='local'):
+        """ Constructor
+
+        Args:
+            skeleton (Skeleton): The skeleton to evaluate
+            space (str): 'local' when the joint channels are relative to the parent, 'world' when they already are
+                world values, as captured by MayaSkeleton.from_selection, in which case the joint orient is
+                part of the rotation and the parents are not used
+        """
+        if space not in SPACES:
+            raise ValueError("Please pass 'local' or 'world' as the space.")
+
+        self._skeleton = skeleton
+        self._space = space
+        self._matrices = None
+
+    def evaluate(self):
+        """ Computes the world matrices of all of the joints
+
+        Returns:
+            numpy.ndarray or list: An N x 4 x 4 array, or a list of 4 x 4 lists without numpy, in the order of the
+            joints of the skeleton
+        """
+        index = self._skeleton.index
+        count = len(index)
+
+        if numpy is not None:
+            self._matrices = numpy.tile(numpy.identity(4), (count, 1, 1))
+        else:
+            self._matrices = [[list(row) for row in IDENTITY] for _ in range(count)]
+
+        # joints in a parenting cycle are not in the topological order and keep an identity matrix
+        self._compose(list(index.topological_indices()))
+
+        return self._matrices
+
+    def update(self, name):
+        """ Recomputes the world matrices of a joint and of the joints below it, use after changing the joint
+
+        Args:
+            name (str): The name of the changed joint
+
+        Returns:
+            list(int): The indices of the joints that were updated
+        """
+        if self._matrices is None:
+            self.evaluate()
+            return list(self._skeleton.index.topological_indices())
+
+        index = self._skeleton.index
+        joint_index = index.index_of(name)
+
+        if joint_index < 0:
+            raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+        if self._space == 'world':
+            indices = [joint_index]
+        else:
+            # depth first, so parents still come before their children
+            indices = [joint_index] + index.descendant_indices(joint_index)
+
+        self._compose(indices)
+
+        return indices
+
+    def _compose(self, indices):
+        """ Computes the world matrices of a list of joints, every parent comes before its children
+
+        Args:
+            indices (list(int)): The indices of the joints
+        """
+        if not indices:
+            return
+
+        index = self._skeleton.index
+
+        if numpy is None:
+            for joint_index in indices:
+                joint = index.joints[joint_index]
+                orientation = joint.orientation if self._space == 'local' else (0.0, 0.0, 0.0)
+                matrix = local_matrix(joint.translation, joint.rotation, joint.scale, orientation)
+
+                parent_index = index.parent_index(joint_index)
+
+                if self._space == 'local' and parent_index >= 0:
+                    matrix = multiply_matrices(matrix, self._matrices[parent_index])
+
+                self._matrices[joint_index] = matrix
+
+            return
+
+        local = self._local_matrices(indices)
+
+        if self._space == 'world':
+            self._matrices[indices] = local
+            return
+
+        positions = dict((joint_index, i) for i, joint_index in enumerate(indices))
+
+        # the joints of one level only depend on the levels above, so each level is one batched multiply
+        by_depth = sorted(indices, key=index.depth)
+
+        for depth, level in groupby(by_depth, key=index.depth):
+            level = list(level)
+            level_local = local[[positions[joint_index] for joint_index in level]]
+
+            if depth == 0:
+                self._matrices[level] = level_local
+            else:
+                parents = [index.parent_index(joint_index) for joint_index in level]
+                self._matrices[level] = numpy.matmul(level_local, self._matrices[parents])
+
+    def _local_matrices(self, indices):
+        """ Computes the local matrices of a list of joints in one batch
+
+        Args:
+            indices (list(int)): The indices of the joints
+
+        Returns:
+            numpy.ndarray: An N x 4 x 4 array
+        """
+        translation = self._channel('_translation', indices)
+        rotation = self._channel('_rotation', indices)
+        scale = self._channel('_scale', indices)
+
+        linear = _rotation_matrices(rotation)
+
+        if self._space == 'local':
+            linear = numpy.matmul(linear, _rotation_matrices(self._channel('_orientation', indices)))
+
+        matrices = numpy.zeros((len(indices), 4, 4))
+        matrices[:, :3, :3] = linear * scale[:, :, numpy.newaxis]
+        matrices[:, 3, :3] = translation
+        matrices[:, 3, 3] = 1.0
+
+        return matrices
+
+    def _channel(self, channel, indices):
+        """ Gathers a channel of a list of joints in to an N x 3 array
+
+        Args:
+            channel (str): The name of the channel, ie. '_translation'
+            indices (list(int)): The indices of the joints
+
+        Returns:
+            numpy.ndarray
+        """
+        joints = self._skeleton.index.joints
+        pool = self._skeleton.pool
+
+        if pool is not None:
+            # read straight from the pool instead of going through every joint
+            return pool.channel_array(channel)[[joints[i].index for i in indices]]
+
+        return numpy.array([getattr(joints[i], channel) for i in indices], dtype=numpy.float64).reshape(-1, 3)
+
+    def world_matrix(self, name):
+        """ Gets the world matrix of a joint
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            list(list(float)): The 4 x 4 matrix
+        """
+        if self._matrices is None:
+            self.evaluate()
+
+        joint_index = self._skeleton.index.index_of(name)
+
+        if joint_index < 0:
+            raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+        matrix = self._matrices[joint_index]
+
+        return matrix.tolist() if numpy is not None else [list(row) for row in matrix]
+
+    def world_translation(self, name):
+        """ Gets the world position of a joint
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            list(float)
+        """
+        return self.world_matrix(name)[3][:3]
+
+    @property
+    def matrices(self):
+        """ Gets the world matrices of all of the joints, they are computed the first time they are needed
+
+        Returns:
+            numpy.ndarray or list
+        """
+        if self._matrices is None:
+            self.evaluate()
+
+        return self._matrices
+
+    @property
+    def space(self):
+        """ Gets whether the joint channels are local or world values
+
+        Returns:
+            (str)
+        """
+        return self._space
@@ -1,12 +1,11 @@
 __all__ = ['MayaJointData']
 
 # skeletor imports
-from ..Utils import using_maya
+from ..Utils import using_maya, lazy_import
 from joint_data import JointData
 
-if using_maya():
-    # maya imports
-    import pymel.core as pm
+# maya imports, PyMel is only imported when a Maya joint is used
+pm = lazy_import('pymel.core')
 
 
 class MayaJointData(JointData):
@@ -121,12 +120,29 @@ class MayaJointData(JointData):
         self._parent = value
 
         if self._node:
-            self._node.setParent(value)
+            # an empty parent moves the joint to the world
+            self._node.setParent(value if value else None)
 
-    def create(self):
+    def create(self, parent=None):
         """ Creates the current joint in the scene
+
+        Args:
+            parent (PyNode or str): The created parent node, or the name of the parent, defaults to the parent of the joint
+
+        Returns:
+            PyNode
         """
+        if parent is None:
+            parent = self._parent
 
-        parent = self._parent if self._parent and pm.objExists(self._parent) else None
+        # only parents given by name have to be looked up in the scene
+        if isinstance(parent, basestring):
+            parent = parent if parent and pm.objExists(parent) else None
+
+        # joints are created under the selection, so make sure root joints are not
+        if parent is None:
+            pm.select(cl=True)
 
         self._node = pm.joint(parent, n=self._name, p=self._translation, o=self._orientation)
+
+        return self._node
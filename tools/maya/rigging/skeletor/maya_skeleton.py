@@ -1,38 +1,365 @@
 __all__ = ['MayaSkeleton']
 
+# standard library imports
+import math
+from array import array
+from collections import OrderedDict
+
 # skeletor imports
 from skeleton import Skeleton
-from ..Utils import using_maya
+from animation import ANIMATED_CHANNELS
+from ..Utils import lazy_import
 from joint_factory import SkeletonJoint
 
-if using_maya():
-    # maya imports
-    import pymel.core as pm
+# maya imports, they are only imported when a Maya skeleton is used
+pm = lazy_import('pymel.core')
+cmds = lazy_import('maya.cmds')
+om = lazy_import('maya.api.OpenMaya')
+oma = lazy_import('maya.api.OpenMayaAnim')
 
 
 class MayaSkeleton(Skeleton):
-    def __init__(self, prefix=''):
+    def __init__(self, prefix='', pooled=False):
         """ Constructor
+
+        Args:
+            prefix (str): The prefix for the skeleton
+            pooled (bool): Store the joint data in a JointPool instead of one object per joint
         """
-        super(MayaSkeleton, self).__init__(prefix)
+        super(MayaSkeleton, self).__init__(prefix, pooled)
 
     def build(self):
-        """ Builds the skeleton
+        """ Builds the skeleton as a single undo step
+
+        Returns:
+            BuildReport: The created nodes and the time spent in each phase of the build
+        """
+        pm.undoInfo(openChunk=True)
+
+        try:
+            return super(MayaSkeleton, self).build()
+        finally:
+            pm.undoInfo(closeChunk=True)
+
+    def apply_diff(self, diff):
+        """ Changes the joints in the scene to match the target of a diff as a single undo step, the joints that did
+        not change are not touched, so skin bindings stay intact
+
+        Args:
+            diff (SkeletonDiff): The changes to apply, from Skeleton.diff
+
+        Returns:
+            dict: The created node of every added joint
+        """
+        pm.undoInfo(openChunk=True)
+
+        try:
+            return super(MayaSkeleton, self).apply_diff(diff)
+        finally:
+            pm.undoInfo(closeChunk=True)
+
+    def move_joints(self, moved):
+        """ Changes the transform channels of joints and moves their nodes
+
+        The translation and rotation of the joints are world values, ie. from capture_scene, so the nodes are moved
+        in world space, and the children of the moved joints that did not change are put back where they were.
+
+        Args:
+            moved (dict): The name of every joint to the channels to change and their values
+        """
+        index = self.index
+
+        # parents first, so moving a parent does not undo the world values of its moved children
+        joints = []
+
+        for name in sorted(moved, key=lambda joint_name: index.depth(index.index_of(joint_name))):
+            joint = self.find(name)
+
+            for channel, value in moved[name].items():
+                # only the data is set here, the joint setters would move the node in local space
+                setattr(joint, channel, value)
+
+            joints.append(joint)
+            joints.extend(child for child in (self.find(child_name) for child_name in joint.children
+                                              if child_name not in moved) if child is not None)
+
+        for joint in joints:
+            if joint._node is None or not cmds.objExists(str(joint._node)):
+                continue
+
+            node = str(joint._node)
+            channels = moved.get(joint.name, {})
+
+            if '_orientation' in channels:
+                cmds.setAttr(node + '.jointOrient', *joint.orientation)
+
+            if '_scale' in channels:
+                cmds.xform(node, s=joint.scale)
+
+            # the orientation and the parent change the world rotation, so the world values are always set again
+            cmds.xform(node, ws=True, ro=joint.rotation)
+            cmds.xform(node, ws=True, t=joint.translation)
+
+    def remove_joints(self, names):
+        """ Removes several joints from the skeleton and deletes them from the scene, the children of the joints are
+        moved up to their parents
+
+        Args:
+            names (list(str)): The names of the joints to remove
+
+        Returns:
+            list(JointData): The removed joints
+        """
+        nodes = [joint._node for joint in (self.find(name) for name in names) if joint is not None]
+        nodes = [node for node in nodes if node is not None]
+
+        if self.pooled:
+            for node in nodes:
+                if not pm.objExists(node):
+                    continue
+
+                # the setters of pooled joints do not touch the scene, so the children are moved up here
+                children = cmds.listRelatives(str(node), children=True, type='joint', fullPath=True)
+                parent = cmds.listRelatives(str(node), parent=True, fullPath=True)
+
+                if children:
+                    if parent:
+                        cmds.parent(children, parent[0])
+                    else:
+                        cmds.parent(children, world=True)
+
+        removed = super(MayaSkeleton, self).remove_joints(names)
+
+        for node in nodes:
+            if pm.objExists(node):
+                pm.delete(node)
+
+        return removed
+
+    def reparent(self, name, parent_name):
+        """ Changes the parent of a joint and of its node
+
+        Args:
+            name (str): The name of the joint to reparent
+            parent_name (str): The name of the new parent, an empty string to make it a root joint
+        """
+        super(MayaSkeleton, self).reparent(name, parent_name)
+
+        node = self.find(name)._node
+
+        if not self.pooled or node is None or not pm.objExists(node):
+            # the parent setter of a joint that is not pooled already moved its node
+            return
+
+        parent = self.find(parent_name) if parent_name else None
+        parent_node = str(parent._node) if parent is not None and parent._node is not None else parent_name
+
+        parents = cmds.ls(parent_node, long=True) if parent_node else []
+        current = cmds.listRelatives(str(node), parent=True, fullPath=True)
+
+        if parents and (not current or current[0] != parents[0]):
+            cmds.parent(str(node), parents[0])
+        elif not parents and current:
+            # an empty parent or one that is not in the scene moves it to the world, like the joint setters do
+            cmds.parent(str(node), world=True)
+
+    def capture_scene(self):
+        """ Captures the joints in the scene that have the names of the joints of this skeleton, and every joint
+        below the roots of the skeleton
+
+        Returns:
+            MayaSkeleton: The skeleton as it is in the scene, compare it with diff and update it with apply_diff
+        """
+        scene_skeleton = MayaSkeleton(self.prefix)
+
+        names = [joint.name for joint in self.joints]
+        roots = cmds.ls([joint.name for joint in self.roots()], type='joint', long=True)
+
+        nodes = set(cmds.ls(names, type='joint', long=True)) if names else set()
+        nodes.update(self._walk(roots) if roots else [])
+
+        if nodes:
+            scene_skeleton._capture(sorted(nodes, key=lambda node: (node.count('|'), node)))
+
+        return scene_skeleton
+
+    def create_level(self, joints, parents):
+        """ Creates one level of the hierarchy
+
+        Args:
+            joints (list(JointData)): The joints to create
+            parents (list): The created parent node, or the name of a parent outside of the skeleton, for each joint
+
+        Returns:
+            list(PyNode): The created node for each joint
         """
+        # resolve the parents outside of the skeleton with one query for the whole level
+        external = set(parent for parent in parents if isinstance(parent, basestring))
+        existing = set(node.name() for node in pm.ls(list(external))) if external else set()
 
-        super(MayaSkeleton, self).build()
+        parents = [(parent if parent in existing else None) if isinstance(parent, basestring) else parent
+                   for parent in parents]
 
+        return super(MayaSkeleton, self).create_level(joints, parents)
+
+    def finalize_build(self):
+        """ Clears the selection left behind by the joint creation
+        """
         pm.select(cl=True)
 
-    def from_selection(self):
+    def sample_pose(self, frame=None, channels=ANIMATED_CHANNELS):
+        """ Gets the pose of every joint in the scene at a frame, each channel is queried for all of the joints at once
+
+        Args:
+            frame (float): The frame to evaluate the scene at, None reads the current frame
+            channels (list(str)): The channels to read, ie. '_translation'
+
+        Returns:
+            dict: The channel to a flat array of three values per joint, in the order of the joints
+        """
+        if frame is not None:
+            cmds.currentTime(frame, update=True)
+
+        nodes = [str(joint._node) if joint._node is not None else joint.name for joint in self.joints]
+
+        # the translation and rotation are world values like the captured joints, the scale is relative to the parent
+        flags = {'_translation': {'ws': True, 't': True}, '_rotation': {'ws': True, 'ro': True},
+                 '_scale': {'os': True, 'r': True, 's': True}}
+
+        pose = dict()
+
+        for channel in channels:
+            if channel == '_orientation':
+                pose[channel] = array('d', [value for orientation in self._joint_orients(nodes)
+                                            for value in orientation])
+                continue
+
+            values = cmds.xform(nodes, q=True, **flags[channel]) if nodes else []
+
+            if len(values) != len(nodes) * 3:
+                # older versions of Maya only query the first node
+                values = [value for node in nodes for value in cmds.xform(node, q=True, **flags[channel])]
+
+            pose[channel] = array('d', values)
+
+        return pose
+
+    def from_selection(self, hierarchy=False):
         """ Initializes the skeleton data based on the currently selected joints
+
+        Args:
+            hierarchy (bool): Also capture every joint below the selected joints
+        """
+        nodes = cmds.ls(sl=True, type='joint', long=True)
+
+        if not nodes:
+            return
+
+        self._capture(self._walk(nodes) if hierarchy else nodes)
+
+    def from_hierarchy(self, root):
+        """ Initializes the skeleton data from a root joint and every joint below it, without using the selection
+
+        Args:
+            root (str): The name of the root joint
+        """
+        roots = cmds.ls(root, type='joint', long=True)
+
+        if not roots:
+            raise ValueError("Unable to find joint {0} in the scene.".format(root))
+
+        self._capture(self._walk(roots))
+
+    @staticmethod
+    def _walk(roots):
+        """ Gets the roots and every joint below them, parents before their children
+
+        Args:
+            roots (list(str)): The long names of the root joints
+
+        Returns:
+            list(str): The long names of the joints
         """
+        nodes = set(roots)
+        nodes.update(cmds.listRelatives(roots, allDescendents=True, type='joint', fullPath=True) or [])
 
-        selection_list = pm.ls(sl=True, type='joint')
+        # a long name always has fewer separators than the long names of the joints below it
+        return sorted(nodes, key=lambda node: (node.count('|'), node))
+
+    def _capture(self, nodes):
+        """ Adds the joints to the skeleton with a few batched queries instead of several queries per joint
+
+        Args:
+            nodes (list(str)): The long names of the joints
+        """
+        # every result is keyed by the long name, so a node that is passed twice or no longer exists is skipped
+        # instead of shifting the data of the joints after it
+        py_nodes = dict((py_node.longName(), py_node) for py_node in pm.ls(nodes, type='joint'))
+        nodes = [node for node in OrderedDict.fromkeys(nodes) if node in py_nodes]
 
-        if not selection_list:
+        if not nodes:
             return
 
-        for node in selection_list:
-            if isinstance(node, pm.nodetypes.Joint):
-                self._joints.append(SkeletonJoint(node))
+        names = [py_nodes[node].name() for node in nodes]
+
+        translations = cmds.xform(nodes, q=True, ws=True, t=True)
+        rotations = cmds.xform(nodes, q=True, ws=True, ro=True)
+
+        if len(translations) != len(nodes) * 3 or len(rotations) != len(nodes) * 3:
+            # older versions of Maya only query the first node
+            translations = [value for node in nodes for value in cmds.xform(node, q=True, ws=True, t=True)]
+            rotations = [value for node in nodes for value in cmds.xform(node, q=True, ws=True, ro=True)]
+
+        orientations = self._joint_orients(nodes)
+
+        # the parents and children are found from the long names, only joints outside of the capture are queried
+        short_names = dict(zip(nodes, names))
+        parents = [node.rsplit('|', 1)[0] for node in nodes]
+
+        outside = list(set(parent for parent in parents if parent and parent not in short_names))
+        outside = cmds.ls(outside, type='joint', long=True) if outside else []
+
+        if outside:
+            short_names.update(zip(outside, cmds.ls(outside)))
+
+        child_nodes = cmds.listRelatives(nodes, children=True, type='joint', fullPath=True) or []
+        children = dict()
+
+        for child_node, child_name in zip(child_nodes, cmds.ls(child_nodes) if child_nodes else []):
+            children.setdefault(child_node.rsplit('|', 1)[0], []).append(child_name)
+
+        for i, node in enumerate(nodes):
+            joint = SkeletonJoint()
+
+            joint._node = py_nodes[node]
+            joint._name = names[i]
+            joint._translation = translations[i * 3:i * 3 + 3]
+            joint._rotation = rotations[i * 3:i * 3 + 3]
+            joint._orientation = orientations[i]
+            joint._parent = short_names.get(parents[i], '')
+            joint._children = children.get(node, [])
+
+            self.add_joint(joint)
+
+    @staticmethod
+    def _joint_orients(nodes):
+        """ Gets the joint orient of the joints through the API, without a command per joint
+
+        Args:
+            nodes (list(str)): The long names of the joints
+
+        Returns:
+            list(list(float)): The joint orient of every joint in degrees
+        """
+        orientations = dict()
+
+        for node in set(nodes):
+            # a selection list merges the nodes it already holds, so every node gets its own
+            selection = om.MSelectionList()
+            selection.add(node)
+
+            # the orientation is a quaternion, the joint orient attribute is its euler rotation
+            rotation = oma.MFnIkJoint(selection.getDagPath(0)).orientation().asEulerRotation()
+            orientations[node] = [math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z)]
+
+        return [orientations[node] for node in nodes]
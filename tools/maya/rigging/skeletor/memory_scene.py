@@ -0,0 +1,341 @@
+__all__ = ['InMemoryScene']
+
+# standard library imports
+import re
+from array import array
+
+# skeletor imports
+from scene_backend import SceneBackend
+
+CHANNELS = ('_translation', '_rotation', '_orientation', '_scale')
+
+DEFAULTS = {'_translation': (0.0, 0.0, 0.0), '_rotation': (0.0, 0.0, 0.0), '_orientation': (0.0, 0.0, 0.0),
+            '_scale': (1.0, 1.0, 1.0)}
+
+TRAILING_NUMBER = re.compile(r'\d+$')
+
+
+class InMemoryScene(SceneBackend):
+    """ A scene that only exists in memory, to build and capture skeletons without Maya.
+
+    Nodes are integer ids in to flat arrays, so a scene of hundreds of thousands of joints stays a few arrays
+    instead of an object per joint.  Names are unique, like the short names of a Maya scene they get a number
+    added or increased when they are taken, and are looked up through a dictionary.  The channels are stored as
+    they are set, there is no world space.
+    """
+
+    def __init__(self):
+        """ Constructor
+        """
+        self._names = []
+        self._lookup = dict()
+        self._parents = array('i')
+        self._children = []
+        self._channels = dict((channel, array('d')) for channel in CHANNELS)
+        self._selection = []
+        self._count = 0
+
+        # the next number to try for a name that is taken, keyed by the name without its number
+        self._suffixes = dict()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, name):
+        return name in self._lookup
+
+    def _unique_name(self, name):
+        """ Gets a name that is not taken, the number at the end of the name is increased until it is free
+
+        Args:
+            name (str): The requested name
+
+        Returns:
+            (str)
+        """
+        if name not in self._lookup:
+            return name
+
+        base = TRAILING_NUMBER.sub('', name)
+        number = self._suffixes.get(base, 1)
+
+        while '{0}{1}'.format(base, number) in self._lookup:
+            number += 1
+
+        self._suffixes[base] = number + 1
+
+        return '{0}{1}'.format(base, number)
+
+    def _check(self, node):
+        """ Makes sure a node exists
+
+        Args:
+            node (int): The node
+
+        Returns:
+            (int) The node
+        """
+        if node is None or node < 0 or node >= len(self._names) or self._names[node] is None:
+            raise ValueError('Node {0} does not exist in the scene.'.format(node))
+
+        return node
+
+    def create_joints(self, names, parents, channels):
+        """ Creates joints in the scene
+
+        Args:
+            names (list(str)): The name of every joint, a name that is taken gets a number added
+            parents (list(int)): The parent node of every joint, None for a joint in the world
+            channels (dict): The channel name, ie. '_translation', to the value of every joint
+
+        Returns:
+            list(int): The created nodes
+        """
+        first = len(self._names)
+        count = len(names)
+
+        for parent in parents:
+            if parent is not None:
+                self._check(parent)
+
+        # the values are checked before anything is added, so a bad value does not leave half a joint behind
+        columns = dict()
+
+        for channel in CHANNELS:
+            values = channels.get(channel)
+
+            if values is None:
+                columns[channel] = array('d', DEFAULTS[channel] * count)
+                continue
+
+            column = array('d', [value for vector in values for value in vector])
+
+            if len(values) != count or len(column) != count * 3:
+                raise ValueError('Please pass three values of {0} for every joint.'.format(channel))
+
+            columns[channel] = column
+
+        for channel, column in columns.items():
+            self._channels[channel].extend(column)
+
+        nodes = list(range(first, first + count))
+
+        for node, name, parent in zip(nodes, names, parents):
+            name = self._unique_name(name)
+
+            self._names.append(name)
+            self._lookup[name] = node
+            self._parents.append(parent if parent is not None else -1)
+            self._children.append([])
+
+            if parent is not None:
+                self._children[parent].append(node)
+
+        self._count += count
+
+        return nodes
+
+    def find(self, names):
+        """ Gets the nodes with the given names
+
+        Args:
+            names (list(str)): The names of the nodes
+
+        Returns:
+            list(int): The node for every name, None for the names that are not in the scene
+        """
+        lookup = self._lookup
+        return [lookup.get(name) for name in names]
+
+    def names(self, nodes):
+        """ Gets the names of nodes
+
+        Args:
+            nodes (list(int)): The nodes
+
+        Returns:
+            list(str)
+        """
+        return [self._names[self._check(node)] for node in nodes]
+
+    def parents(self, nodes):
+        """ Gets the parents of nodes
+
+        Args:
+            nodes (list(int)): The nodes
+
+        Returns:
+            list(int): The parent node of every node, None for the nodes in the world
+        """
+        parents = [self._parents[self._check(node)] for node in nodes]
+        return [parent if parent >= 0 else None for parent in parents]
+
+    def children(self, node):
+        """ Gets the children of a node
+
+        Args:
+            node (int): The node
+
+        Returns:
+            list(int): The child nodes in the order they were parented
+        """
+        return list(self._children[self._check(node)])
+
+    def descendants(self, roots):
+        """ Gets nodes and every node below them, parents before their children
+
+        Args:
+            roots (list(int)): The nodes to start from
+
+        Returns:
+            list(int): The nodes, breadth first
+        """
+        nodes = [self._check(root) for root in roots]
+        seen = set(nodes)
+
+        # the list grows while it is walked, so every level is appended after the one above it
+        for node in nodes:
+            for child in self._children[node]:
+                if child not in seen:
+                    seen.add(child)
+                    nodes.append(child)
+
+        return nodes
+
+    def get_channel(self, nodes, channel):
+        """ Gets a channel of nodes
+
+        Args:
+            nodes (list(int)): The nodes
+            channel (str): The name of the channel, ie. '_translation'
+
+        Returns:
+            list(list(float)): The value of every node
+        """
+        column = self._channels[channel]
+        return [column[self._check(node) * 3:node * 3 + 3].tolist() for node in nodes]
+
+    def set_channel(self, node, channel, value):
+        """ Sets a channel of a node
+
+        Args:
+            node (int): The node
+            channel (str): The name of the channel, ie. '_translation'
+            value (list(float)): The value
+        """
+        if len(value) != 3:
+            raise ValueError('Please pass three values of {0}.'.format(channel))
+
+        start = self._check(node) * 3
+        self._channels[channel][start:start + 3] = array('d', value)
+
+    def set_parent(self, node, parent):
+        """ Parents a node
+
+        Args:
+            node (int): The node
+            parent (int): The new parent node, None moves the node to the world
+        """
+        self._check(node)
+
+        if parent is not None:
+            self._check(parent)
+
+            ancestor = parent
+
+            while ancestor >= 0:
+                if ancestor == node:
+                    raise ValueError('Unable to parent {0} under {1}, it would create a cycle.'.format(
+                        self._names[node], self._names[parent]))
+
+                ancestor = self._parents[ancestor]
+
+        old_parent = self._parents[node]
+
+        if old_parent >= 0:
+            self._children[old_parent].remove(node)
+
+        self._parents[node] = parent if parent is not None else -1
+
+        if parent is not None:
+            self._children[parent].append(node)
+
+    def rename(self, node, name):
+        """ Renames a node
+
+        Args:
+            node (int): The node
+            name (str): The new name, a number is added when it is taken
+
+        Returns:
+            (str) The name the node got
+        """
+        old_name = self._names[self._check(node)]
+
+        if name == old_name:
+            return name
+
+        del self._lookup[old_name]
+
+        name = self._unique_name(name)
+
+        self._names[node] = name
+        self._lookup[name] = node
+
+        return name
+
+    def delete(self, node):
+        """ Deletes a node and every node below it, the ids of deleted nodes are not reused
+
+        Args:
+            node (int): The node
+        """
+        nodes = self.descendants([node])
+
+        parent = self._parents[node]
+
+        if parent >= 0:
+            self._children[parent].remove(node)
+
+        deleted = set(nodes)
+
+        for deleted_node in nodes:
+            del self._lookup[self._names[deleted_node]]
+            self._names[deleted_node] = None
+            self._parents[deleted_node] = -1
+            self._children[deleted_node] = []
+
+        self._count -= len(nodes)
+        self._selection = [selected for selected in self._selection if selected not in deleted]
+
+    def selection(self):
+        """ Gets the selected nodes
+
+        Returns:
+            list(int)
+        """
+        return list(self._selection)
+
+    def select(self, nodes=None):
+        """ Replaces the selection
+
+        Args:
+            nodes (list(int)): The nodes to select, None clears the selection
+        """
+        self._selection = [self._check(node) for node in nodes or []]
+
+    def nodes(self):
+        """ Gets every node in the scene, in the order they were created
+
+        Returns:
+            list(int)
+        """
+        return [node for node, name in enumerate(self._names) if name is not None]
+
+    def roots(self):
+        """ Gets the nodes in the world
+
+        Returns:
+            list(int)
+        """
+        return [node for node in self.nodes() if self._parents[node] < 0]
@@ -0,0 +1,191 @@
+__all__ = ['SceneBackend', 'get_scene_backend', 'set_scene_backend']
+
+# standard library imports
+import abc
+
+_scene = {'backend': None}
+
+
+class SceneBackend(object):
+    """ The scene the skeletons are built in and captured from when they are not built in Maya.
+
+    Nodes are opaque handles returned by the backend, every method that takes nodes also accepts the ones it
+    returned earlier.  The methods work on lists of nodes so a backend can answer a whole hierarchy level at once.
+    """
+
+    @abc.abstractmethod
+    def create_joints(self, names, parents, channels):
+        """ Creates joints in the scene
+
+        Args:
+            names (list(str)): The name of every joint, a name that is taken gets a number added
+            parents (list): The parent node of every joint, None for a joint in the world
+            channels (dict): The channel name, ie. '_translation', to the value of every joint
+
+        Returns:
+            list: The created nodes
+        """
+        return
+
+    def create_joint(self, name, parent=None, translation=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0),
+                     orientation=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0)):
+        """ Creates a single joint in the scene
+
+        Args:
+            name (str): The name of the joint
+            parent: The parent node, None for a joint in the world
+            translation (list(float)): The translation
+            rotation (list(float)): The rotation in degrees
+            orientation (list(float)): The joint orient in degrees
+            scale (list(float)): The scale
+
+        Returns:
+            The created node
+        """
+        channels = {'_translation': [translation], '_rotation': [rotation], '_orientation': [orientation],
+                    '_scale': [scale]}
+
+        return self.create_joints([name], [parent], channels)[0]
+
+    @abc.abstractmethod
+    def find(self, names):
+        """ Gets the nodes with the given names
+
+        Args:
+            names (list(str)): The names of the nodes
+
+        Returns:
+            list: The node for every name, None for the names that are not in the scene
+        """
+        return
+
+    @abc.abstractmethod
+    def names(self, nodes):
+        """ Gets the names of nodes
+
+        Args:
+            nodes (list): The nodes
+
+        Returns:
+            list(str)
+        """
+        return
+
+    @abc.abstractmethod
+    def parents(self, nodes):
+        """ Gets the parents of nodes
+
+        Args:
+            nodes (list): The nodes
+
+        Returns:
+            list: The parent node of every node, None for the nodes in the world
+        """
+        return
+
+    @abc.abstractmethod
+    def children(self, node):
+        """ Gets the children of a node
+
+        Args:
+            node: The node
+
+        Returns:
+            list: The child nodes in the order they were parented
+        """
+        return
+
+    @abc.abstractmethod
+    def descendants(self, roots):
+        """ Gets nodes and every node below them, parents before their children
+
+        Args:
+            roots (list): The nodes to start from
+
+        Returns:
+            list: The nodes
+        """
+        return
+
+    @abc.abstractmethod
+    def get_channel(self, nodes, channel):
+        """ Gets a channel of nodes
+
+        Args:
+            nodes (list): The nodes
+            channel (str): The name of the channel, ie. '_translation'
+
+        Returns:
+            list(list(float)): The value of every node
+        """
+        return
+
+    @abc.abstractmethod
+    def set_channel(self, node, channel, value):
+        """ Sets a channel of a node
+
+        Args:
+            node: The node
+            channel (str): The name of the channel, ie. '_translation'
+            value (list(float)): The value
+        """
+        return
+
+    @abc.abstractmethod
+    def set_parent(self, node, parent):
+        """ Parents a node
+
+        Args:
+            node: The node
+            parent: The new parent node, None moves the node to the world
+        """
+        return
+
+    @abc.abstractmethod
+    def delete(self, node):
+        """ Deletes a node and every node below it
+
+        Args:
+            node: The node
+        """
+        return
+
+    @abc.abstractmethod
+    def selection(self):
+        """ Gets the selected nodes
+
+        Returns:
+            list
+        """
+        return
+
+    @abc.abstractmethod
+    def select(self, nodes=None):
+        """ Replaces the selection
+
+        Args:
+            nodes (list): The nodes to select, None clears the selection
+        """
+        return
+
+
+def get_scene_backend():
+    """ Gets the scene backend the skeletons are built in
+
+    Returns:
+        SceneBackend or None when the skeletons are built in Maya, or not built at all without Maya
+    """
+    return _scene['backend']
+
+
+def set_scene_backend(backend=None):
+    """ Sets the scene backend the skeletons are built in, SkeletonJoint and Skeletor create joints and skeletons
+    for the backend while it is set
+
+    Args:
+        backend (SceneBackend): The scene, ie. an InMemoryScene, None goes back to Maya or the standalone skeletons
+    """
+    if backend is not None and not isinstance(backend, SceneBackend):
+        raise ValueError('Please pass a SceneBackend or None as the scene backend.')
+
+    _scene['backend'] = backend
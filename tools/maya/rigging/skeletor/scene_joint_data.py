@@ -0,0 +1,139 @@
+__all__ = ['SceneJointData']
+
+# skeletor imports
+from joint_data import JointData
+from scene_backend import get_scene_backend
+
+
+class SceneJointData(JointData):
+    def __init__(self, node=None):
+        """ Constructor
+
+        Args:
+            node: The node in the current scene backend to initialize from, or its name
+        """
+        super(SceneJointData, self).__init__()
+        self._initialize_from_node(node)
+
+    @property
+    def scene(self):
+        """ Gets the scene the joint is created in, the current scene backend
+
+        Returns:
+            SceneBackend
+        """
+        return get_scene_backend()
+
+    def _initialize_from_node(self, node):
+        """ Initialize the current joint from a node in the scene
+
+        Args:
+            node: The node or the name of the node to initialize from
+        """
+        if node is None:
+            return
+
+        scene = self.scene
+
+        if isinstance(node, basestring):
+            node = scene.find([node])[0]
+
+            if node is None:
+                return
+
+        self._node = node
+        self._name = scene.names([node])[0]
+
+        for channel in ('_translation', '_rotation', '_orientation', '_scale'):
+            setattr(self, channel, scene.get_channel([node], channel)[0])
+
+        parent = scene.parents([node])[0]
+        self._parent = scene.names([parent])[0] if parent is not None else ''
+
+        children = scene.children(node)
+        self._children = scene.names(children) if children else []
+
+    def _update_node(self, channel, value):
+        """ Sets a channel of the node of the joint, when it was created
+
+        Args:
+            channel (str): The name of the channel, ie. '_translation'
+            value (list(float)): The value
+        """
+        if self._node is not None:
+            self.scene.set_channel(self._node, channel, value)
+
+    @JointData.translation.setter
+    def translation(self, value):
+        """ Sets the translation value
+
+        Args:
+            value (list(float)): The value to set the translation to
+        """
+        JointData.translation.fset(self, value)
+        self._update_node('_translation', value)
+
+    @JointData.rotation.setter
+    def rotation(self, value):
+        """ Sets the rotation to the current value
+
+        Args:
+            value (list(float)): The value to set the rotation to
+        """
+        JointData.rotation.fset(self, value)
+        self._update_node('_rotation', value)
+
+    @JointData.scale.setter
+    def scale(self, value):
+        """ Sets the scale to the current value
+
+        Args:
+            value (list(float)): The value to set the scale to
+        """
+        JointData.scale.fset(self, value)
+        self._update_node('_scale', value)
+
+    @JointData.orientation.setter
+    def orientation(self, value):
+        """ Sets the orientation to the current value
+
+        Args:
+            value (list(float)): The current orientation value
+        """
+        JointData.orientation.fset(self, value)
+        self._update_node('_orientation', value)
+
+    @JointData.parent.setter
+    def parent(self, value):
+        """ Sets the parent of the joint
+
+        Args:
+            value (str): The name of the parent of the joint
+        """
+        self._parent = value
+
+        if self._node is not None:
+            # an empty parent, or one that is not in the scene, moves the joint to the world
+            self.scene.set_parent(self._node, self.scene.find([value])[0] if value else None)
+
+    def create(self, parent=None):
+        """ Creates the current joint in the scene
+
+        Args:
+            parent: The created parent node, or the name of the parent, defaults to the parent of the joint
+
+        Returns:
+            The created node
+        """
+        if parent is None:
+            parent = self._parent
+
+        scene = self.scene
+
+        if isinstance(parent, basestring):
+            parent = scene.find([parent])[0] if parent else None
+
+        self._node = scene.create_joint(self._name, parent, self._translation, self._rotation, self._orientation,
+                                        self._scale)
+
+        return self._node
@@ -0,0 +1,217 @@
+__all__ = ['SceneSkeleton']
+
+# skeletor imports
+from skeleton import Skeleton
+from joint_factory import SkeletonJoint
+from scene_backend import get_scene_backend
+
+CHANNELS = ('_translation', '_rotation', '_orientation', '_scale')
+
+
+class SceneSkeleton(Skeleton):
+    """ A skeleton that is built in and captured from the current scene backend, ie. an InMemoryScene.
+
+    Every level of the hierarchy is created with one call to the backend, and captures read every channel of all
+    of the captured joints with one call.
+    """
+
+    def __init__(self, prefix='', pooled=False):
+        """ Constructor
+
+        Args:
+            prefix (str): The prefix for the skeleton
+            pooled (bool): Store the joint data in a JointPool instead of one object per joint
+        """
+        super(SceneSkeleton, self).__init__(prefix, pooled)
+
+    @property
+    def scene(self):
+        """ Gets the scene the skeleton is built in, the current scene backend
+
+        Returns:
+            SceneBackend
+        """
+        return get_scene_backend()
+
+    def create_level(self, joints, parents):
+        """ Creates one level of the hierarchy with a single call to the scene
+
+        Args:
+            joints (list(JointData)): The joints to create
+            parents (list): The created parent node, or the name of a parent outside of the skeleton, for each joint
+
+        Returns:
+            list: The created node for each joint
+        """
+        scene = self.scene
+
+        # resolve the parents outside of the skeleton with one lookup for the whole level
+        external = list(set(parent for parent in parents if isinstance(parent, basestring) and parent))
+        existing = dict(zip(external, scene.find(external))) if external else dict()
+
+        parents = [existing.get(parent) if isinstance(parent, basestring) else parent for parent in parents]
+
+        channels = dict((channel, [getattr(joint, channel) for joint in joints]) for channel in CHANNELS)
+        nodes = scene.create_joints([joint.name for joint in joints], parents, channels)
+
+        for joint, node in zip(joints, nodes):
+            joint._node = node
+
+        return nodes
+
+    def remove_joints(self, names):
+        """ Removes several joints from the skeleton and deletes their nodes, the children of the joints are moved
+        up to their parents
+
+        Args:
+            names (list(str)): The names of the joints to remove
+
+        Returns:
+            list(JointData): The removed joints
+        """
+        scene = self.scene
+        nodes = [joint._node for joint in (self.find(name) for name in names) if joint is not None]
+        nodes = [node for node in nodes if node is not None]
+
+        for node in nodes:
+            # the setters of pooled joints do not touch the scene, so the children are moved up here
+            parent = scene.parents([node])[0]
+
+            for child in list(scene.children(node)):
+                scene.set_parent(child, parent)
+
+        removed = super(SceneSkeleton, self).remove_joints(names)
+
+        for node in nodes:
+            # the children were moved up, so only the joint itself is deleted
+            scene.delete(node)
+
+        return removed
+
+    def reparent(self, name, parent_name):
+        """ Changes the parent of a joint and of its node
+
+        Args:
+            name (str): The name of the joint to reparent
+            parent_name (str): The name of the new parent, an empty string to make it a root joint
+        """
+        super(SceneSkeleton, self).reparent(name, parent_name)
+
+        node = self.find(name)._node
+
+        if node is not None:
+            # set here as well for pooled joints, an empty parent or one that is not in the scene moves it to the world
+            self.scene.set_parent(node, self.scene.find([parent_name])[0] if parent_name else None)
+
+    def move_joints(self, moved):
+        """ Changes the transform channels of joints and of their nodes
+
+        Args:
+            moved (dict): The name of every joint to the channels to change and their values
+        """
+        super(SceneSkeleton, self).move_joints(moved)
+
+        scene = self.scene
+
+        for name, channels in moved.items():
+            node = self.find(name)._node
+
+            if node is None:
+                continue
+
+            # set here as well for pooled joints, their setters only change the pool
+            for channel, value in channels.items():
+                scene.set_channel(node, channel, value)
+
+    def capture_scene(self):
+        """ Captures the nodes in the scene that have the names of the joints of this skeleton, and every node
+        below the roots of the skeleton
+
+        Returns:
+            SceneSkeleton: The skeleton as it is in the scene, compare it with diff and update it with apply_diff
+        """
+        scene = self.scene
+        scene_skeleton = SceneSkeleton(self.prefix)
+
+        names = [joint.name for joint in self.joints]
+        nodes = set(node for node in scene.find(names) if node is not None)
+
+        roots = [node for node in scene.find([joint.name for joint in self.roots()]) if node is not None]
+        nodes.update(scene.descendants(roots) if roots else [])
+
+        if nodes:
+            # the walk keeps the parents before their children
+            order = dict((node, i) for i, node in enumerate(scene.descendants(self._scene_roots(nodes))))
+            scene_skeleton._capture(sorted(nodes, key=order.get))
+
+        return scene_skeleton
+
+    def from_selection(self, hierarchy=False):
+        """ Initializes the skeleton data based on the selected nodes
+
+        Args:
+            hierarchy (bool): Also capture every node below the selected nodes
+        """
+        nodes = self.scene.selection()
+
+        if not nodes:
+            return
+
+        self._capture(self.scene.descendants(nodes) if hierarchy else nodes)
+
+    def from_hierarchy(self, root):
+        """ Initializes the skeleton data from a root joint and every joint below it, without using the selection
+
+        Args:
+            root (str): The name of the root joint
+        """
+        node = self.scene.find([root])[0]
+
+        if node is None:
+            raise ValueError("Unable to find joint {0} in the scene.".format(root))
+
+        self._capture(self.scene.descendants([node]))
+
+    def _scene_roots(self, nodes):
+        """ Gets the nodes that do not have a parent in a set of nodes
+
+        Args:
+            nodes (set): The nodes
+
+        Returns:
+            list
+        """
+        nodes = list(nodes)
+        captured = set(nodes)
+
+        return [node for node, parent in zip(nodes, self.scene.parents(nodes)) if parent not in captured]
+
+    def _capture(self, nodes):
+        """ Adds the joints to the skeleton, reading each channel of all of the nodes at once
+
+        Args:
+            nodes (list): The nodes, parents before their children
+        """
+        scene = self.scene
+
+        names = scene.names(nodes)
+        channels = dict((channel, scene.get_channel(nodes, channel)) for channel in CHANNELS)
+
+        parents = scene.parents(nodes)
+        short_names = dict(zip(nodes, names))
+
+        outside = list(set(parent for parent in parents if parent is not None and parent not in short_names))
+        short_names.update(zip(outside, scene.names(outside)))
+
+        for i, node in enumerate(nodes):
+            joint = SkeletonJoint()
+
+            joint._node = node
+            joint._name = names[i]
+            joint._parent = short_names[parents[i]] if parents[i] is not None else ''
+            joint._children = scene.names(scene.children(node))
+
+            for channel in CHANNELS:
+                setattr(joint, channel, channels[channel][i])
+
+            self.add_joint(joint)
@@ -4,59 +4,109 @@ __all__ = ['Skeleton']
 import os.path
 import json
 import abc
+import copy
+from array import array
+from itertools import groupby
+from collections import OrderedDict
 
 # skeletor imports
 from joint_factory import SkeletonJoint
 from joint_data import JointData
+from joint_pool import JointPool, PooledJointData
+from skeleton_index import SkeletonIndex
+from skeleton_builder import SkeletonBuilder
+from kinematics import ForwardKinematics
+from skeleton_mirror import SkeletonMirror
+from skeleton_diff import diff_skeletons
+from json_stream import iter_skeleton_json, filter_joints
+from definition_cache import DefinitionCache, get_definition_cache
+from binary_format import is_binary_path, read_binary, write_binary, pack_pool, unpack_pool
+from animation import ANIMATED_CHANNELS, AnimationClip
 
 
 class Skeleton(object):
-    def __init__(self, prefix=''):
+    def __init__(self, prefix='', pooled=False):
         """ Constructor
+
+        Args:
+            prefix (str): The prefix for the skeleton
+            pooled (bool): Store the joint data in a JointPool instead of one object per joint
         """
 
         self._prefix = prefix
         self._data_path = ''
         self._joints = []
+        self._pool = JointPool() if pooled else None
+        self._index = None
 
     def __str__(self):
         return "Skeleton({0})".format(self.prefix)
 
     def build(self):
-        """ Builds the skeleton
+        """ Builds the skeleton, parents are always created before their children
+
+        Returns:
+            BuildReport: The created nodes and the time spent in each phase of the build
         """
+        return SkeletonBuilder(self).build()
 
-        # create all of the joints in the scene
-        for joint in self._joints:
-            if not isinstance(joint, JointData):
-                continue
+    def create_level(self, joints, parents):
+        """ Creates one level of the hierarchy
 
-            joint.create()
+        Args:
+            joints (list(JointData)): The joints to create
+            parents (list): The created parent node, or the name of a parent outside of the skeleton, for each joint
 
-    def save(self, data_path):
-        """ Saves the skeleton data to a jSON file
+        Returns:
+            list: The created node for each joint
+        """
+        return [joint.create(parent) for joint, parent in zip(joints, parents)]
+
+    def finalize_build(self):
+        """ Called after all of the joints have been created
+        """
+        return
+
+    def save(self, data_path, format=None, float_size=8):
+        """ Saves the skeleton data to a jSON or binary file
+
+        Args:
+            data_path (str): The path to the data file
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+            float_size (int): The size of the floats in the binary format, 4 is smaller but loses precision
         """
         self._data_path = data_path
 
         if not self._data_path:
             return
 
-        save_dict = self.__dict__.copy()
+        full_path = r'{0}'.format(self._data_path)
+
+        if self._resolve_format(full_path, format) == 'binary':
+            pool = self._pool if self._pool is not None else JointPool.from_joints(self._joints)
+            write_binary(full_path, pool, self._prefix, self._data_path, float_size)
+            return
+
+        save_dict = {'_prefix': self._prefix, '_data_path': self._data_path}
 
         joint_dictionaries = [joint.as_json() for joint in self.joints]
 
         save_dict['_joints'] = joint_dictionaries
 
-        full_path = r'{0}'.format(self._data_path)
-
         with open(full_path, 'w') as outfile:
             json.dump(save_dict, outfile, indent=4)
 
-    def load(self, file_path):
-        """ Loads the skeleton data from the jSON file
+    def load(self, file_path, format=None, groups=None, prefix=None, root=None, cache=None):
+        """ Loads the skeleton data from the jSON or binary file, the jSON file is read one joint at a time
 
         Args:
             file_path (str): The path to the data file
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+            groups (list(str)): Only load the joints in these groups
+            prefix (str): Only load the joints whose name starts with the prefix
+            root (str): Only load this joint and the joints below it
+            cache (bool or DefinitionCache): Reuse the definition if it was already loaded and did not change, True
+                uses the cache shared by the whole process, subsets are never cached
         """
         if file_path and os.path.exists(file_path):
             self._data_path = file_path
@@ -67,22 +117,664 @@ class Skeleton(object):
         if not os.path.exists(self._data_path):
             raise IOError('Unable to find file at path {0}'.format(self._data_path))
 
-        with open(self._data_path) as data_file:
-            data = json.load(data_file)
+        subset = groups or prefix or root
+
+        if cache is True:
+            cache = get_definition_cache()
+
+        if isinstance(cache, DefinitionCache) and not subset:
+            cache.load(self, self._data_path, format)
+            return
+
+        if self._resolve_format(self._data_path, format) == 'binary' and not subset:
+            self._load_pool(*read_binary(self._data_path))
+            return
+
+        data = dict()
+
+        self._joints = []
+
+        if self._pool is not None:
+            self._pool = JointPool()
+
+        for joint_dict in self._iter_joint_data(self._data_path, format, data, groups, prefix, root):
+            skeleton_joint = self._pool.append() if self._pool is not None else SkeletonJoint()
+            skeleton_joint.from_json(joint_dict)
+            self._joints.append(skeleton_joint)
+
+        # load the prefix data
+        if data.get('_prefix') is not None:
+            self._prefix = data['_prefix']
+
+        self.reindex()
+
+    @classmethod
+    def iter_joints(cls, file_path, format=None, groups=None, prefix=None, root=None, raw=False):
+        """ Reads the joints of a data file one at a time without loading the skeleton, ie. to scan large files
+
+        Args:
+            file_path (str): The path to the data file
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+            groups (list(str)): Only read the joints in these groups
+            prefix (str): Only read the joints whose name starts with the prefix
+            root (str): Only read this joint and the joints below it
+            raw (bool): Yield the joint dictionaries instead of joints
+
+        Yields:
+            JointData or dict
+        """
+        if not os.path.exists(file_path):
+            raise IOError('Unable to find file at path {0}'.format(file_path))
+
+        for joint_dict in cls._iter_joint_data(file_path, format, dict(), groups, prefix, root):
+            if raw:
+                yield joint_dict
+                continue
+
+            skeleton_joint = SkeletonJoint()
+            skeleton_joint.from_json(joint_dict)
+
+            yield skeleton_joint
+
+    @classmethod
+    def _iter_joint_data(cls, file_path, format, data, groups=None, prefix=None, root=None):
+        """ Reads the joint dictionaries of a data file one at a time
+
+        Args:
+            file_path (str): The path to the data file
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+            data (dict): Filled with the other values of the file, ie. the prefix
+            groups (list(str)): Only read the joints in these groups
+            prefix (str): Only read the joints whose name starts with the prefix
+            root (str): Only read this joint and the joints below it
+
+        Yields:
+            dict
+        """
+        if cls._resolve_format(file_path, format) == 'binary':
+            pool, extra = read_binary(file_path)
+            data.update(extra)
+
+            for joint_dict in filter_joints((view.as_json() for view in pool), groups, prefix, root):
+                yield joint_dict
+
+            return
+
+        with open(file_path) as data_file:
+            for joint_dict in filter_joints(iter_skeleton_json(data_file, data), groups, prefix, root):
+                yield joint_dict
+
+    def pack(self, float_size=8):
+        """ Packs the skeleton data in to the binary format, ie. to send it to another process
+
+        Args:
+            float_size (int): The size of the floats, 4 is smaller but loses precision
+
+        Returns:
+            (bytes)
+        """
+        pool = self._pool if self._pool is not None else JointPool.from_joints(self._joints)
+        return pack_pool(pool, self._prefix, self._data_path, float_size)
+
+    def unpack(self, data):
+        """ Loads the skeleton data from the binary format
+
+        Args:
+            data (bytes): The packed skeleton data
+        """
+        self._load_pool(*unpack_pool(data))
+
+    def _load_pool(self, pool, data):
+        """ Replaces the joints of the skeleton with the joints of a pool
+
+        Args:
+            pool (JointPool): The joint data to load
+            data (dict): The skeleton data stored with the joints, ie. the prefix
+        """
+        if self._pool is not None:
+            self._pool = pool
+            self._joints = list(pool)
+        else:
+            self._joints = []
+
+            for view in pool:
+                skeleton_joint = SkeletonJoint()
+                skeleton_joint.from_json(view.as_json())
+                self._joints.append(skeleton_joint)
+
+        if data.get('_prefix') is not None:
+            self._prefix = data['_prefix']
+
+        self.reindex()
+
+    def validate(self):
+        """ Checks the skeleton for problems that would stop it from being built correctly
+
+        Returns:
+            list(str): A description of every problem found
+        """
+        errors = ['Joint {0} is defined more than once.'.format(name) for name in self.index.duplicates]
+
+        errors.extend('Joint {0} is part of a parenting cycle.'.format(self.index.joints[i].name)
+                      for i in self.index.cyclic)
+
+        errors.extend('Joint {0} does not have a name.'.format(i) for i, joint in enumerate(self._joints)
+                      if not joint.name)
+
+        return errors
+
+    @staticmethod
+    def _resolve_format(path, format=None):
+        """ Gets the file format to use for a path
+
+        Args:
+            path (str): The path to the data file
+            format (str): 'json' or 'binary', by default it is picked from the file extension
+
+        Returns:
+            (str)
+        """
+        if format is None:
+            return 'binary' if is_binary_path(path) else 'json'
+
+        if format not in ('json', 'binary'):
+            raise ValueError("Please pass 'json' or 'binary' as the format.")
+
+        return format
+
+    def add_joint(self, joint):
+        """ Adds a joint to the skeleton, when the skeleton is pooled the joint data is copied in to the pool
+
+        Args:
+            joint (JointData): The joint to add
+
+        Returns:
+            JointData: The joint stored in the skeleton
+        """
+        if not isinstance(joint, JointData):
+            raise ValueError("Please pass a JointData to add to the skeleton.")
+
+        if self._pool is not None and not (isinstance(joint, PooledJointData) and joint.pool is self._pool):
+            joint = self._pool.append(joint)
+
+        self._joints.append(joint)
+
+        if self._index is not None:
+            self._index.add(joint)
+
+        return joint
+
+    def remove_joint(self, name):
+        """ Removes a joint from the skeleton, the children of the joint are moved up to its parent
+
+        Args:
+            name (str): The name of the joint to remove
+
+        Returns:
+            JointData: The removed joint
+        """
+        return self.remove_joints([name])[0]
+
+    def remove_joints(self, names):
+        """ Removes several joints at once, the children that are kept are moved up to their closest parent that is
+        kept, and the index is rebuilt once instead of once per joint
+
+        Args:
+            names (list(str)): The names of the joints to remove
+
+        Returns:
+            list(JointData): The removed joints, in the order of the names
+        """
+        names = list(OrderedDict.fromkeys(names))
+        joints = []
+
+        for name in names:
+            joint = self.find(name)
+
+            if joint is None:
+                raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+            joints.append(joint)
+
+        removing = set(names)
+
+        # the hierarchy is changed while the index is still valid, the joints are only taken out after that
+        for joint in joints:
+            parent_name = joint.parent
+            visited = set()
+
+            while parent_name in removing and parent_name not in visited:
+                visited.add(parent_name)
+                parent_name = self.find(parent_name).parent
+
+            if parent_name in removing:
+                # the removed joints are part of a parenting cycle
+                parent_name = ''
+
+            for child_index in list(self.index.child_indices(self.index.index_of(joint.name))):
+                child_name = self._joints[child_index].name
+
+                if child_name not in removing:
+                    self.reparent(child_name, parent_name)
+
+            parent = self.find(joint.parent) if joint.parent and joint.parent not in removing else None
+
+            if parent is not None and joint.name in parent.children:
+                parent.children.remove(joint.name)
+
+        removed = []
+        rows = []
+
+        for joint in joints:
+            # keep the data of the removed joint alive in a regular joint when it leaves the pool
+            if isinstance(joint, PooledJointData) and joint.pool is self._pool:
+                rows.append(joint.index)
+
+                joint_copy = SkeletonJoint()
+                joint_copy.from_json(joint.as_json())
+                removed.append(joint_copy)
+            else:
+                removed.append(joint)
+
+        removed_ids = set(id(joint) for joint in joints)
+        self._joints[:] = [joint for joint in self._joints if id(joint) not in removed_ids]
+
+        # the rows after a removed row move down, so the last rows are removed first
+        for row in sorted(rows, reverse=True):
+            self._pool.remove(row)
+
+        # the positions of the joints after the removed ones have changed
+        self._index = None
+
+        return removed
+
+    def reparent(self, name, parent_name):
+        """ Changes the parent of a joint and keeps the children lists and the index in sync
+
+        Args:
+            name (str): The name of the joint to reparent
+            parent_name (str): The name of the new parent, an empty string to make it a root joint
+        """
+        joint = self.find(name)
+
+        if joint is None:
+            raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+        if parent_name in self.index and (parent_name == name or name in self.ancestors(parent_name, names=True)):
+            raise ValueError("Unable to parent {0} under {1}, it would create a cycle.".format(name, parent_name))
+
+        old_parent = self.find(joint.parent) if joint.parent else None
+
+        if old_parent is not None and name in old_parent.children:
+            old_parent.children.remove(name)
+
+        new_parent = self.find(parent_name) if parent_name else None
+
+        if new_parent is not None and name not in new_parent.children:
+            new_parent.children.append(name)
+
+        joint.parent = parent_name or ''
+
+        self.index.set_parent(self.index.index_of(name), parent_name)
+
+    def rename(self, name, new_name):
+        """ Renames a joint and updates the parent and children references to it
+
+        Args:
+            name (str): The current name of the joint
+            new_name (str): The new name for the joint
+        """
+        joint = self.find(name)
+
+        if joint is None:
+            raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+        if new_name in self.index:
+            raise ValueError("A joint named {0} already exists in the skeleton.".format(new_name))
+
+        parent = self.find(joint.parent) if joint.parent else None
+
+        if parent is not None and name in parent.children:
+            parent.children[parent.children.index(name)] = new_name
+
+        for child_index in self.index.child_indices(self.index.index_of(name)):
+            # only the data changes, the hierarchy in the scene is the same
+            self._joints[child_index]._parent = new_name
+
+        joint.name = new_name
+
+        self.index.rename(name, new_name)
+
+    def set_group(self, name, group):
+        """ Changes the group of a joint and keeps the group index in sync
+
+        Args:
+            name (str): The name of the joint
+            group (str): The new group
+        """
+        joint_index = self._checked_index(name)
+        joint = self.index.joints[joint_index]
+
+        self.index.set_group(joint_index, joint.group, group)
+
+        joint.group = group
+
+    def set_attribute(self, name, key, value=None):
+        """ Adds or changes a custom attribute of a joint and keeps the attribute index in sync
+
+        Args:
+            name (str): The name of the joint
+            key (str): The name of the attribute
+            value: The value of the attribute
+        """
+        joint_index = self._checked_index(name)
+        joint = self.index.joints[joint_index]
+
+        self.index.set_attribute(joint_index, key, joint.custom_attributes.get(key), value)
+
+        joint.add_attribute(key, value)
+
+    def remove_attribute(self, name, key):
+        """ Removes a custom attribute from a joint and keeps the attribute index in sync
+
+        Args:
+            name (str): The name of the joint
+            key (str): The name of the attribute
+
+        Returns:
+            The value the attribute had
+        """
+        joint_index = self._checked_index(name)
+        joint = self.index.joints[joint_index]
+
+        if key not in joint.custom_attributes:
+            raise ValueError("Joint {0} does not have an attribute named {1}.".format(name, key))
+
+        value = joint.custom_attributes.pop(key)
+
+        self.index.remove_attribute(joint_index, key, value)
+
+        return value
+
+    def reindex(self):
+        """ Rebuilds the name and hierarchy index, use after editing joints directly instead of
+        through the skeleton
+        """
+        self._index = SkeletonIndex(self._joints)
+
+    def find(self, name):
+        """ Gets a joint by name
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            JointData or None
+        """
+        return self.index.find(name)
+
+    def ancestors(self, name, names=False):
+        """ Gets the ancestors of a joint, starting with its parent and ending with the root
+
+        Args:
+            name (str): The name of the joint
+            names (bool): Return the names of the joints instead of the joints
+
+        Returns:
+            list(JointData) or list(str)
+        """
+        return self._joints_from_indices(self.index.ancestor_indices(self._checked_index(name)), names)
+
+    def descendants(self, name, names=False):
+        """ Gets all of the joints below a joint, depth first
+
+        Args:
+            name (str): The name of the joint
+            names (bool): Return the names of the joints instead of the joints
+
+        Returns:
+            list(JointData) or list(str)
+        """
+        return self._joints_from_indices(self.index.descendant_indices(self._checked_index(name)), names)
+
+    def select(self, groups=None, attributes=None, names=False):
+        """ Gets the joints that are in any of the groups and have all of the custom attributes, using the group
+        and attribute indices instead of checking every joint
+
+        Args:
+            groups (str or list(str)): The group or groups the joints can be in, None for any group
+            attributes (str, list(str) or dict): The names of the attributes the joints must have, or a dictionary
+                of the names and the values they must have
+            names (bool): Return the names of the joints instead of the joints
+
+        Returns:
+            list(JointData) or list(str) In the order of the skeleton
+        """
+        index = self.index
+        selected = None
+
+        if groups is not None:
+            if isinstance(groups, basestring):
+                groups = [groups]
+
+            selected = set()
+
+            for group in groups:
+                selected |= index.group_indices(group)
+
+        if isinstance(attributes, basestring):
+            attributes = [attributes]
+
+        if isinstance(attributes, dict):
+            queries = [(key, value) for key, value in attributes.items()]
+        else:
+            queries = [(key,) for key in attributes or []]
+
+        for query in queries:
+            if selected is not None and not selected:
+                break
+
+            matches = index.attribute_indices(*query)
+            selected = matches if selected is None else selected & matches
+
+        if selected is None:
+            return self._joints_from_indices(range(len(index)), names)
+
+        return self._joints_from_indices(sorted(selected), names)
+
+    def roots(self):
+        """ Gets the joints that do not have a parent in the skeleton
+
+        Returns:
+            list(JointData)
+        """
+        return self._joints_from_indices(self.index.root_indices())
+
+    def iter_topological(self):
+        """ Iterates over the joints so that every parent comes before its children
+
+        Yields:
+            JointData
+        """
+        index = self.index
+
+        for joint_index in index.topological_indices():
+            yield index.joints[joint_index]
+
+    def forward_kinematics(self, space='local'):
+        """ Computes the world matrices of the joints without Maya
+
+        Args:
+            space (str): 'local' when the joint channels are relative to the parent, 'world' when they were
+                captured as world values
+
+        Returns:
+            ForwardKinematics: The evaluated matrices, call update(name) on it after changing a joint
+        """
+        kinematics = ForwardKinematics(self, space)
+        kinematics.evaluate()
+
+        return kinematics
+
+    def sample_pose(self, frame=None, channels=ANIMATED_CHANNELS):
+        """ Gets the pose of every joint at once, the skeleton data has no animation so the frame is ignored
+
+        Args:
+            frame (float): The frame to sample
+            channels (list(str)): The channels to read, ie. '_translation'
+
+        Returns:
+            dict: The channel to a flat array of three values per joint, in the order of the joints
+        """
+        if self._pool is not None:
+            return dict((channel, array('d', self._pool.channel(channel))) for channel in channels)
+
+        return dict((channel, array('d', [value for joint in self._joints for value in getattr(joint, channel)]))
+                    for channel in channels)
+
+    def capture_animation(self, start, end, step=1.0, name='', frame_rate=30.0, channels=ANIMATED_CHANNELS):
+        """ Captures the animation of the joints over a frame range
+
+        Args:
+            start (float): The first frame
+            end (float): The last frame
+            step (float): The time between the captured frames
+            name (str): The name of the clip
+            frame_rate (float): The number of frames per second
+            channels (list(str)): The channels to capture
+
+        Returns:
+            AnimationClip
+        """
+        return AnimationClip.capture(self, start, end, step, name, frame_rate, channels)
+
+    def mirror(self, axis='x', search=r'^L(?=[A-Z])', replace='R', create=True):
+        """ Pairs the left and right joints by name, links their mirrored joints both ways and creates the
+        mirrored joints that are missing
+
+        Args:
+            axis (str): The axis to mirror across, 'x', 'y' or 'z'
+            search (str): A regular expression matching the side of the name of a joint to mirror
+            replace (str): What the match is replaced with in the name of the mirrored joint
+            create (bool): Create the mirrored joints that are not in the skeleton
+
+        Returns:
+            list(JointData): The created joints
+        """
+        return SkeletonMirror(self, axis, search, replace).mirror(create)
+
+    def diff(self, target, tolerance=1e-5):
+        """ Compares the skeleton with another one by joint name
+
+        Args:
+            target (Skeleton): The skeleton as it should be, ie. a changed definition
+            tolerance (float): The largest change of a channel value that is ignored
+
+        Returns:
+            SkeletonDiff: The added, removed, reparented and moved joints that turn this skeleton in to the target
+        """
+        return diff_skeletons(self, target, tolerance)
+
+    def apply_diff(self, diff):
+        """ Changes the skeleton in to the target of a diff, only the joints in the diff are touched
+
+        Args:
+            diff (SkeletonDiff): The changes to apply, from Skeleton.diff
+
+        Returns:
+            dict: The created node of every added joint
+        """
+        target = diff.target
+        target_index = target.index
+
+        added = []
+
+        for name in diff.added:
+            joint = SkeletonJoint()
+            joint.from_json(copy.deepcopy(target.find(name).as_json()))
+
+            joint = self.add_joint(joint)
+
+            parent = self.find(joint.parent) if joint.parent else None
+
+            if parent is not None and name not in parent.children:
+                parent.children.append(name)
+
+            added.append(joint)
+
+        # the added joints are in topological order, so every level only needs the levels above it
+        nodes = dict()
+
+        for _, level in groupby(added, key=lambda joint: target_index.depth(target_index.index_of(joint.name))):
+            level = list(level)
+            parents = [nodes.get(joint.parent, joint.parent) if joint.parent else None for joint in level]
+
+            nodes.update(zip([joint.name for joint in level], self.create_level(level, parents)))
+
+        for name, (_, parent_name) in diff.reparented.items():
+            self.reparent(name, parent_name)
+
+        moved = dict()
+
+        for name, channels in diff.moved.items():
+            source = target.find(name)
+            moved[name] = dict((channel, list(getattr(source, channel))) for channel in channels)
+
+        self.move_joints(moved)
 
-            # load the joint data
-            if '_joints' in data:
-                self._joints = []
-                joint_list = data['_joints']
+        if diff.removed:
+            self.remove_joints(diff.removed)
 
-                for joint_dict in joint_list:
-                    skeleton_joint = SkeletonJoint()
-                    skeleton_joint.from_json(joint_dict)
-                    self._joints.append(skeleton_joint)
+        self.finalize_build()
 
-            # load the prefix data
-            if '_prefix' in data:
-                self._prefix = data['_prefix']
+        return nodes
+
+    def move_joints(self, moved):
+        """ Changes the transform channels of joints
+
+        Args:
+            moved (dict): The name of every joint to the channels to change and their values,
+                ie. {'Spine': {'_translation': [0.0, 10.0, 0.0]}}
+        """
+        # the setters move the nodes of joints that are in the scene
+        for name, channels in moved.items():
+            joint = self.find(name)
+
+            for channel, value in channels.items():
+                setattr(joint, channel.lstrip('_'), value)
+
+    def _checked_index(self, name):
+        """ Gets the index of a joint and raises an error if it is not in the skeleton
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            (int)
+        """
+        joint_index = self.index.index_of(name)
+
+        if joint_index < 0:
+            raise ValueError("Unable to find joint {0} in the skeleton.".format(name))
+
+        return joint_index
+
+    def _joints_from_indices(self, indices, names=False):
+        """ Converts a list of indices in to joints
+
+        Args:
+            indices (list(int)): The indices of the joints
+            names (bool): Return the names of the joints instead of the joints
+
+        Returns:
+            list(JointData) or list(str)
+        """
+        joints = self.index.joints
+
+        if names:
+            return [joints[i].name for i in indices]
+
+        return [joints[i] for i in indices]
 
     @property
     def data_path(self):
@@ -135,6 +827,36 @@ class Skeleton(object):
         """
         return self._joints
 
+    @property
+    def index(self):
+        """ Gets the name and hierarchy index of the joints, it is built the first time it is needed
+
+        Returns:
+            SkeletonIndex
+        """
+        if self._index is None:
+            self.reindex()
+
+        return self._index
+
+    @property
+    def pooled(self):
+        """ Returns whether the joint data is stored in a JointPool
+
+        Returns:
+            True or False
+        """
+        return self._pool is not None
+
+    @property
+    def pool(self):
+        """ Gets the pool storing the joint data, None when the skeleton is not pooled
+
+        Returns:
+            JointPool
+        """
+        return self._pool
+
     @abc.abstractmethod
     def from_selection(self):
         """ Initializes the skeleton data based on the currently selected joints
@@ -0,0 +1,113 @@
+__all__ = ['SkeletonBuilder', 'BuildReport']
+
+# standard library imports
+from collections import OrderedDict
+from contextlib import contextmanager
+from timeit import default_timer
+
+
+class BuildReport(object):
+    """ The result of building a skeleton, holds the created nodes and the time spent in each phase.
+    """
+
+    def __init__(self):
+        """ Constructor
+        """
+        self.timings = OrderedDict()
+        self.nodes = dict()
+        self.levels = 0
+        self.skipped = []
+
+    def __str__(self):
+        phases = ', '.join('{0}: {1:.4f}s'.format(phase, seconds) for phase, seconds in self.timings.items())
+        return 'BuildReport({0} joints, {1} levels, {2})'.format(len(self.nodes), self.levels, phases)
+
+    @contextmanager
+    def phase(self, name):
+        """ Times a phase of the build
+
+        Args:
+            name (str): The name of the phase
+        """
+        start = default_timer()
+
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + default_timer() - start
+
+    @property
+    def total_time(self):
+        """ Gets the total time of the build
+
+        Returns:
+            (float) The time in seconds
+        """
+        return sum(self.timings.values())
+
+
+class SkeletonBuilder(object):
+    """ Builds a skeleton one hierarchy level at a time.
+
+    The joints are sorted by depth once, then every level is handed to Skeleton.create_level together
+    with the parents that were created for it, so parents always exist before their children.
+    """
+
+    def __init__(self, skeleton):
+        """ Constructor
+
+        Args:
+            skeleton (Skeleton): The skeleton to build
+        """
+        self._skeleton = skeleton
+
+    def levels(self):
+        """ Groups the joints of the skeleton by their depth in the hierarchy
+
+        Returns:
+            list(list(JointData))
+        """
+        index = self._skeleton.index
+        levels = []
+
+        for joint_index in index.topological_indices():
+            depth = index.depth(joint_index)
+
+            if depth == len(levels):
+                levels.append([])
+
+            levels[depth].append(index.joints[joint_index])
+
+        return levels
+
+    def build(self):
+        """ Builds the skeleton
+
+        Returns:
+            BuildReport
+        """
+        report = BuildReport()
+
+        with report.phase('sort'):
+            levels = self.levels()
+            index = self._skeleton.index
+            report.skipped = [index.joints[joint_index].name for joint_index in index.cyclic]
+
+        nodes = report.nodes
+
+        with report.phase('create'):
+            for level in levels:
+                # parents outside of the skeleton are passed by name so they can be found in the scene
+                parents = [nodes.get(joint.parent, joint.parent) if joint.parent else None for joint in level]
+
+                created = self._skeleton.create_level(level, parents)
+
+                for joint, node in zip(level, created):
+                    nodes[joint.name] = node
+
+            report.levels = len(levels)
+
+        with report.phase('finalize'):
+            self._skeleton.finalize_build()
+
+        return report
@@ -0,0 +1,98 @@
+__all__ = ['SkeletonDiff', 'diff_skeletons']
+
+# standard library imports
+from collections import OrderedDict
+
+CHANNELS = ('_translation', '_rotation', '_scale', '_orientation')
+
+
+class SkeletonDiff(object):
+    """ The changes that turn one skeleton in to another, joints are matched by name.
+    """
+
+    def __init__(self, target):
+        """ Constructor
+
+        Args:
+            target (Skeleton): The skeleton the changes lead to
+        """
+        self.target = target
+
+        # names of the joints, in the topological order of the skeleton they are in
+        self.added = []
+        self.removed = []
+
+        # joint name to the old and the new parent name
+        self.reparented = OrderedDict()
+
+        # joint name to the names of the channels that changed
+        self.moved = OrderedDict()
+
+    def __nonzero__(self):
+        return bool(self.added or self.removed or self.reparented or self.moved)
+
+    __bool__ = __nonzero__
+
+    def __str__(self):
+        return 'SkeletonDiff({0} added, {1} removed, {2} reparented, {3} moved)'.format(
+            len(self.added), len(self.removed), len(self.reparented), len(self.moved))
+
+    @property
+    def changed(self):
+        """ Gets the names of all of the joints that have to be touched to apply the diff
+
+        Returns:
+            set(str)
+        """
+        return set(self.added) | set(self.removed) | set(self.reparented) | set(self.moved)
+
+
+def _channels_differ(a, b, tolerance):
+    """ Compares two channel values
+
+    Args:
+        a (list(float)): The first value
+        b (list(float)): The second value
+        tolerance (float): The largest difference that is still equal
+
+    Returns:
+        True or False
+    """
+    return len(a) != len(b) or any(abs(x - y) > tolerance for x, y in zip(a, b))
+
+
+def diff_skeletons(current, target, tolerance=1e-5):
+    """ Compares two skeletons by joint name
+
+    Args:
+        current (Skeleton): The skeleton as it is, ie. captured from the scene or loaded from the last definition
+        target (Skeleton): The skeleton as it should be
+        tolerance (float): The largest change of a channel value that is ignored
+
+    Returns:
+        SkeletonDiff: The changes that turn the current skeleton in to the target
+    """
+    diff = SkeletonDiff(target)
+
+    current_index = current.index
+    target_index = target.index
+
+    for joint in target.iter_topological():
+        existing = current_index.find(joint.name)
+
+        if existing is None:
+            diff.added.append(joint.name)
+            continue
+
+        if (existing.parent or '') != (joint.parent or ''):
+            diff.reparented[joint.name] = (existing.parent or '', joint.parent or '')
+
+        channels = [channel for channel in CHANNELS
+                    if _channels_differ(getattr(existing, channel), getattr(joint, channel), tolerance)]
+
+        if channels:
+            diff.moved[joint.name] = channels
+
+    diff.removed = [joint.name for joint in current.iter_topological() if joint.name not in target_index]
+
+    return diff
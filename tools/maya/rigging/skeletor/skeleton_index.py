@@ -0,0 +1,465 @@
+__all__ = ['SkeletonIndex']
+
+# standard library imports
+from array import array
+from collections import deque
+
+
+class SkeletonIndex(object):
+    """ Name and hierarchy index for a list of joints.
+
+    Joints are referred to by their position in the joint list.  The index keeps a name to index
+    dictionary, a parent index array and the children of every joint as offsets in to a flat child array.
+    The joints are also indexed by group, by custom attribute name and by custom attribute value.
+    """
+
+    def __init__(self, joints=None):
+        """ Constructor
+
+        Args:
+            joints (list(JointData)): The joints to index
+        """
+        self._joints = []
+        self._names = dict()
+        self._duplicates = []
+        self._parents = array('i')
+
+        # children of joints that were added before their parent, keyed by the parent name
+        self._pending = dict()
+
+        # group name, attribute name and (attribute name, value) to the indices of the joints
+        self._groups = dict()
+        self._attributes = dict()
+        self._values = dict()
+
+        # the child arrays and the traversal order are rebuilt lazily after joints are added
+        self._child_offsets = array('i')
+        self._child_indices = array('i')
+        self._order = array('i')
+        self._depths = array('i')
+        self._hierarchy_dirty = True
+
+        if joints:
+            self.rebuild(joints)
+
+    def __len__(self):
+        return len(self._joints)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def rebuild(self, joints):
+        """ Rebuilds the index from a list of joints
+
+        Args:
+            joints (list(JointData)): The joints to index
+        """
+        self._joints = []
+        self._names = dict()
+        self._duplicates = []
+        self._parents = array('i')
+        self._pending = dict()
+        self._groups = dict()
+        self._attributes = dict()
+        self._values = dict()
+
+        for joint in joints:
+            self.add(joint)
+
+    def add(self, joint):
+        """ Adds a joint to the end of the index
+
+        Args:
+            joint (JointData): The joint to add
+        """
+        index = len(self._joints)
+        self._joints.append(joint)
+
+        if joint.name in self._names:
+            self._duplicates.append(joint.name)
+        else:
+            self._names[joint.name] = index
+
+            # resolve any children that were added before this joint
+            for child_index in self._pending.pop(joint.name, []):
+                self._parents[child_index] = index
+
+        parent_index = self._names.get(joint.parent, -1) if joint.parent else -1
+        self._parents.append(parent_index)
+
+        if joint.parent and parent_index == -1:
+            self._pending.setdefault(joint.parent, []).append(index)
+
+        self._groups.setdefault(joint.group, set()).add(index)
+
+        for key, value in joint.custom_attributes.items():
+            self._add_attribute(index, key, value)
+
+        self._hierarchy_dirty = True
+
+    def set_parent(self, index, parent_name):
+        """ Updates the parent of a joint in the index
+
+        Args:
+            index (int): The index of the joint
+            parent_name (str): The name of the new parent
+        """
+        for children in self._pending.values():
+            if index in children:
+                children.remove(index)
+
+        parent_index = self._names.get(parent_name, -1) if parent_name else -1
+        self._parents[index] = parent_index
+
+        if parent_name and parent_index == -1:
+            self._pending.setdefault(parent_name, []).append(index)
+
+        self._hierarchy_dirty = True
+
+    def rename(self, old_name, new_name):
+        """ Updates the name of a joint in the index
+
+        Args:
+            old_name (str): The current name of the joint
+            new_name (str): The new name of the joint
+        """
+        index = self._names.pop(old_name)
+        self._names[new_name] = index
+
+        for child_index in self._pending.pop(new_name, []):
+            self._parents[child_index] = index
+
+        self._hierarchy_dirty = True
+
+    def set_group(self, index, old_group, new_group):
+        """ Updates the group of a joint in the index
+
+        Args:
+            index (int): The index of the joint
+            old_group (str): The group the joint was in
+            new_group (str): The group the joint is in now
+        """
+        self._discard(self._groups, old_group, index)
+        self._groups.setdefault(new_group, set()).add(index)
+
+    def set_attribute(self, index, key, old_value, new_value):
+        """ Updates a custom attribute of a joint in the index
+
+        Args:
+            index (int): The index of the joint
+            key (str): The name of the attribute
+            old_value: The previous value, ignored when the joint did not have the attribute
+            new_value: The new value
+        """
+        self._discard_value(key, old_value, index)
+        self._add_attribute(index, key, new_value)
+
+    def remove_attribute(self, index, key, value):
+        """ Removes a custom attribute of a joint from the index
+
+        Args:
+            index (int): The index of the joint
+            key (str): The name of the attribute
+            value: The value the attribute had
+        """
+        self._discard(self._attributes, key, index)
+        self._discard_value(key, value, index)
+
+    def _add_attribute(self, index, key, value):
+        """ Adds a custom attribute of a joint to the attribute and value indices
+
+        Args:
+            index (int): The index of the joint
+            key (str): The name of the attribute
+            value: The value of the attribute, values that cannot be hashed are only indexed by name
+        """
+        self._attributes.setdefault(key, set()).add(index)
+
+        try:
+            self._values.setdefault((key, value), set()).add(index)
+        except TypeError:
+            pass
+
+    def _discard_value(self, key, value, index):
+        """ Removes a joint from the value index
+
+        Args:
+            key (str): The name of the attribute
+            value: The value of the attribute
+            index (int): The index of the joint
+        """
+        try:
+            self._discard(self._values, (key, value), index)
+        except TypeError:
+            pass
+
+    @staticmethod
+    def _discard(lookup, key, index):
+        """ Removes a joint from one of the secondary indices, dropping the key when no joints are left
+
+        Args:
+            lookup (dict): The index to remove from
+            key: The key the joint is stored under
+            index (int): The index of the joint
+        """
+        indices = lookup.get(key)
+
+        if indices is None:
+            return
+
+        indices.discard(index)
+
+        if not indices:
+            del lookup[key]
+
+    def _update_hierarchy(self):
+        """ Rebuilds the child arrays, depths and topological order from the parent array
+        """
+        if not self._hierarchy_dirty:
+            return
+
+        count = len(self._joints)
+
+        # count the children of every joint and turn the counts in to offsets
+        offsets = array('i', [0] * (count + 1))
+
+        for parent_index in self._parents:
+            if parent_index >= 0:
+                offsets[parent_index + 1] += 1
+
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+
+        children = array('i', [0] * offsets[count])
+        fill = offsets[:count]
+
+        for child_index, parent_index in enumerate(self._parents):
+            if parent_index >= 0:
+                children[fill[parent_index]] = child_index
+                fill[parent_index] += 1
+
+        # breadth first from the roots so that parents always come before their children
+        order = array('i')
+        depths = array('i', [-1] * count)
+        queue = deque()
+
+        for i in range(count):
+            if self._parents[i] < 0:
+                depths[i] = 0
+                queue.append(i)
+
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+
+            for child_index in children[offsets[current]:offsets[current + 1]]:
+                depths[child_index] = depths[current] + 1
+                queue.append(child_index)
+
+        self._child_offsets = offsets
+        self._child_indices = children
+        self._order = order
+        self._depths = depths
+        self._hierarchy_dirty = False
+
+    def index_of(self, name):
+        """ Gets the index of a joint by name
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            (int) The index of the joint or -1 if it is not in the index
+        """
+        return self._names.get(name, -1)
+
+    def find(self, name):
+        """ Gets a joint by name
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            JointData or None
+        """
+        index = self._names.get(name, -1)
+        return self._joints[index] if index >= 0 else None
+
+    def group_indices(self, group):
+        """ Gets the indices of the joints in a group
+
+        Args:
+            group (str): The name of the group
+
+        Returns:
+            set(int) A new set that can be changed by the caller
+        """
+        return set(self._groups.get(group, ()))
+
+    def attribute_indices(self, key, *value):
+        """ Gets the indices of the joints that have a custom attribute, optionally with a value
+
+        Args:
+            key (str): The name of the attribute
+            value: Only the joints whose attribute has this value, when passed
+
+        Returns:
+            set(int) A new set that can be changed by the caller
+        """
+        if not value:
+            return set(self._attributes.get(key, ()))
+
+        value = value[0]
+
+        try:
+            return set(self._values.get((key, value), ()))
+        except TypeError:
+            # only hashable values are indexed, and those never equal a value that cannot be hashed
+            return set(i for i in self._attributes.get(key, ())
+                       if self._joints[i].custom_attributes.get(key) == value)
+
+    def parent_index(self, index):
+        """ Gets the index of the parent of a joint
+
+        Args:
+            index (int): The index of the joint
+
+        Returns:
+            (int) The index of the parent or -1 for a root joint
+        """
+        return self._parents[index]
+
+    def child_indices(self, index):
+        """ Gets the indices of the children of a joint
+
+        Args:
+            index (int): The index of the joint
+
+        Returns:
+            array.array
+        """
+        self._update_hierarchy()
+        return self._child_indices[self._child_offsets[index]:self._child_offsets[index + 1]]
+
+    def depth(self, index):
+        """ Gets the depth of a joint in the hierarchy, root joints have a depth of 0
+
+        Args:
+            index (int): The index of the joint
+
+        Returns:
+            (int) The depth or -1 if the joint is part of a parenting cycle
+        """
+        self._update_hierarchy()
+        return self._depths[index]
+
+    def ancestor_indices(self, index):
+        """ Gets the indices of the ancestors of a joint, starting with its parent
+
+        Args:
+            index (int): The index of the joint
+
+        Returns:
+            list(int)
+        """
+        ancestors = []
+        parent_index = self._parents[index]
+
+        while parent_index >= 0 and parent_index != index and len(ancestors) < len(self._joints):
+            ancestors.append(parent_index)
+            parent_index = self._parents[parent_index]
+
+        return ancestors
+
+    def descendant_indices(self, index):
+        """ Gets the indices of all of the joints below a joint, depth first
+
+        Args:
+            index (int): The index of the joint
+
+        Returns:
+            list(int)
+        """
+        self._update_hierarchy()
+
+        descendants = []
+        stack = list(reversed(self.child_indices(index)))
+
+        while stack:
+            current = stack.pop()
+            descendants.append(current)
+            stack.extend(reversed(self._child_indices[self._child_offsets[current]:self._child_offsets[current + 1]]))
+
+        return descendants
+
+    def topological_indices(self):
+        """ Gets the indices of the joints ordered so that parents come before their children
+
+        Returns:
+            array.array
+        """
+        self._update_hierarchy()
+        return self._order
+
+    def root_indices(self):
+        """ Gets the indices of the joints without a parent in the index
+
+        Returns:
+            list(int)
+        """
+        return [i for i, parent_index in enumerate(self._parents) if parent_index < 0]
+
+    @property
+    def joints(self):
+        """ Gets the indexed joints
+
+        Returns:
+            list(JointData)
+        """
+        return self._joints
+
+    @property
+    def groups(self):
+        """ Gets the names of the groups that have joints in them
+
+        Returns:
+            list(str)
+        """
+        return sorted(self._groups)
+
+    @property
+    def attributes(self):
+        """ Gets the names of the custom attributes of all of the joints
+
+        Returns:
+            list(str)
+        """
+        return sorted(self._attributes)
+
+    @property
+    def duplicates(self):
+        """ Gets the names that were used by more than one joint
+
+        Returns:
+            list(str)
+        """
+        return self._duplicates
+
+    @property
+    def unresolved_parents(self):
+        """ Gets the parent names that do not match a joint in the index
+
+        Returns:
+            list(str)
+        """
+        return [name for name, children in self._pending.items() if children]
+
+    @property
+    def cyclic(self):
+        """ Gets the indices of the joints that are part of, or below, a parenting cycle
+
+        Returns:
+            list(int)
+        """
+        self._update_hierarchy()
+        return [i for i, depth in enumerate(self._depths) if depth < 0]
@@ -0,0 +1,168 @@
+__all__ = ['SkeletonMirror']
+
+# standard library imports
+import re
+import copy
+
+# skeletor imports
+from joint_factory import SkeletonJoint
+
+try:
+    # numpy is optional, without it the values are reflected one joint at a time
+    import numpy
+except ImportError:
+    numpy = None
+
+AXES = ('x', 'y', 'z')
+
+
+class SkeletonMirror(object):
+    """ Pairs the left and right joints of a skeleton by name and creates the missing side.
+
+    The joints are paired through the name index of the skeleton, and the values of all of the joints that are
+    missing a mirrored joint are reflected in one pass.  Translations are reflected across the plane facing the
+    mirror axis, rotations and joint orients by negating their other two axes.
+    """
+
+    def __init__(self, skeleton, axis='x', search=r'^L(?=[A-Z])', replace='R'):
+        """ Constructor
+
+        Args:
+            skeleton (Skeleton): The skeleton to mirror
+            axis (str): The axis to mirror across, 'x', 'y' or 'z'
+            search (str): A regular expression matching the side of the name of a joint to mirror
+            replace (str): What the match is replaced with in the name of the mirrored joint
+        """
+        if axis not in AXES:
+            raise ValueError("Please pass 'x', 'y' or 'z' as the mirror axis.")
+
+        self._skeleton = skeleton
+        self._axis = AXES.index(axis)
+        self._search = re.compile(search)
+        self._replace = replace
+
+    def mirrored_name(self, name):
+        """ Gets the name of the mirrored joint of a joint
+
+        Args:
+            name (str): The name of the joint
+
+        Returns:
+            (str) The mirrored name or None if the name does not match the search pattern
+        """
+        if not self._search.search(name):
+            return None
+
+        mirrored_name = self._search.sub(self._replace, name, count=1)
+
+        return mirrored_name if mirrored_name != name else None
+
+    def pairs(self):
+        """ Gets the joints that match the search pattern and the names of their mirrored joints, parents first
+
+        Returns:
+            list(tuple): The joint and the mirrored name
+        """
+        pairs = []
+
+        for joint in self._skeleton.iter_topological():
+            mirrored_name = self.mirrored_name(joint.name)
+
+            if mirrored_name is not None:
+                pairs.append((joint, mirrored_name))
+
+        return pairs
+
+    def signs(self, channel):
+        """ Gets what each axis of a channel is multiplied by when it is reflected
+
+        Args:
+            channel (str): The name of the channel, ie. '_translation'
+
+        Returns:
+            list(float)
+        """
+        if channel == '_translation':
+            return [-1.0 if axis == self._axis else 1.0 for axis in range(3)]
+
+        return [1.0 if axis == self._axis else -1.0 for axis in range(3)]
+
+    def reflect(self, joints, channel):
+        """ Reflects a channel of a list of joints
+
+        Args:
+            joints (list(JointData)): The joints to reflect
+            channel (str): The name of the channel, '_translation', '_rotation' or '_orientation'
+
+        Returns:
+            list(list(float)): The reflected values of every joint
+        """
+        signs = self.signs(channel)
+
+        if numpy is not None and joints:
+            values = numpy.array([getattr(joint, channel) for joint in joints], dtype=numpy.float64).reshape(-1, 3)
+            return (values * signs).tolist()
+
+        return [[value * sign for value, sign in zip(getattr(joint, channel), signs)] for joint in joints]
+
+    def mirror(self, create=True):
+        """ Links the mirrored joints to each other and creates the ones that are missing
+
+        Args:
+            create (bool): Create the mirrored joints that are not in the skeleton
+
+        Returns:
+            list(JointData): The created joints
+        """
+        index = self._skeleton.index
+
+        missing = []
+
+        for joint, mirrored_name in self.pairs():
+            mirrored = index.find(mirrored_name)
+
+            if mirrored is None:
+                missing.append((joint, mirrored_name))
+                continue
+
+            joint._mirrored_joint = mirrored_name
+            mirrored._mirrored_joint = joint.name
+
+        if not create or not missing:
+            return []
+
+        sources = [joint for joint, _ in missing]
+        channels = dict((channel, self.reflect(sources, channel))
+                        for channel in ('_translation', '_rotation', '_orientation'))
+
+        created = []
+
+        # the parents come before their children, so a mirrored parent is always created first
+        for i, (joint, mirrored_name) in enumerate(missing):
+            mirrored = SkeletonJoint()
+
+            mirrored._name = mirrored_name
+            mirrored._translation = channels['_translation'][i]
+            mirrored._rotation = channels['_rotation'][i]
+            mirrored._orientation = channels['_orientation'][i]
+            mirrored._scale = list(joint.scale)
+            mirrored._group = joint.group
+            mirrored._mirror = joint.mirror
+            mirrored._custom_attributes = copy.deepcopy(joint._custom_attributes)
+            mirrored._mirrored_joint = joint.name
+
+            parent_name = self.mirrored_name(joint.parent) if joint.parent else None
+            mirrored._parent = parent_name if parent_name and parent_name in index else joint.parent
+
+            mirrored = self._skeleton.add_joint(mirrored)
+
+            parent = index.find(mirrored.parent) if mirrored.parent else None
+
+            if parent is not None and mirrored_name not in parent.children:
+                parent.children.append(mirrored_name)
+
+            joint._mirrored_joint = mirrored_name
+
+            created.append(mirrored)
+
+        return created
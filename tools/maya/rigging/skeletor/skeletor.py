@@ -1,42 +1,226 @@
-__all__ = ['Skeletor']
+__all__ = ['Skeletor', 'SkeletonBuildSummary']
 
 import os
+import multiprocessing
+from timeit import default_timer
 
 # skeletor imports
 from skeleton import Skeleton
 from maya_skeleton import MayaSkeleton
-from ..Utils import using_maya
+from scene_skeleton import SceneSkeleton
+from scene_backend import get_scene_backend
+from definition_cache import DefinitionCache, get_definition_cache
+from ..Utils import using_maya, process_map
+
+
+def _load_definition(def_path):
+    """ Loads and validates a skeleton definition, this runs in the worker processes
+
+    Args:
+        def_path (str): The path to the skeleton definition
+
+    Returns:
+        (str, bytes, list(str), float) The path, the packed skeleton, the errors found and the load time
+    """
+    start = default_timer()
+
+    if not os.path.exists(def_path):
+        return def_path, None, ['Unable to find file at path {0}'.format(def_path)], default_timer() - start
+
+    skeleton = Skeleton(pooled=True)
+
+    try:
+        skeleton.load(def_path)
+    except (IOError, ValueError) as error:
+        return def_path, None, [str(error)], default_timer() - start
+
+    # the packed data is much smaller to send back than the pickled joints
+    return def_path, skeleton.pack(), skeleton.validate(), default_timer() - start
+
+
+class SkeletonTiming(object):
+    def __init__(self, name, load_time=0.0, build_time=0.0, joint_count=0, errors=None):
+        """ Constructor
+
+        Args:
+            name (str): The path or name of the skeleton
+            load_time (float): The time in seconds spent loading and validating the definition
+            build_time (float): The time in seconds spent building the skeleton
+            joint_count (int): The number of joints in the skeleton
+            errors (list(str)): The problems that stopped the skeleton from being built
+        """
+        self.name = name
+        self.load_time = load_time
+        self.build_time = build_time
+        self.joint_count = joint_count
+        self.errors = errors or []
+
+
+class SkeletonBuildSummary(object):
+    def __init__(self):
+        """ Constructor
+        """
+        self.skeletons = []
+        self.total_time = 0.0
+
+    def __str__(self):
+        lines = ['{0}: {1} joints, load {2:.3f}s, build {3:.3f}s{4}'.format(
+            timing.name, timing.joint_count, timing.load_time, timing.build_time,
+            ' ({0})'.format('; '.join(timing.errors)) if timing.errors else '') for timing in self.skeletons]
+
+        lines.append('Built {0} of {1} skeletons in {2:.3f}s'.format(
+            len([timing for timing in self.skeletons if not timing.errors]), len(self.skeletons), self.total_time))
+
+        return '\n'.join(lines)
+
+    @property
+    def failed(self):
+        """ Gets the skeletons that could not be built
+
+        Returns:
+            list(SkeletonTiming)
+        """
+        return [timing for timing in self.skeletons if timing.errors]
 
 
 class Skeletor(object):
-    def __new__(cls, prefix=''):
+    def __new__(cls, prefix='', pooled=False):
+        if get_scene_backend() is not None:
+            return SceneSkeleton(prefix, pooled)
+
         if using_maya():
-            return MayaSkeleton(prefix)
+            return MayaSkeleton(prefix, pooled)
 
-        return Skeleton(prefix)
+        return Skeleton(prefix, pooled)
 
     @classmethod
-    def build_skeletons(cls, skeletons):
+    def load_skeletons(cls, skeletons, workers=1, cache=None):
+        """ Load and validate a list of skeleton definitions, in parallel when more than one worker is used
+
+        Args:
+            skeletons: list(str) The list of paths to the skeleton definitions to load
+            workers (int): The number of processes to load with, None uses one per CPU
+            cache (bool or DefinitionCache): Reuse the definitions that were already loaded and did not change, True
+                uses the cache shared by the whole process
+
+        Returns:
+            list((str, bytes, list(str), float)) The path, packed skeleton, errors and load time of each definition
+        """
+        if cache is True:
+            cache = get_definition_cache()
+
+        if not isinstance(cache, DefinitionCache):
+            return cls._load_definitions(skeletons, workers)
+
+        results = dict()
+        stats = dict()
+
+        for def_path in skeletons:
+            start = default_timer()
+            cached = cache.get(def_path)
+
+            if cached is None:
+                stats[def_path] = cache.file_stat(def_path)
+                continue
+
+            packed, errors = cached
+
+            if errors is None:
+                # cached by Skeleton.load, which does not validate
+                skeleton = Skeleton(pooled=True)
+                skeleton.unpack(packed)
+                errors = skeleton.validate()
+                cache.put(def_path, packed, errors)
+
+            results[def_path] = (def_path, packed, errors, default_timer() - start)
+
+        missing = [def_path for def_path in skeletons if def_path not in results]
+
+        for result in cls._load_definitions(missing, workers):
+            def_path, packed = result[:2]
+
+            # the stat from before the file was read, so a file changed while loading is not cached as current
+            if packed is not None and stats.get(def_path) is not None:
+                cache.put(def_path, packed, result[2], stats[def_path])
+
+            results[def_path] = result
+
+        return [results[def_path] for def_path in skeletons]
+
+    @classmethod
+    def _load_definitions(cls, skeletons, workers=1):
+        """ Load and validate a list of skeleton definitions from disk, in parallel when more than one worker is used
+
+        Args:
+            skeletons: list(str) The list of paths to the skeleton definitions to load
+            workers (int): The number of processes to load with, None uses one per CPU
+
+        Returns:
+            list((str, bytes, list(str), float)) The path, packed skeleton, errors and load time of each definition
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+
+        if workers <= 1 or len(skeletons) <= 1:
+            return [_load_definition(def_path) for def_path in skeletons]
+
+        # the workers are new mayapy processes instead of forks of this session, the results keep the order
+        return process_map(_load_definition, skeletons, workers)
+
+    @classmethod
+    def build_skeletons(cls, skeletons, workers=1, summary=False, cache=None):
         """ Build a list of skeletons
 
+        The definitions are loaded and validated first, across worker processes when more than one worker is
+        used, then the skeletons are built one after the other in the scene.
+
         Args:
-            skeletons:  list(str) The list of paths to the skeleton definitions to build
+            skeletons:  list(str) The list of paths to the skeleton definitions to build, loaded Skeleton
+                        objects are built as they are
+            workers (int): The number of processes to load the definitions with, None uses one per CPU
+            summary (bool): Return a SkeletonBuildSummary with the load and build time of every skeleton
+            cache (bool or DefinitionCache): Reuse the definitions that were already loaded and did not change, True
+                uses the cache shared by the whole process
+
+        Returns:
+            True or SkeletonBuildSummary
         """
         if not skeletons or not isinstance(skeletons, list):
             raise ValueError("Please pass a list of paths to the skeleton definitions to build.")
 
+        start = default_timer()
+
+        def_paths = [def_path for def_path in skeletons if not isinstance(def_path, Skeleton)]
+        loaded = dict((result[0], result) for result in cls.load_skeletons(def_paths, workers, cache))
+
+        build_summary = SkeletonBuildSummary()
         skeleton_list = []
 
-        for def_path in skeletons:
-            if os.path.exists(def_path):
-                char_skeleton_def = Skeleton()
-                char_skeleton_def.load(def_path)
-                skeleton_list.append(char_skeleton_def)
+        for entry in skeletons:
+            if isinstance(entry, Skeleton):
+                timing = SkeletonTiming(str(entry), joint_count=len(entry.joints), errors=entry.validate())
+                skeleton = entry
+            else:
+                def_path, packed, errors, load_time = loaded[entry]
+                timing = SkeletonTiming(def_path, load_time=load_time, errors=errors)
+                skeleton = None
 
-        for skeleton in skeleton_list:
-            if not isinstance(skeleton, Skeleton):
-                continue
+                if packed is not None and not errors:
+                    skeleton = Skeletor()
+                    skeleton.unpack(packed)
+                    timing.joint_count = len(skeleton.joints)
+
+            build_summary.skeletons.append(timing)
+
+            if skeleton is not None and not timing.errors:
+                skeleton_list.append((skeleton, timing))
+
+        for skeleton, timing in skeleton_list:
+            timing.build_time = skeleton.build().total_time
+
+        build_summary.total_time = default_timer() - start
 
-            skeleton.build()
+        if summary:
+            return build_summary
 
         return True
@@ -0,0 +1,112 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.exporter import Exporter
+from tools.maya.exporter.export_options import ExportOptions
+from tools.maya.exporter.export_manifest import ExportManifest
+from tools.maya.exporter.parallel_export import StubExportWorker
+
+OPTIONS = {"triangulate": True, "ascii": True}
+
+
+class ExportManifestTests(TestCase):
+    """ Tests skipping unchanged files with the export manifest.
+    """
+
+    def setUp(self):
+        """ Setup a fake Maya file and its export.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._output_folder = os.path.join(self._temp_dir, "fbx")
+
+        os.makedirs(self._output_folder)
+
+        self._source = os.path.join(self._temp_dir, "asset.ma")
+        self._output = os.path.join(self._output_folder, "asset.fbx")
+
+        self.write(self._source, "//Maya ASCII scene\n")
+        self.write(self._output, "; FBX\n")
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        shutil.rmtree(self._temp_dir)
+
+    @staticmethod
+    def write(path, text):
+        """ Write a text file.
+        """
+        with open(path, "w") as text_file:
+            text_file.write(text)
+
+    def test_dirty(self):
+        """ Test that only changed files have to be exported again.
+        """
+        manifest = ExportManifest(self._output_folder)
+
+        self.assertTrue(manifest.is_dirty(self._source, self._output, OPTIONS))
+
+        manifest.record(self._source, self._output, OPTIONS)
+        manifest.save()
+
+        manifest = ExportManifest(self._output_folder)
+
+        self.assertFalse(manifest.is_dirty(self._source, self._output, OPTIONS))
+        self.assertTrue(manifest.is_dirty(self._source, self._output, {"triangulate": False, "ascii": True}))
+
+        # touching the file without changing it does not need an export
+        stat = os.stat(self._source)
+        os.utime(self._source, (stat.st_atime, stat.st_mtime + 10))
+        self.assertFalse(manifest.is_dirty(self._source, self._output, OPTIONS))
+
+        self.write(self._source, "//Maya ASCII scene changed\n")
+        self.assertTrue(manifest.is_dirty(self._source, self._output, OPTIONS))
+
+        os.remove(self._output)
+        self.assertTrue(manifest.is_dirty(self._source, self._output, OPTIONS))
+
+    def test_changed_during_export(self):
+        """ Test that a source saved while it is exported is exported again.
+        """
+        manifest = ExportManifest(self._output_folder)
+
+        state = manifest.get_file_state(self._source)
+        self.write(self._source, "//Maya ASCII scene saved during the export\n")
+        manifest.record(self._source, self._output, OPTIONS, state)
+
+        self.assertTrue(manifest.is_dirty(self._source, self._output, OPTIONS))
+
+    def test_prune(self):
+        """ Test that the exports of deleted sources are removed.
+        """
+        manifest = ExportManifest(self._output_folder)
+        manifest.record(self._source, self._output, OPTIONS)
+
+        self.assertEqual(manifest.prune([self._source]), [])
+
+        os.remove(self._source)
+
+        self.assertEqual(manifest.prune([]), [self._output])
+        self.assertFalse(os.path.exists(self._output))
+        self.assertEqual(manifest.entries, {})
+
+    def test_incremental_batch(self):
+        """ Test that a batch exported by workers without options records the options the workers used.
+        """
+        exported = []
+
+        def on_file(source, output, success):
+            exported.append(source)
+
+        for _ in range(2):
+            for _ in Exporter.batch_export_fbx(self._temp_dir, self._output_folder, 2, StubExportWorker(),
+                                               incremental=True, on_file=on_file):
+                pass
+
+        self.assertEqual(exported, [self._source])
+        self.assertFalse(ExportManifest(self._output_folder).is_dirty(self._source, self._output,
+                                                                      ExportOptions().as_dict()))
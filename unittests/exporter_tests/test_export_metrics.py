@@ -0,0 +1,130 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.exporter import Exporter
+from tools.maya.exporter.export_options import ExportOptions
+from tools.maya.exporter.parallel_export import StubExportWorker
+from tools.maya.exporter.export_metrics import (PhaseTimer, MemorySink, JsonLinesSink, ExportInstrumentation,
+                                                ExportTimingReport, percentile)
+
+
+class FakeClock(object):
+    """ A clock that only moves when it is told to.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ExportMetricsTests(TestCase):
+    """ Tests the per file export timings and the timing report.
+    """
+
+    def setUp(self):
+        """ Setup a folder of fake Maya files.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._input_folder = os.path.join(self._temp_dir, "maya")
+        self._output_folder = os.path.join(self._temp_dir, "fbx")
+
+        os.makedirs(self._input_folder)
+
+        for i in range(10):
+            with open(os.path.join(self._input_folder, "asset_{0:02d}.ma".format(i)), "w") as maya_file:
+                maya_file.write("//Maya ASCII scene\n")
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def test_phase_timer(self):
+        """ Test that nested phases are only counted once and repeated phases add up.
+        """
+        clock = FakeClock()
+        timer = PhaseTimer(clock=clock)
+
+        with timer.phase("open"):
+            clock.now += 1.0
+
+            with timer.phase("export"):
+                clock.now += 2.0
+
+            clock.now += 0.5
+
+        with timer.phase("open"):
+            clock.now += 0.25
+
+        timer.add("discover", 0.1)
+
+        self.assertEqual(dict(timer.phases), {"open": 1.75, "export": 2.0, "discover": 0.1})
+        self.assertAlmostEqual(timer.total, 3.85)
+
+    def test_percentile(self):
+        """ Test the percentiles of sorted values.
+        """
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        self.assertEqual(percentile(values, 50), 3.0)
+        self.assertEqual(percentile(values, 90), 4.6)
+        self.assertEqual(percentile(values, 100), 5.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_batch_instrumentation(self):
+        """ Test that every exported file is recorded with its phases, output size and error.
+        """
+        records_path = os.path.join(self._temp_dir, "metrics", "export.jsonl")
+        sink = MemorySink()
+
+        with ExportInstrumentation([sink, JsonLinesSink(records_path, append=False)]) as instrumentation:
+            for _ in Exporter.batch_export_fbx(self._input_folder, self._output_folder, 2,
+                                               StubExportWorker(fail_on="_04"), options=ExportOptions(),
+                                               instrumentation=instrumentation):
+                pass
+
+        self.assertEqual(len(sink.records), 10)
+        self.assertEqual(JsonLinesSink.read(records_path), sink.records)
+
+        failed = [record for record in sink.records if not record["success"]]
+
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0]["error"], "Unable to export {0}".format(failed[0]["source"]))
+        self.assertIsNone(failed[0]["size"])
+
+        for record in sink.records:
+            # a failed file keeps the phases it got through before the error
+            self.assertEqual(sorted(record["phases"]), ["configure", "discover", "export", "write"])
+            self.assertGreaterEqual(record["duration"] + 1e-6, sum(record["phases"].values()))
+
+            if record["success"]:
+                self.assertEqual(record["size"], os.path.getsize(record["output"]))
+
+        report = instrumentation.report(slowest=3)
+
+        self.assertEqual((report.count, len(report.failed)), (10, 1))
+        self.assertEqual(list(report.phases), ["discover", "configure", "export", "write", "total"])
+        self.assertEqual(len(report.slowest), 3)
+        self.assertEqual(report.slowest[0]["duration"], report.phases["total"]["max"])
+        self.assertLessEqual(report.phases["export"]["p50"], report.phases["export"]["p90"])
+        self.assertIn("p99", str(report))
+        self.assertEqual(report.as_dict()["failed"], 1)
+
+        # the report of a nightly run can be made again from its records
+        self.assertEqual(ExportTimingReport(JsonLinesSink.read(records_path)).phases, report.phases)
+
+    def test_read_damaged_records(self):
+        """ Test that a record cut off by a crash is skipped.
+        """
+        path = os.path.join(self._temp_dir, "export.jsonl")
+
+        with open(path, "w") as records_file:
+            records_file.write('{"source": "a.ma"}\n{"source": "b.')
+
+        self.assertEqual(JsonLinesSink.read(path), [{"source": "a.ma"}])
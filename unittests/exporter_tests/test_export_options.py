@@ -0,0 +1,77 @@
+# standard library imports
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.export_options import ExportOptions, FbxOptionState
+
+
+class ExportOptionsTests(TestCase):
+    """ Tests caching the FBX options and saving presets.
+    """
+
+    def setUp(self):
+        """ Forget the options set by other tests.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._mel_cmds = []
+
+        FbxOptionState.reset()
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        shutil.rmtree(self._temp_dir)
+
+        FbxOptionState.reset()
+
+    def test_apply_changed_only(self):
+        """ Test that only the options that changed are set again.
+        """
+        options = ExportOptions(triangulate=True)
+
+        self.assertEqual(len(options.apply(self._mel_cmds.append)), 5)
+        self.assertIn("FBXExportTriangulate -v true;", self._mel_cmds)
+
+        # nothing changed
+        self.assertEqual(options.apply(self._mel_cmds.append), [])
+
+        options.triangulate = False
+        self.assertEqual(options.apply(self._mel_cmds.append), ["FBXExportTriangulate -v false;"])
+
+        self.assertEqual(len(options.apply(self._mel_cmds.append, force=True)), 5)
+
+    def test_bake_range(self):
+        """ Test that the bake range is only set when baking.
+        """
+        self.assertNotIn("bake_start", ExportOptions(bake_start=10, bake_end=20).get_fbx_options())
+
+        fbx_options = ExportOptions(bake_animation=True, bake_start=10, bake_end=20).get_fbx_options()
+        self.assertEqual((fbx_options["bake_start"], fbx_options["bake_end"]), (10, 20))
+
+    def test_presets(self):
+        """ Test saving and loading presets.
+        """
+        options = ExportOptions(triangulate=True, ascii=False, bake_animation=True, bake_end=48)
+        options.save_preset("game", self._temp_dir)
+        ExportOptions().save_preset("default", self._temp_dir)
+
+        self.assertEqual(ExportOptions.list_presets(self._temp_dir), ["default", "game"])
+        self.assertEqual(ExportOptions.load_preset("game", self._temp_dir), options)
+        self.assertNotEqual(ExportOptions.load_preset("default", self._temp_dir), options)
+
+        self.assertRaises(IOError, ExportOptions.load_preset, "missing", self._temp_dir)
+        self.assertRaises(ValueError, ExportOptions.from_dict, {"unknown": True})
+
+    def test_scene_mode(self):
+        """ Test that files matching the open patterns are always opened.
+        """
+        options = ExportOptions(scene_mode="reference", open_patterns=["*_cinematic*"])
+
+        self.assertEqual(options.get_scene_mode("/anims/run.ma"), "reference")
+        self.assertEqual(options.get_scene_mode("/anims/intro_cinematic.mb"), "open")
+        self.assertEqual(ExportOptions().get_scene_mode("/anims/run.ma"), "open")
+
+        self.assertRaises(ValueError, ExportOptions, scene_mode="merge")
+        self.assertEqual(ExportOptions.from_dict(options.as_dict()), options)
@@ -0,0 +1,59 @@
+# standard library imports
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.export_progress import ExportProgress
+
+
+class FakeClock(object):
+    """ A clock that only moves when told to.
+    """
+
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+class ExportProgressTests(TestCase):
+    """ Tests the throughput and time estimates of a batch export.
+    """
+
+    def test_throughput(self):
+        """ Test the files per minute and the time left.
+        """
+        clock = FakeClock()
+        progress = ExportProgress(clock)
+
+        self.assertEqual(progress.files_per_minute, 0.0)
+        self.assertIsNone(progress.eta)
+
+        clock.time += 30
+        progress.record(True)
+        progress.record(False)
+        progress.update(25.0)
+
+        self.assertEqual(progress.files_per_minute, 4.0)
+        self.assertEqual(progress.eta, 90.0)
+        self.assertEqual(ExportProgress.format_time(progress.eta), "00:01:30")
+        self.assertEqual(ExportProgress.format_time(None), "--:--:--")
+
+    def test_pause(self):
+        """ Test that the time spent paused is not counted.
+        """
+        clock = FakeClock()
+        progress = ExportProgress(clock)
+
+        clock.time += 10
+        progress.pause()
+        clock.time += 50
+
+        self.assertTrue(progress.paused)
+        self.assertEqual(progress.elapsed, 10.0)
+
+        progress.resume()
+        clock.time += 5
+
+        self.assertFalse(progress.paused)
+        self.assertEqual(progress.elapsed, 15.0)
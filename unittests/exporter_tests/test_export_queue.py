@@ -0,0 +1,210 @@
+# standard library imports
+import os
+import sys
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.exporter import Exporter
+from tools.maya.exporter.parallel_export import StubExportWorker
+from tools.maya.exporter.export_queue import ExportJobQueue, PENDING, RUNNING, DONE, FAILED
+
+
+class ExportQueueTests(TestCase):
+    """ Tests the persistent export job queue.
+    """
+
+    def setUp(self):
+        """ Setup a folder of fake Maya files and a queue.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._input_folder = os.path.join(self._temp_dir, "maya")
+        self._output_folder = os.path.join(self._temp_dir, "fbx")
+        self._queue_path = os.path.join(self._temp_dir, "queue", "export_queue.db")
+
+        os.makedirs(self._input_folder)
+
+        self._jobs = []
+
+        for i in range(8):
+            source = os.path.join(self._input_folder, "asset_{0:02d}.ma".format(i))
+
+            with open(source, "w") as maya_file:
+                maya_file.write("//Maya ASCII scene\n")
+
+            self._jobs.append((source, os.path.join(self._output_folder, "asset_{0:02d}.fbx".format(i))))
+
+        self._queue = ExportJobQueue(self._queue_path)
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        self._queue.close()
+        shutil.rmtree(self._temp_dir)
+
+    def test_jobs(self):
+        """ Test claiming jobs and storing their outcome.
+        """
+        self._queue.max_attempts = 1
+
+        self.assertEqual(self._queue.add(self._jobs), 8)
+        self.assertEqual(self._queue.add(self._jobs[:2]), 0)
+        self.assertEqual(len(self._queue), 8)
+
+        first = self._queue.claim("worker")
+        second = self._queue.claim("worker")
+
+        self.assertEqual((first.source, first.status, first.attempts, first.worker),
+                         (self._jobs[0][0], RUNNING, 1, "worker"))
+
+        self._queue.complete(first, 1.5)
+        self._queue.fail(second, "Unable to export")
+
+        self.assertEqual(self._queue.counts(), {PENDING: 6, RUNNING: 0, DONE: 1, FAILED: 1})
+        self.assertEqual(self._queue.get(self._jobs[0][0]).duration, 1.5)
+        self.assertEqual(self._queue.get(self._jobs[1][0]).error, "Unable to export")
+        self.assertEqual(self._queue.progress(), 25.0)
+
+        self.assertEqual(self._queue.retry(), 1)
+        self.assertEqual(self._queue.add(self._jobs[:1], reset=True), 1)
+        self.assertEqual([job.source for job in self._queue.jobs(DONE)], [])
+
+        self._queue.clear(PENDING)
+        self.assertEqual(len(self._queue), 0)
+
+    def test_attempts(self):
+        """ Test that failed jobs are queued again while they have attempts left.
+        """
+        self._queue.max_attempts = 2
+        self._queue.add(self._jobs[:2])
+
+        job = self._queue.claim()
+        self._queue.fail(job, "first")
+
+        # the jobs that were not tried yet go first
+        self.assertEqual(self._queue.claim().source, self._jobs[1][0])
+
+        job = self._queue.claim()
+        self.assertEqual((job.source, job.attempts), (self._jobs[0][0], 2))
+
+        self._queue.fail(job, "second")
+        self.assertEqual(self._queue.get(self._jobs[0][0]).status, FAILED)
+
+        self.assertEqual(self._queue.retry([self._jobs[0][0]]), 1)
+        self.assertEqual(self._queue.get(self._jobs[0][0]).attempts, 0)
+
+    def test_recover(self):
+        """ Test that the jobs left running by a crashed session are queued again.
+        """
+        self._queue.add(self._jobs)
+
+        crashed = ExportJobQueue(self._queue_path)
+        crashed.claim()
+        crashed.close()
+
+        self.assertEqual(self._queue.recover(stale_after=60), 0)
+        self.assertEqual(self._queue.recover(), 1)
+
+        job = self._queue.get(self._jobs[0][0])
+        self.assertEqual((job.status, job.error), (PENDING, "The export was interrupted."))
+
+        # the recovered job goes after the jobs that were not tried yet
+        self._queue.max_attempts = 1
+        self.assertEqual(self._queue.claim().source, self._jobs[1][0])
+        self.assertEqual(self._queue.recover(), 1)
+        self.assertEqual(self._queue.get(self._jobs[1][0]).status, FAILED)
+
+    def test_recover_dead_workers(self):
+        """ Test that only the jobs of sessions that are no longer running are recovered.
+        """
+        self._queue.add(self._jobs)
+
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+
+        running = self._queue.claim()
+        dead = self._queue.claim("{0}:{1}".format(socket.gethostname(), process.pid))
+        remote = self._queue.claim("render-farm-01:1234")
+
+        self.assertEqual(self._queue.recover(dead_workers=True), 1)
+        self.assertEqual(self._queue.get(dead.source).status, PENDING)
+        self.assertEqual(self._queue.get(running.source).status, RUNNING)
+        self.assertEqual(self._queue.get(remote.source).status, RUNNING)
+
+        # the jobs of other machines are recovered once they are stale
+        self.assertEqual(self._queue.recover(stale_after=60, dead_workers=True), 0)
+        self.assertEqual(self._queue.recover(stale_after=0, dead_workers=True), 1)
+        self.assertEqual(self._queue.get(remote.source).status, PENDING)
+        self.assertEqual(self._queue.get(running.source).status, RUNNING)
+
+    def test_shared_queue(self):
+        """ Test that several sessions pulling from the same queue never get the same job.
+        """
+        self._queue.add(self._jobs)
+        claimed = []
+
+        def pull():
+            queue = ExportJobQueue(self._queue_path)
+
+            try:
+                job = queue.claim()
+
+                while job is not None:
+                    claimed.append(job.source)
+                    queue.complete(job)
+                    job = queue.claim()
+            finally:
+                queue.close()
+
+        threads = [threading.Thread(target=pull) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(claimed), sorted(job[0] for job in self._jobs))
+        self.assertEqual(self._queue.counts()[DONE], len(self._jobs))
+
+    def test_export_queue(self):
+        """ Test exporting a queue, stopping it partway and resuming it.
+        """
+        self.assertEqual(Exporter.queue_batch(self._queue, self._input_folder, self._output_folder), 8)
+
+        self._queue.max_attempts = 1
+        worker = StubExportWorker(fail_on="_03", crash_on="_05")
+
+        for progress in Exporter.export_queue(self._queue, workers=2, worker=worker):
+            # a job is only claimed once a worker is free to export it, and the worker whose file just finished is
+            # not handed the next one until the batch is resumed
+            self.assertLessEqual(self._queue.counts()[RUNNING], 1)
+
+            if progress >= 25:
+                break
+
+        counts = self._queue.counts()
+        self.assertEqual(counts[RUNNING], 0)
+        self.assertEqual(counts[PENDING] + counts[DONE] + counts[FAILED], 8)
+
+        # the exports that were stopped used their attempt, the files that were only claimed were not
+        stopped = [job.source for job in self._queue.jobs(FAILED)
+                   if job.error == "The export was stopped before it finished."]
+        self.assertTrue(all(job.attempts == 0 for job in self._queue.jobs(PENDING)))
+        self.assertEqual(self._queue.retry(stopped), len(stopped))
+
+        results = []
+        pending = self._queue.counts()[PENDING]
+        progress = list(Exporter.export_queue(self._queue, workers=2, worker=worker,
+                                              on_file=lambda *args: results.append(args)))
+
+        self.assertEqual(progress[-1], 100.0)
+        self.assertEqual(len(results), pending)
+        self.assertEqual(sorted(os.path.basename(job.source) for job in self._queue.jobs(FAILED)),
+                         ["asset_03.ma", "asset_05.ma"])
+        self.assertTrue(all(os.path.exists(job.output) for job in self._queue.jobs(DONE)))
+        self.assertEqual(len(self._queue.jobs(DONE)), 6)
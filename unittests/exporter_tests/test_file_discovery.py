@@ -0,0 +1,81 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+import itertools
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.file_discovery import iter_files, FileDiscovery
+
+
+class FileDiscoveryTests(TestCase):
+    """ Tests finding the Maya files to export.
+    """
+
+    def setUp(self):
+        """ Setup a nested folder of fake Maya files.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+
+        for relative_path in ("root.ma", "notes.txt", "characters/hero.mb", "characters/hero_backup.ma",
+                              "characters/anims/run.ma", "props/crate.ma", "incrementalSave/root.0001.ma"):
+            path = os.path.join(self._temp_dir, *relative_path.split("/"))
+
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            with open(path, "w") as maya_file:
+                maya_file.write("//Maya ASCII scene\n")
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def relative(self, paths):
+        """ Get the paths relative to the test folder.
+        """
+        return [os.path.relpath(path, self._temp_dir).replace("\\", "/") for path in paths]
+
+    def test_recursive(self):
+        """ Test walking the sub folders.
+        """
+        self.assertEqual(self.relative(iter_files(self._temp_dir, (".ma", ".mb"), exclude=["incrementalSave"])),
+                         ["root.ma", "characters/hero.mb", "characters/hero_backup.ma", "characters/anims/run.ma",
+                          "props/crate.ma"])
+
+        self.assertEqual(self.relative(iter_files(self._temp_dir, (".ma", ".mb"), recursive=False)), ["root.ma"])
+
+    def test_patterns(self):
+        """ Test the include and exclude patterns.
+        """
+        files = iter_files(self._temp_dir, (".ma", ".mb"), include=["characters/*"], exclude=["*_backup*"])
+
+        self.assertEqual(self.relative(files), ["characters/hero.mb", "characters/anims/run.ma"])
+
+    def test_background_discovery(self):
+        """ Test running the search on a background thread.
+        """
+        discovery = FileDiscovery(iter_files(self._temp_dir, (".ma",)))
+
+        files = list(discovery)
+
+        self.assertEqual(len(files), 5)
+        self.assertEqual(discovery.count, 5)
+        self.assertTrue(discovery.finished)
+
+        self.assertRaises(IOError, list, FileDiscovery(iter_files(os.path.join(self._temp_dir, "missing"), (".ma",))))
+
+    def test_stop_discovery(self):
+        """ Test that the search stops once the files stop being used.
+        """
+        discovery = FileDiscovery("asset_{0}.ma".format(i) for i in itertools.count())
+
+        files = iter(discovery)
+        next(files)
+        files.close()
+
+        discovery._thread.join(5)
+
+        self.assertTrue(discovery.finished)
@@ -0,0 +1,68 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.exporter.parallel_export import ParallelExporter, StubExportWorker
+
+
+class ParallelExportTests(TestCase):
+    """ Tests exporting across worker processes with a stub worker.
+    """
+
+    def setUp(self):
+        """ Setup a folder of fake Maya files.
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._jobs = []
+
+        for i in range(12):
+            source = os.path.join(self._temp_dir, "asset_{0:02d}.ma".format(i))
+
+            with open(source, "w") as maya_file:
+                maya_file.write("//Maya ASCII scene\n")
+
+            self._jobs.append((source, os.path.join(self._temp_dir, "fbx", "asset_{0:02d}.fbx".format(i))))
+
+    def tearDown(self):
+        """ Clean up the temporary files.
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def test_export(self):
+        """ Test that every file is exported once.
+        """
+        exporter = ParallelExporter(3, StubExportWorker())
+
+        results = list(exporter.run(self._jobs))
+
+        self.assertEqual(sorted(result.source for result in results), sorted(job[0] for job in self._jobs))
+        self.assertEqual(exporter.failures, [])
+        self.assertTrue(all(os.path.exists(job[1]) for job in self._jobs))
+        self.assertEqual(len(set(result.worker for result in results)), 3)
+
+    def test_failures(self):
+        """ Test that failed exports and crashed workers are reported without stopping the batch.
+        """
+        exporter = ParallelExporter(2, StubExportWorker(fail_on="_03", crash_on="_07"))
+
+        results = list(exporter.run(self._jobs))
+
+        self.assertEqual(len(results), len(self._jobs))
+        self.assertEqual(sorted(os.path.basename(result.source) for result in exporter.failures),
+                         ["asset_03.ma", "asset_07.ma"])
+        self.assertTrue(os.path.exists(self._jobs[11][1]))
+
+    def test_stop_early(self):
+        """ Test that stopping the iteration does not export the remaining files.
+        """
+        exporter = ParallelExporter(2, StubExportWorker())
+
+        for _ in exporter.run(self._jobs):
+            break
+
+        exported = [job for job in self._jobs if os.path.exists(job[1])]
+
+        self.assertLessEqual(len(exported), 2)
@@ -0,0 +1,140 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.animation import AnimationClip, AnimationCurve, animation_path, frame_range
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class WavingSkeleton(Skeleton):
+    """ A skeleton that moves every joint up by the frame and turns it around x by twice the frame.
+    """
+
+    def sample_pose(self, frame=None, channels=('_translation', '_rotation', '_scale')):
+        pose = super(WavingSkeleton, self).sample_pose(frame, channels)
+
+        for i in range(1, len(pose['_translation']), 3):
+            pose['_translation'][i] += frame
+            pose['_rotation'][i - 1] += frame * 2
+
+        return pose
+
+
+class AnimationTests(TestCase):
+    """ Tests the animation curves and clips.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Remove the saved clips
+        """
+        shutil.rmtree(self._folder)
+
+    def test_curve(self):
+        """ Test adding keys and interpolating between them
+        """
+        curve = AnimationCurve()
+        curve.add_key(10.0, [10.0, 0.0, 1.0])
+        curve.add_key(0.0, [0.0, 0.0, 1.0])
+        curve.add_key(20.0, [10.0, 20.0, 1.0])
+        curve.add_key(10.0, [10.0, 10.0, 1.0])
+
+        self.assertEqual(list(curve.times), [0.0, 10.0, 20.0])
+        self.assertEqual(curve.key(-1), (20.0, [10.0, 20.0, 1.0]))
+        self.assertEqual(curve.evaluate(5.0), [5.0, 5.0, 1.0])
+        self.assertEqual(curve.evaluate(-5.0), [0.0, 0.0, 1.0])
+        self.assertEqual(curve.evaluate(25.0), [10.0, 20.0, 1.0])
+        self.assertEqual(list(curve.sample([15.0, 5.0])), [10.0, 15.0, 1.0, 5.0, 5.0, 1.0])
+
+        resampled = curve.resample(frame_range(0.0, 20.0, 5.0))
+        self.assertEqual(len(resampled), 5)
+        self.assertEqual(resampled.evaluate(15.0), [10.0, 15.0, 1.0])
+
+        curve.remove_key(1)
+        self.assertEqual(curve.evaluate(10.0), [5.0, 10.0, 1.0])
+
+        self.assertRaises(ValueError, curve.add_key, 30.0, [1.0])
+        self.assertRaises(ValueError, AnimationCurve, [0.0], [1.0, 2.0])
+        self.assertRaises(ValueError, AnimationCurve().evaluate, 0.0)
+
+    def test_capture(self):
+        """ Test capturing a frame range from a skeleton and posing a skeleton from the clip
+        """
+        for pooled in (False, True):
+            skeleton = WavingSkeleton(pooled=pooled)
+            skeleton.load(CHARACTER_PATH)
+
+            clip = skeleton.capture_animation(0.0, 24.0, name='wave')
+
+            self.assertEqual(len(clip.joints), len(skeleton.joints))
+            self.assertEqual(len(clip), len(skeleton.joints) * 3)
+            self.assertEqual(clip.key_count, len(skeleton.joints) * 3 * 25)
+            self.assertEqual((clip.start, clip.end), (0.0, 24.0))
+
+            wrist = skeleton.find('LWrist')
+            translation = list(wrist.translation)
+
+            self.assertEqual(clip.curve('LWrist', 'translation').evaluate(12.0),
+                             [translation[0], translation[1] + 12.0, translation[2]])
+            self.assertEqual(clip.curve('LWrist', '_rotation').evaluate(12.5)[0], wrist.rotation[0] + 25.0)
+            self.assertIsNone(clip.curve('LWrist', 'orientation'))
+
+            clip.pose(skeleton, 6.0)
+            self.assertEqual(list(skeleton.find('LWrist').translation),
+                             [translation[0], translation[1] + 6.0, translation[2]])
+
+    def test_resample(self):
+        """ Test resampling a clip to fewer frames
+        """
+        skeleton = WavingSkeleton()
+        skeleton.load(CHARACTER_PATH)
+
+        clip = skeleton.capture_animation(0.0, 10.0, step=0.5)
+        resampled = clip.resample(2.0)
+
+        self.assertEqual(list(resampled.curve('Root', 'translation').times), [0.0, 2.0, 4.0, 6.0, 8.0, 10.0])
+
+        for joint, channel, curve in resampled:
+            self.assertEqual(curve.evaluate(4.0), clip.curve(joint, channel).evaluate(4.0))
+
+        self.assertRaises(ValueError, clip.resample, 0.0)
+
+    def test_save_and_load(self):
+        """ Test saving a clip next to the skeleton definition and loading it back
+        """
+        skeleton = WavingSkeleton()
+        skeleton.load(CHARACTER_PATH)
+
+        clip = skeleton.capture_animation(0.0, 30.0, name='wave', frame_rate=24.0)
+        clip.curve('Root', 'translation').remove_key(3)
+
+        path = animation_path(os.path.join(self._folder, 'character.json'), clip.name)
+        self.assertEqual(os.path.basename(path), 'character.wave.ska')
+
+        clip.save(path)
+
+        for use_mmap in (True, False):
+            loaded = AnimationClip.load(path, use_mmap)
+
+            self.assertEqual((loaded.name, loaded.frame_rate), ('wave', 24.0))
+            self.assertEqual(loaded.joints, clip.joints)
+            self.assertEqual(list(loaded), list(clip))
+
+        clip.save(path, float_size=4)
+        loaded = AnimationClip.load(path)
+
+        self.assertEqual(loaded.key_count, clip.key_count)
+        self.assertAlmostEqual(loaded.curve('LWrist', 'rotation').evaluate(30.0)[0],
+                               clip.curve('LWrist', 'rotation').evaluate(30.0)[0], places=4)
+
+        self.assertRaises(IOError, AnimationClip.unpack, skeleton.pack())
@@ -0,0 +1,100 @@
+# standard library imports
+import os
+import json
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.binary_format import pack_pool, unpack_pool
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class BinaryFormatTests(TestCase):
+    """ Tests the binary skeleton format.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._temp_dir = tempfile.mkdtemp()
+
+        self._skeleton = Skeleton()
+        self._skeleton.load(CHARACTER_PATH)
+
+        # make sure the sparse data is covered as well
+        self._skeleton.joints[3].add_attribute('driver', [1, 2])
+        self._skeleton.joints[4].group = 'legs'
+        self._skeleton.joints[5].mirror = True
+
+    def tearDown(self):
+        """ Clean up the temporary files
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def test_round_trip(self):
+        """ Test that saving and loading the binary format gives back the same joint data
+        """
+        binary_path = os.path.join(self._temp_dir, 'character.skb')
+        self._skeleton.save(binary_path)
+
+        for pooled in (False, True):
+            loaded = Skeleton(pooled=pooled)
+            loaded.load(binary_path)
+
+            self.assertEqual([joint.as_json() for joint in loaded.joints],
+                             [joint.as_json() for joint in self._skeleton.joints])
+            self.assertEqual(loaded.find('Root').parent, 'Parent')
+
+    def test_json_round_trip(self):
+        """ Test that converting to binary and back to jSON is lossless
+        """
+        binary_path = os.path.join(self._temp_dir, 'character.skb')
+        json_path = os.path.join(self._temp_dir, 'character.json')
+
+        self._skeleton.save(binary_path)
+
+        loaded = Skeleton()
+        loaded.load(binary_path)
+        loaded.save(json_path)
+
+        with open(json_path) as json_file:
+            saved = json.load(json_file)
+
+        self.assertEqual(saved['_joints'], [joint.as_json() for joint in self._skeleton.joints])
+
+    def test_format_argument(self):
+        """ Test picking the format explicitly
+        """
+        data_path = os.path.join(self._temp_dir, 'character.dat')
+        self._skeleton.save(data_path, format='binary')
+
+        loaded = Skeleton()
+        loaded.load(data_path, format='binary')
+
+        self.assertEqual(len(loaded.joints), len(self._skeleton.joints))
+        self.assertRaises(ValueError, self._skeleton.save, data_path, format='xml')
+        self.assertRaises(ValueError, loaded.load, data_path, format='xml')
+
+    def test_float_size(self):
+        """ Test that single precision files are smaller
+        """
+        pooled = Skeleton(pooled=True)
+        pooled.load(CHARACTER_PATH)
+
+        double_data = pack_pool(pooled.pool)
+        float_data = pack_pool(pooled.pool, float_size=4)
+
+        self.assertLess(len(float_data), len(double_data))
+
+        pool, data = unpack_pool(float_data)
+        self.assertAlmostEqual(pool[1].translation[1], pooled.joints[1].translation[1], places=5)
+        self.assertEqual(data['_prefix'], '')
+
+    def test_invalid_data(self):
+        """ Test that other files are rejected
+        """
+        self.assertRaises(IOError, unpack_pool, b'JSON' + b'\0' * 64)
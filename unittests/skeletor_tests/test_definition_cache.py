@@ -0,0 +1,178 @@
+# standard library imports
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.skeletor import Skeletor
+from tools.maya.rigging.skeletor.definition_cache import DefinitionCache
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class DefinitionCacheTests(TestCase):
+    """ Tests caching the skeleton definitions between loads.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._temp_dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._temp_dir, 'character.json')
+        shutil.copy(CHARACTER_PATH, self._path)
+
+    def tearDown(self):
+        """ Clean up the temporary files
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def _touch(self, path, offset):
+        """ Moves the modification time of a file, so a change is seen even on file systems with coarse times
+        """
+        mtime = os.stat(path).st_mtime + offset
+        os.utime(path, (mtime, mtime))
+
+    def test_hits(self):
+        """ Test that a repeated load comes from the cache and matches a load from disk
+        """
+        cache = DefinitionCache()
+
+        first = Skeleton()
+        first.load(self._path, cache=cache)
+
+        second = Skeleton(pooled=True)
+        second.load(os.path.join(self._temp_dir, '.', 'character.json'), cache=cache)
+
+        expected = Skeleton()
+        expected.load(self._path)
+
+        self.assertEqual([joint.as_json() for joint in second.joints], [joint.as_json() for joint in expected.joints])
+        self.assertEqual(second.prefix, expected.prefix)
+
+        stats = cache.stats
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.size, len(expected.pack()))
+        self.assertAlmostEqual(stats.hit_rate, 0.5)
+
+        # subsets are read from disk
+        subset = Skeleton()
+        subset.load(self._path, root='LWrist', cache=cache)
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_copies(self):
+        """ Test that changing a skeleton from the cache does not change the cached definition
+        """
+        cache = DefinitionCache()
+
+        first = Skeleton(pooled=True)
+        first.load(self._path, cache=cache)
+        first.find('Root').translation = [100.0, 0.0, 0.0]
+        first.remove_joint('Dummy_LHeel_1')
+
+        second = Skeleton(pooled=True)
+        second.load(self._path, cache=cache)
+
+        self.assertNotEqual(second.find('Root').translation, [100.0, 0.0, 0.0])
+        self.assertIsNotNone(second.find('Dummy_LHeel_1'))
+
+    def test_invalidation(self):
+        """ Test that a changed file is read again
+        """
+        cache = DefinitionCache()
+
+        skeleton = Skeleton()
+        skeleton.load(self._path, cache=cache)
+        skeleton.remove_joint('Dummy_LHeel_1')
+        skeleton.save(self._path)
+        self._touch(self._path, 10)
+
+        reloaded = Skeleton()
+        reloaded.load(self._path, cache=cache)
+
+        self.assertIsNone(reloaded.find('Dummy_LHeel_1'))
+        self.assertEqual(cache.stats.invalidations, 1)
+        self.assertEqual(cache.stats.misses, 2)
+
+        self.assertTrue(cache.invalidate(self._path))
+        self.assertFalse(cache.invalidate(self._path))
+        self.assertNotIn(self._path, cache)
+
+    def test_hash(self):
+        """ Test that a touched file with the same content stays cached when the content hash is checked
+        """
+        cache = DefinitionCache(use_hash=True)
+
+        Skeleton().load(self._path, cache=cache)
+        self._touch(self._path, 10)
+        Skeleton().load(self._path, cache=cache)
+
+        self.assertEqual((cache.stats.hits, cache.stats.invalidations), (1, 0))
+
+        cache = DefinitionCache()
+
+        Skeleton().load(self._path, cache=cache)
+        self._touch(self._path, 10)
+        Skeleton().load(self._path, cache=cache)
+
+        self.assertEqual((cache.stats.hits, cache.stats.invalidations), (0, 1))
+
+    def test_eviction(self):
+        """ Test that the least recently used definitions are dropped to stay in the memory budget
+        """
+        paths = []
+
+        for i in range(3):
+            path = os.path.join(self._temp_dir, 'character_{0}.json'.format(i))
+            shutil.copy(CHARACTER_PATH, path)
+            paths.append(path)
+
+        # the packed data includes the path, which has the same length for all three
+        skeleton = Skeleton()
+        skeleton.load(paths[0])
+        size = len(skeleton.pack())
+
+        cache = DefinitionCache(max_bytes=size * 2)
+
+        for path in paths[:2]:
+            Skeleton().load(path, cache=cache)
+
+        # touching the first definition makes the second one the least recently used
+        Skeleton().load(paths[0], cache=cache)
+        Skeleton().load(paths[2], cache=cache)
+
+        self.assertIn(paths[0], cache)
+        self.assertNotIn(paths[1], cache)
+        self.assertIn(paths[2], cache)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.stats.size, size * 2)
+
+        cache.max_bytes = size
+        self.assertEqual(len(cache), 1)
+
+        self.assertFalse(DefinitionCache(max_bytes=size - 1).put(self._path, skeleton.pack()))
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.stats.size, cache.stats.hits), (0, 0, 0))
+
+    def test_load_skeletons(self):
+        """ Test that the definitions loaded for a build are cached with their validation errors
+        """
+        cache = DefinitionCache()
+
+        Skeleton().load(self._path, cache=cache)
+
+        first = Skeletor.load_skeletons([self._path], cache=cache)
+        second = Skeletor.load_skeletons([self._path], cache=cache)
+        uncached = Skeletor.load_skeletons([self._path])
+
+        self.assertEqual(first[0][1], uncached[0][1])
+        self.assertEqual(first[0][2], uncached[0][2])
+        self.assertEqual(second[0][1:3], first[0][1:3])
+        self.assertEqual(cache.stats.hits, 2)
+
+        missing = os.path.join(self._temp_dir, 'missing.json')
+        self.assertIsNone(Skeletor.load_skeletons([missing], cache=cache)[0][1])
+        self.assertNotIn(missing, cache)
@@ -0,0 +1,128 @@
+# standard library imports
+import os
+import json
+import shutil
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+from tools.maya.rigging.skeletor.joint_pool import JointPool, PooledJointData
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class JointPoolTests(TestCase):
+    """ Tests the JointPool storage.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Clean up the temporary files
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def test_view_properties(self):
+        """ Test that the views read and write the pool
+        """
+        pool = JointPool()
+
+        joint = pool.append()
+        joint.name = 'Root'
+        joint.translation = [1.0, 2.0, 3.0]
+        joint.add_attribute('driver', 'spine')
+
+        self.assertIsInstance(joint, JointData)
+        self.assertEqual(pool.channel('translation').tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(joint.scale, [1.0, 1.0, 1.0])
+        self.assertEqual(joint.custom_attributes, {'driver': 'spine'})
+        self.assertRaises(ValueError, setattr, joint, 'rotation', [1.0])
+        self.assertEqual(sorted(vars(joint)), ['_index', '_pool'])
+
+    def test_remove(self):
+        """ Test that removing a joint moves the following views down
+        """
+        pool = JointPool()
+
+        for name in ('a', 'b', 'c'):
+            pool.append().name = name
+
+        pool[2].translation = [5.0, 0.0, 0.0]
+        pool[2].add_attribute('key')
+
+        pool.remove(1)
+
+        self.assertEqual([joint.name for joint in pool], ['a', 'c'])
+        self.assertEqual(pool[1].index, 1)
+        self.assertEqual(pool[1].translation, [5.0, 0.0, 0.0])
+        self.assertEqual(pool[1].custom_attributes, {'key': None})
+
+    def test_offset_channel(self):
+        """ Test the bulk channel operations
+        """
+        pool = JointPool()
+
+        for _ in range(3):
+            pool.append()
+
+        pool.offset_channel('translation', [1.0, 0.0, -1.0])
+        pool.scale_channel('_scale', [2.0, 2.0, 2.0])
+
+        self.assertEqual(pool[2].translation, [1.0, 0.0, -1.0])
+        self.assertEqual(pool[0].scale, [2.0, 2.0, 2.0])
+
+    def test_pooled_round_trip(self):
+        """ Test that a pooled skeleton saves the same data as a regular skeleton
+        """
+        skeleton = Skeleton()
+        skeleton.load(CHARACTER_PATH)
+
+        pooled = Skeleton(pooled=True)
+        pooled.load(CHARACTER_PATH)
+
+        self.assertTrue(all(isinstance(joint, PooledJointData) for joint in pooled.joints))
+        self.assertEqual(len(pooled.pool), len(skeleton.joints))
+
+        save_path = os.path.join(self._temp_dir, 'pooled.json')
+        pooled.save(save_path)
+
+        with open(save_path) as saved_file:
+            saved_joints = json.load(saved_file)['_joints']
+
+        self.assertEqual(saved_joints, [joint.as_json() for joint in skeleton.joints])
+
+    def test_add_joint_copies(self):
+        """ Test that adding a regular joint to a pooled skeleton copies it in to the pool
+        """
+        skeleton = Skeleton(pooled=True)
+
+        joint = JointData()
+        joint.name = 'Root'
+        joint.orientation = [0.0, 90.0, 0.0]
+
+        added = skeleton.add_joint(joint)
+
+        self.assertIsInstance(added, PooledJointData)
+        self.assertEqual(added.orientation, [0.0, 90.0, 0.0])
+        self.assertIs(skeleton.joints[0], added)
+
+    def test_in_place_channel_edit(self):
+        """ Test that editing a channel in place writes back to the pool like it does on a regular joint
+        """
+        pool = JointPool()
+
+        joint = pool.append()
+        joint.translation[0] = 4.0
+        joint.rotation[1:] = [10.0, 20.0]
+
+        self.assertEqual(joint.translation, [4.0, 0.0, 0.0])
+        self.assertEqual(pool.channel('rotation').tolist(), [0.0, 10.0, 20.0])
+        self.assertRaises(ValueError, joint.scale.__setitem__, slice(None), [1.0])
+        self.assertEqual(joint.scale, [1.0, 1.0, 1.0])
+        self.assertIs(type(json.loads(json.dumps(joint.translation))), list)
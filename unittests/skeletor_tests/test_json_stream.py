@@ -0,0 +1,95 @@
+# standard library imports
+import os
+import json
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.json_stream import iter_skeleton_json, filter_joints
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class JsonStreamTests(TestCase):
+    """ Tests reading skeleton definitions one joint at a time.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._temp_dir = tempfile.mkdtemp()
+
+        with open(CHARACTER_PATH) as data_file:
+            self._data = json.load(data_file)
+
+    def tearDown(self):
+        """ Clean up the temporary files
+        """
+        shutil.rmtree(self._temp_dir)
+
+    def test_stream(self):
+        """ Test that the streamed joints match the whole file, also when values are split between the chunks
+        """
+        for chunk_size in (1, 7, 1 << 16):
+            data = dict()
+
+            with open(CHARACTER_PATH) as data_file:
+                joints = list(iter_skeleton_json(data_file, data, chunk_size))
+
+            self.assertEqual(joints, self._data['_joints'])
+            self.assertEqual(data, {'_prefix': self._data['_prefix'], '_data_path': self._data['_data_path']})
+
+        data = dict()
+        stream = BytesIO(b'{"_prefix": "npc", "_scale": 12.5, "_joints": [ ]}')
+        self.assertEqual(list(iter_skeleton_json(stream, data, 4)), [])
+        self.assertEqual(data, {'_prefix': 'npc', '_scale': 12.5})
+
+        self.assertRaises(ValueError, list, iter_skeleton_json(BytesIO(b'{"_joints": [{"_name": "Root"}'), None, 4))
+
+    def test_filters(self):
+        """ Test reading a subset of the joints
+        """
+        joints = self._data['_joints']
+
+        names = [joint['_name'] for joint in filter_joints(joints, prefix='LThumb')]
+        self.assertEqual(names, ['LThumb_Base', 'LThumb_Mid', 'LThumb_Tip'])
+
+        joints[5]['_group'] = 'head'
+        joints[6]['_group'] = 'head'
+        self.assertEqual([joint['_name'] for joint in filter_joints(joints, groups=['head'])], ['Neck', 'Head'])
+
+        # the children are found even when they come before their parents
+        reordered = list(reversed(joints))
+        names = [joint['_name'] for joint in filter_joints(reordered, root='LAnkle')]
+        self.assertEqual(sorted(names), sorted(['LAnkle', 'LBall', 'LToe', 'Dummy_LFoot_Bank_Outside_1',
+                                                'Dummy_LFoot_Bank_Inside_1', 'Dummy_LHeel_1']))
+        self.assertEqual(names[0], 'LAnkle')
+        self.assertLess(names.index('LBall'), names.index('LToe'))
+
+    def test_load_subset(self):
+        """ Test loading and scanning a subset through the skeleton
+        """
+        binary_path = os.path.join(self._temp_dir, 'character.skb')
+
+        full_skeleton = Skeleton()
+        full_skeleton.load(CHARACTER_PATH)
+        full_skeleton.save(binary_path)
+
+        for path in (CHARACTER_PATH, binary_path):
+            for pooled in (False, True):
+                skeleton = Skeleton(pooled=pooled)
+                skeleton.load(path, root='LWrist')
+
+                self.assertEqual(len(skeleton.joints), 16)
+                self.assertEqual([joint.name for joint in skeleton.roots()], ['LWrist'])
+                self.assertEqual(skeleton.find('LIndex_Tip').translation,
+                                 full_skeleton.find('LIndex_Tip').translation)
+
+            names = [joint.name for joint in Skeleton.iter_joints(path, prefix='R', root='Thorax')]
+            self.assertEqual(len(names), 19)
+
+        self.assertEqual(len(list(Skeleton.iter_joints(CHARACTER_PATH, raw=True))), 61)
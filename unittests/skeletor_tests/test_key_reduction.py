@@ -0,0 +1,143 @@
+# standard library imports
+import math
+import shutil
+import os.path
+import tempfile
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.animation import AnimationClip, AnimationCurve, frame_range
+from tools.maya.rigging.skeletor.key_reduction import KeyReducer, reduce_curve
+
+
+def make_curve(function, frames):
+    """ Creates a curve keyed on every frame
+
+    Args:
+        function: Returns the three values of a frame
+        frames (list(float)): The frames to key
+
+    Returns:
+        AnimationCurve
+    """
+    return AnimationCurve(frames, [value for frame in frames for value in function(frame)])
+
+
+def make_clip(name, frames):
+    """ Creates a clip with a constant, a linear and a curved joint
+
+    Args:
+        name (str): The name of the clip
+        frames (list(float)): The frames to key
+
+    Returns:
+        AnimationClip
+    """
+    clip = AnimationClip(name)
+
+    clip.set_curve('Root', 'translation', make_curve(lambda frame: [0.0, 90.0, 0.0], frames))
+    clip.set_curve('Root', 'rotation', make_curve(lambda frame: [frame * 2.0, 0.0, -frame], frames))
+    clip.set_curve('Spine', 'translation', make_curve(lambda frame: [0.0, 10.0, 0.0], frames))
+    clip.set_curve('Spine', 'rotation', make_curve(lambda frame: [math.sin(frame / 10.0) * 30.0, 0.0, 0.0], frames))
+    clip.set_curve('Spine', 'scale', make_curve(lambda frame: [1.0, 1.0 + frame * 1e-5, 1.0], frames))
+
+    return clip
+
+
+class KeyReductionTests(TestCase):
+    """ Tests removing the keys of captured clips.
+    """
+
+    def test_reduce_curve(self):
+        """ Test reducing constant, linear and curved keys
+        """
+        frames = frame_range(0.0, 100.0)
+
+        constant, error = reduce_curve(make_curve(lambda frame: [1.0, 2.0, 3.0], frames), 0.0)
+        self.assertEqual((list(constant.times), error), ([0.0], 0.0))
+
+        linear, error = reduce_curve(make_curve(lambda frame: [frame, 5.0, frame * -0.5], frames), 1e-9)
+        self.assertEqual(list(linear.times), [0.0, 100.0])
+        self.assertLess(error, 1e-9)
+
+        steps = make_curve(lambda frame: [0.0, 10.0 if frame >= 50 else 0.0, 0.0], frames)
+        reduced, error = reduce_curve(steps, 0.001)
+        self.assertEqual(list(reduced.times), [0.0, 49.0, 50.0, 100.0])
+        self.assertEqual(error, 0.0)
+
+        curve = make_curve(lambda frame: [math.sin(frame / 10.0), 0.0, 0.0], frames)
+
+        for tolerance in (0.1, 0.01, 0.001):
+            reduced, error = reduce_curve(curve, tolerance)
+
+            self.assertLess(len(reduced), len(curve))
+            self.assertLessEqual(error, tolerance)
+            self.assertEqual((reduced.start, reduced.end), (0.0, 100.0))
+
+            for frame in frames:
+                self.assertLessEqual(abs(reduced.evaluate(frame)[0] - curve.evaluate(frame)[0]), tolerance)
+
+        self.assertGreater(len(reduce_curve(curve, 0.001)[0]), len(reduce_curve(curve, 0.1)[0]))
+
+        # a long segment is reduced in one pass over its keys
+        long_frames = frame_range(0.0, 20000.0)
+        reduced, error = reduce_curve(make_curve(lambda frame: [frame * 0.5, 1.0, -frame], long_frames), 0.001)
+        self.assertEqual(list(reduced.times), [0.0, 20000.0])
+
+        # a second key at the same time replaces the first one, instead of dividing by a duration of zero
+        duplicates = AnimationCurve([0.0, 1.0, 1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 5.0, 0.0, 0.0, 1.0, 0.0, 0.0,
+                                                                 2.0, 0.0, 0.0, 3.0, 0.0, 0.0])
+        reduced, error = reduce_curve(duplicates, 0.001)
+        self.assertEqual(list(reduced.times), [0.0, 3.0])
+        self.assertEqual(error, 4.0)
+
+    def test_reduce_clip(self):
+        """ Test the tolerance per channel and the report
+        """
+        clip = make_clip('wave', frame_range(0.0, 60.0))
+
+        reduced, report = KeyReducer({'rotation': 0.05}).reduce(clip)
+
+        self.assertEqual(reduced.joints, clip.joints)
+        self.assertEqual(len(reduced.curve('Root', 'translation')), 1)
+        self.assertEqual(len(reduced.curve('Root', 'rotation')), 2)
+        self.assertEqual(len(reduced.curve('Spine', 'scale')), 2)
+
+        self.assertEqual(report.curves, 5)
+        self.assertEqual(report.keys_before, 5 * 61)
+        self.assertEqual(report.keys_after, reduced.key_count)
+        self.assertEqual(report.constant_curves, 2)
+        self.assertAlmostEqual(report.compression_ratio, report.keys_before / float(reduced.key_count))
+        self.assertLessEqual(report.channel_errors['_rotation'], 0.05)
+        self.assertEqual(report.max_error, max(report.channel_errors.values()))
+
+        loose, _ = KeyReducer({'_scale': 0.01}).reduce(clip)
+        self.assertEqual(len(loose.curve('Spine', 'scale')), 1)
+
+        self.assertRaises(ValueError, KeyReducer, {'rotation': -1.0})
+        self.assertRaises(ValueError, KeyReducer, {'twist': 1.0})
+
+    def test_reduce_clips(self):
+        """ Test reducing several clips and saved clips in parallel
+        """
+        folder = tempfile.mkdtemp()
+
+        try:
+            clips = [make_clip('clip{0}'.format(i), frame_range(0.0, 30.0 + i * 10)) for i in range(4)]
+
+            path = os.path.join(folder, 'saved.ska')
+            clips[-1].save(path)
+
+            reducer = KeyReducer()
+            expected = [reducer.reduce(clip) for clip in clips]
+
+            for workers in (1, 2):
+                results = reducer.reduce_clips(clips[:-1] + [path], workers)
+
+                self.assertEqual([clip.name for clip, _ in results], [clip.name for clip in clips])
+
+                for (clip, report), (expected_clip, expected_report) in zip(results, expected):
+                    self.assertEqual(list(clip), list(expected_clip))
+                    self.assertEqual(report.keys_after, expected_report.keys_after)
+        finally:
+            shutil.rmtree(folder)
@@ -0,0 +1,104 @@
+# standard library imports
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+
+
+def make_joint(name, parent='', translation=None, rotation=None, orientation=None):
+    """ Creates a joint for the tests
+
+    Args:
+        name (str): The name of the joint
+        parent (str): The name of the parent
+        translation (list(float)): The local translation
+        rotation (list(float)): The local rotation
+        orientation (list(float)): The joint orient
+
+    Returns:
+        JointData
+    """
+    joint = JointData()
+    joint.name = name
+    joint.parent = parent
+    joint.translation = translation or [0.0, 0.0, 0.0]
+    joint.rotation = rotation or [0.0, 0.0, 0.0]
+    joint.orientation = orientation or [0.0, 0.0, 0.0]
+
+    return joint
+
+
+class ForwardKinematicsTests(TestCase):
+    """ Tests computing the world matrices of a skeleton without Maya.
+    """
+
+    def setUp(self):
+        """ Setup a small chain of joints, the children are added before their parents on purpose
+        """
+        self._skeletons = []
+
+        for pooled in (False, True):
+            skeleton = Skeleton(pooled=pooled)
+
+            skeleton.add_joint(make_joint('Head', 'Spine', [1.0, 0.0, 0.0]))
+            skeleton.add_joint(make_joint('Root', '', [0.0, 1.0, 0.0]))
+            skeleton.add_joint(make_joint('Spine', 'Root', [0.0, 1.0, 0.0], rotation=[0.0, 0.0, 90.0]))
+            skeleton.add_joint(make_joint('Hand', 'Spine', [0.0, 0.0, 2.0], orientation=[90.0, 0.0, 0.0]))
+
+            self._skeletons.append(skeleton)
+
+    def assertVectorEqual(self, first, second):
+        """ Compares two vectors with a tolerance
+        """
+        self.assertEqual(len(first), len(second))
+
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, places=6)
+
+    def test_world_matrices(self):
+        """ Test composing the local transforms in to world positions
+        """
+        for skeleton in self._skeletons:
+            kinematics = skeleton.forward_kinematics()
+
+            self.assertVectorEqual(kinematics.world_translation('Root'), [0.0, 1.0, 0.0])
+            self.assertVectorEqual(kinematics.world_translation('Spine'), [0.0, 2.0, 0.0])
+
+            # the rotation of the spine turns the x axis of its children on to the y axis
+            self.assertVectorEqual(kinematics.world_translation('Head'), [0.0, 3.0, 0.0])
+            self.assertVectorEqual(kinematics.world_matrix('Head')[0][:3], [0.0, 1.0, 0.0])
+
+            # the joint orient is part of the world rotation
+            self.assertVectorEqual(kinematics.world_matrix('Hand')[1][:3], [0.0, 0.0, 1.0])
+            self.assertVectorEqual(kinematics.world_matrix('Hand')[2][:3], [1.0, 0.0, 0.0])
+
+            self.assertRaises(ValueError, kinematics.world_matrix, 'Tail')
+
+    def test_update(self):
+        """ Test that updating a joint gives the same result as evaluating the whole skeleton
+        """
+        for skeleton in self._skeletons:
+            kinematics = skeleton.forward_kinematics()
+
+            skeleton.find('Spine').rotation = [0.0, 0.0, -90.0]
+
+            updated = kinematics.update('Spine')
+
+            self.assertEqual(sorted(skeleton.index.joints[i].name for i in updated), ['Hand', 'Head', 'Spine'])
+            self.assertVectorEqual(kinematics.world_translation('Head'), [0.0, 1.0, 0.0])
+
+            for joint in skeleton.joints:
+                self.assertEqual(kinematics.world_matrix(joint.name),
+                                 skeleton.forward_kinematics().world_matrix(joint.name))
+
+    def test_world_space(self):
+        """ Test that world values are not composed with their parents
+        """
+        for skeleton in self._skeletons:
+            kinematics = skeleton.forward_kinematics(space='world')
+
+            self.assertVectorEqual(kinematics.world_translation('Head'), [1.0, 0.0, 0.0])
+            self.assertVectorEqual(kinematics.world_matrix('Hand')[1][:3], [0.0, 1.0, 0.0])
+
+        self.assertRaises(ValueError, self._skeletons[0].forward_kinematics, 'object')
@@ -0,0 +1,155 @@
+# standard library imports
+import os
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeletor import Skeletor
+from tools.maya.rigging.skeletor.joint_factory import SkeletonJoint
+from tools.maya.rigging.skeletor.memory_scene import InMemoryScene
+from tools.maya.rigging.skeletor.scene_skeleton import SceneSkeleton
+from tools.maya.rigging.skeletor.scene_joint_data import SceneJointData
+from tools.maya.rigging.skeletor.scene_backend import set_scene_backend, get_scene_backend
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class InMemorySceneTests(TestCase):
+    """ Tests building and capturing skeletons in a scene that only exists in memory.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases
+        """
+        self._scene = InMemoryScene()
+        set_scene_backend(self._scene)
+
+    def tearDown(self):
+        """ Go back to the standalone skeletons
+        """
+        set_scene_backend(None)
+
+    def test_factories(self):
+        """ Test that the joints and skeletons are created for the scene backend while it is set
+        """
+        self.assertIs(get_scene_backend(), self._scene)
+        self.assertIsInstance(SkeletonJoint(), SceneJointData)
+        self.assertIsInstance(Skeletor(), SceneSkeleton)
+        self.assertRaises(ValueError, set_scene_backend, object())
+
+    def test_nodes(self):
+        """ Test creating, naming, parenting and deleting nodes
+        """
+        scene = self._scene
+
+        root, other = scene.create_joints(['Root', 'Root'], [None, None], {'_translation': [[0, 1, 2], [3, 4, 5]]})
+        child = scene.create_joint('Spine', root, translation=[0.0, 5.0, 0.0])
+
+        self.assertEqual(scene.names([root, other, child]), ['Root', 'Root1', 'Spine'])
+        self.assertEqual(scene.find(['Spine', 'Tail']), [child, None])
+        self.assertEqual(scene.get_channel([other, child], '_translation'), [[3.0, 4.0, 5.0], [0.0, 5.0, 0.0]])
+        self.assertEqual(scene.get_channel([child], '_scale'), [[1.0, 1.0, 1.0]])
+        self.assertEqual(scene.parents([root, child]), [None, root])
+        self.assertRaises(ValueError, scene.create_joints, ['Bad'], [None], {'_rotation': [[0.0, 1.0]]})
+        self.assertEqual(len(scene), 3)
+
+        scene.set_parent(child, other)
+        self.assertEqual(scene.children(root), [])
+        self.assertEqual(scene.children(other), [child])
+        self.assertRaises(ValueError, scene.set_parent, other, child)
+
+        self.assertEqual(scene.rename(child, 'Root'), 'Root2')
+
+        scene.delete(other)
+        self.assertEqual(len(scene), 1)
+        self.assertEqual(scene.find(['Root1', 'Root2']), [None, None])
+        self.assertRaises(ValueError, scene.names, [child])
+
+    def test_build_and_capture(self):
+        """ Test that a built skeleton can be captured back from the scene unchanged
+        """
+        skeleton = Skeletor()
+        skeleton.load(CHARACTER_PATH)
+
+        report = skeleton.build()
+
+        self.assertEqual(len(self._scene), len(skeleton.joints))
+        self.assertEqual(len(report.nodes), len(skeleton.joints))
+
+        hip = self._scene.find(['HipGirdle'])[0]
+        self.assertEqual(self._scene.names(self._scene.parents([hip])), ['Root'])
+
+        captured = skeleton.capture_scene()
+        self.assertFalse(captured.diff(skeleton))
+
+        selected = SceneSkeleton()
+        self._scene.select(self._scene.find(['LWrist']))
+        selected.from_selection(hierarchy=True)
+
+        self.assertEqual(sorted(joint.name for joint in selected.joints),
+                         sorted(['LWrist'] + skeleton.descendants('LWrist', names=True)))
+        self.assertEqual(selected.find('LWrist').parent, 'LElbow')
+
+    def test_edits(self):
+        """ Test that editing a built skeleton changes the scene
+        """
+        skeleton = Skeletor(pooled=True)
+        skeleton.load(CHARACTER_PATH)
+        skeleton.build()
+
+        scene_skeleton = skeleton.capture_scene()
+        scene_skeleton.find('Head').translation = [0.0, 10.0, 0.0]
+        scene_skeleton.remove_joint('Neck')
+
+        head = self._scene.find(['Head'])[0]
+
+        self.assertEqual(self._scene.get_channel([head], '_translation'), [[0.0, 10.0, 0.0]])
+        self.assertEqual(self._scene.names(self._scene.parents([head])), ['Thorax'])
+        self.assertEqual(len(self._scene), len(skeleton.joints) - 1)
+
+        diff = scene_skeleton.diff(skeleton)
+        scene_skeleton.apply_diff(diff)
+
+        self.assertFalse(scene_skeleton.capture_scene().diff(skeleton))
+
+    def test_pooled_edits(self):
+        """ Test that editing a built pooled skeleton changes the scene
+        """
+        skeleton = Skeletor(pooled=True)
+        skeleton.load(CHARACTER_PATH)
+        skeleton.build()
+
+        skeleton.remove_joint('Neck')
+
+        head = self._scene.find(['Head'])[0]
+
+        self.assertEqual(self._scene.names(self._scene.parents([head])), ['Thorax'])
+        self.assertEqual(len(self._scene), len(skeleton.joints))
+        self.assertFalse(skeleton.capture_scene().diff(skeleton))
+
+        target = Skeletor()
+        target.load(CHARACTER_PATH)
+        target.find('Head').translation = [0.0, 10.0, 0.0]
+
+        skeleton.apply_diff(skeleton.diff(target))
+
+        self.assertEqual(self._scene.get_channel([head], '_translation'), [[0.0, 10.0, 0.0]])
+        self.assertFalse(skeleton.capture_scene().diff(target))
+
+    def test_scale(self):
+        """ Test that a large scene can be built level by level and walked
+        """
+        scene = self._scene
+        level = scene.create_joints(['root'], [None], {})
+
+        while len(scene) < 50000:
+            parents = [parent for parent in level for _ in range(4)]
+            level = scene.create_joints(['joint'] * len(parents), parents, {})
+
+        self.assertEqual(len(scene.descendants(scene.roots())), len(scene))
+        self.assertEqual(len(set(scene.names(scene.nodes()))), len(scene))
+
+        skeleton = SceneSkeleton()
+        skeleton.from_hierarchy('root')
+
+        self.assertEqual(len(skeleton.joints), len(scene))
@@ -0,0 +1,55 @@
+# standard library imports
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+
+
+class RecordingSkeleton(Skeleton):
+    """ Skeleton that records the levels it is asked to create instead of creating joints.
+    """
+
+    def __init__(self, prefix=''):
+        super(RecordingSkeleton, self).__init__(prefix)
+        self.created_levels = []
+
+    def create_level(self, joints, parents):
+        self.created_levels.append([(joint.name, parent) for joint, parent in zip(joints, parents)])
+        return ['node_' + joint.name for joint in joints]
+
+
+class SkeletonBuilderTests(TestCase):
+    """ Tests building a skeleton one level at a time.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases, the children come before their parents on purpose
+        """
+        self._skeleton = RecordingSkeleton()
+
+        for name, parent in (('Hand', 'Arm'), ('Arm', 'Root'), ('Root', ''), ('Leg', 'Root'), ('Prop', 'World')):
+            joint = JointData()
+            joint.name = name
+            joint.parent = parent
+            self._skeleton.add_joint(joint)
+
+    def test_levels(self):
+        """ Test that every level is created after the level holding its parents
+        """
+        report = self._skeleton.build()
+
+        self.assertEqual(report.levels, 3)
+        self.assertEqual(self._skeleton.created_levels[0], [('Root', None), ('Prop', 'World')])
+        self.assertEqual(sorted(self._skeleton.created_levels[1]), [('Arm', 'node_Root'), ('Leg', 'node_Root')])
+        self.assertEqual(self._skeleton.created_levels[2], [('Hand', 'node_Arm')])
+        self.assertEqual(report.nodes['Hand'], 'node_Hand')
+
+    def test_report(self):
+        """ Test that every phase of the build is timed
+        """
+        report = self._skeleton.build()
+
+        self.assertEqual(list(report.timings.keys()), ['sort', 'create', 'finalize'])
+        self.assertGreaterEqual(report.total_time, 0.0)
+        self.assertEqual(report.skipped, [])
@@ -0,0 +1,80 @@
+# standard library imports
+import os
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class RecordingSkeleton(Skeleton):
+    """ Skeleton that records the levels it is asked to create instead of creating joints.
+    """
+
+    def __init__(self, prefix=''):
+        super(RecordingSkeleton, self).__init__(prefix)
+        self.created_levels = []
+
+    def create_level(self, joints, parents):
+        self.created_levels.append([(joint.name, parent) for joint, parent in zip(joints, parents)])
+        return ['node_' + joint.name for joint in joints]
+
+
+class SkeletonDiffTests(TestCase):
+    """ Tests comparing skeletons and applying only the changes.
+    """
+
+    def setUp(self):
+        """ Setup a skeleton and a changed version of it
+        """
+        self._current = RecordingSkeleton()
+        self._current.load(CHARACTER_PATH)
+
+        self._target = Skeleton()
+        self._target.load(CHARACTER_PATH)
+
+        for name, parent in (('LElbow_Twist', 'LElbow'), ('LElbow_Twist_End', 'LElbow_Twist')):
+            joint = JointData()
+            joint.name = name
+            joint.parent = parent
+            joint.translation = [0.5, 1.3, 0.0]
+            self._target.add_joint(joint)
+
+        self._target.remove_joint('Dummy_LHeel_1')
+        self._target.reparent('Neck', 'HipGirdle')
+        self._target.find('Head').translation = [0.0, 1.8, 0.0]
+
+        # changes smaller than the tolerance are ignored
+        self._target.find('Thorax').rotation = [1e-9, 0.0, 0.0]
+
+    def test_diff(self):
+        """ Test that the diff finds every kind of change
+        """
+        diff = self._current.diff(self._target)
+
+        self.assertEqual(diff.added, ['LElbow_Twist', 'LElbow_Twist_End'])
+        self.assertEqual(diff.removed, ['Dummy_LHeel_1'])
+        self.assertEqual(dict(diff.reparented), {'Neck': ('Thorax', 'HipGirdle')})
+        self.assertEqual(dict(diff.moved), {'Head': ['_translation']})
+        self.assertTrue(diff)
+
+        self.assertFalse(self._target.diff(self._target))
+
+    def test_apply_diff(self):
+        """ Test that applying the diff only creates the added joints and leaves no differences
+        """
+        nodes = self._current.apply_diff(self._current.diff(self._target))
+
+        self.assertEqual(self._current.created_levels, [[('LElbow_Twist', 'LElbow')],
+                                                        [('LElbow_Twist_End', 'node_LElbow_Twist')]])
+        self.assertEqual(sorted(nodes), ['LElbow_Twist', 'LElbow_Twist_End'])
+
+        self.assertFalse(self._current.diff(self._target))
+        self.assertIsNone(self._current.find('Dummy_LHeel_1'))
+        self.assertNotIn('Dummy_LHeel_1', self._current.find('LAnkle').children)
+        self.assertIn('Neck', self._current.find('HipGirdle').children)
+        self.assertNotIn('Neck', self._current.find('Thorax').children)
+        self.assertEqual(self._current.find('LElbow_Twist').children, ['LElbow_Twist_End'])
@@ -0,0 +1,155 @@
+# standard library imports
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+from tools.maya.rigging.skeletor.joint_data import JointData
+
+
+def make_joint(name, parent=''):
+    """ Creates a joint for the tests
+
+    Args:
+        name (str): The name of the joint
+        parent (str): The name of the parent
+
+    Returns:
+        JointData
+    """
+    joint = JointData()
+    joint.name = name
+    joint.parent = parent
+
+    return joint
+
+
+class SkeletonIndexTests(TestCase):
+    """ Tests the name and hierarchy index of the Skeleton.
+    """
+
+    def setUp(self):
+        """ Setup for the test cases, the children are added before their parents on purpose
+        """
+        self._skeleton = Skeleton()
+
+        for name, parent in (('Spine', 'Root'), ('Root', ''), ('Head', 'Neck'), ('Neck', 'Spine'),
+                             ('LArm', 'Spine'), ('LHand', 'LArm')):
+            self._skeleton.add_joint(make_joint(name, parent))
+
+    def test_find(self):
+        """ Test looking up joints by name
+        """
+        self.assertEqual(self._skeleton.find('Neck').name, 'Neck')
+        self.assertIsNone(self._skeleton.find('Tail'))
+
+    def test_ancestors_and_descendants(self):
+        """ Test walking up and down the hierarchy
+        """
+        self.assertEqual(self._skeleton.ancestors('Head', names=True), ['Neck', 'Spine', 'Root'])
+        self.assertEqual(self._skeleton.descendants('Spine', names=True), ['Neck', 'Head', 'LArm', 'LHand'])
+        self.assertRaises(ValueError, self._skeleton.ancestors, 'Tail')
+
+    def test_topological_order(self):
+        """ Test that parents always come before their children
+        """
+        order = [joint.name for joint in self._skeleton.iter_topological()]
+
+        self.assertEqual(len(order), 6)
+
+        for joint in self._skeleton.joints:
+            if joint.parent:
+                self.assertLess(order.index(joint.parent), order.index(joint.name))
+
+    def test_edits(self):
+        """ Test that the index follows reparenting, renaming and removing joints
+        """
+        self._skeleton.reparent('LArm', 'Neck')
+        self.assertEqual(self._skeleton.ancestors('LHand', names=True), ['LArm', 'Neck', 'Spine', 'Root'])
+        self.assertRaises(ValueError, self._skeleton.reparent, 'Spine', 'LHand')
+
+        self._skeleton.rename('Neck', 'Neck_01')
+        self.assertEqual(self._skeleton.find('Head').parent, 'Neck_01')
+        self.assertEqual(self._skeleton.ancestors('Head', names=True), ['Neck_01', 'Spine', 'Root'])
+
+        self._skeleton.remove_joint('Neck_01')
+        self.assertIsNone(self._skeleton.find('Neck_01'))
+        self.assertEqual(self._skeleton.find('Head').parent, 'Spine')
+        self.assertEqual(sorted(self._skeleton.descendants('Spine', names=True)), ['Head', 'LArm', 'LHand'])
+
+    def test_pooled_edits(self):
+        """ Test that removing a pooled joint keeps the pool and the index in sync
+        """
+        skeleton = Skeleton(pooled=True)
+
+        for joint in self._skeleton.joints:
+            skeleton.add_joint(joint)
+
+        removed = skeleton.remove_joint('Spine')
+
+        self.assertEqual(removed.name, 'Spine')
+        self.assertEqual(len(skeleton.pool), 5)
+        self.assertEqual(skeleton.find('LHand').index, skeleton.index.index_of('LHand'))
+        self.assertEqual(skeleton.ancestors('Head', names=True), ['Neck', 'Root'])
+
+    def test_remove_joints(self):
+        """ Test removing a parent and its child at once, the children that are kept move up past both
+        """
+        for pooled in (False, True):
+            skeleton = Skeleton(pooled=pooled)
+
+            for joint in self._skeleton.joints:
+                skeleton.add_joint(make_joint(joint.name, joint.parent))
+
+            removed = skeleton.remove_joints(['LArm', 'Spine', 'LArm'])
+
+            self.assertEqual([joint.name for joint in removed], ['LArm', 'Spine'])
+            self.assertEqual(sorted(joint.name for joint in skeleton.joints), ['Head', 'LHand', 'Neck', 'Root'])
+            self.assertEqual(skeleton.find('LHand').parent, 'Root')
+            self.assertEqual(skeleton.find('Neck').parent, 'Root')
+            self.assertEqual(sorted(skeleton.descendants('Root', names=True)), ['Head', 'LHand', 'Neck'])
+
+            if pooled:
+                self.assertEqual(len(skeleton.pool), 4)
+                self.assertEqual(skeleton.pool.names, [joint.name for joint in skeleton.joints])
+
+    def test_group_and_attribute_queries(self):
+        """ Test selecting joints by group and custom attribute, and that the queries follow edits
+        """
+        for pooled in (False, True):
+            skeleton = Skeleton(pooled=pooled)
+
+            for joint in self._skeleton.joints:
+                joint = skeleton.add_joint(make_joint(joint.name, joint.parent))
+
+                if joint.name in ('Head', 'Neck'):
+                    joint.group = 'face'
+
+                if joint.name in ('Head', 'LHand'):
+                    joint.add_attribute('driver', joint.name.lower())
+
+            # joints edited directly are picked up when the index is rebuilt
+            skeleton.reindex()
+
+            self.assertEqual(skeleton.select('face', names=True), ['Head', 'Neck'])
+            self.assertEqual(skeleton.select('face', 'driver', names=True), ['Head'])
+            self.assertEqual(skeleton.select(['face', ''], {'driver': 'lhand'}, names=True), ['LHand'])
+            self.assertEqual(skeleton.select(attributes={'driver': ['unhashable']}), [])
+            self.assertEqual(len(skeleton.select()), 6)
+
+            skeleton.set_group('LHand', 'face')
+            skeleton.set_attribute('Neck', 'driver', ['neck'])
+            skeleton.set_attribute('Head', 'driver', 'jaw')
+
+            self.assertEqual(skeleton.select('face', 'driver', names=True), ['Head', 'Neck', 'LHand'])
+            self.assertEqual(skeleton.select(attributes={'driver': ['neck']}, names=True), ['Neck'])
+            self.assertEqual(skeleton.select(attributes={'driver': 'head'}), [])
+            self.assertEqual(skeleton.select(attributes={'driver': 'jaw'}, names=True), ['Head'])
+            self.assertEqual(skeleton.index.groups, ['', 'face'])
+
+            self.assertEqual(skeleton.remove_attribute('LHand', 'driver'), 'lhand')
+            self.assertRaises(ValueError, skeleton.remove_attribute, 'LHand', 'driver')
+            self.assertEqual(skeleton.select(attributes='driver', names=True), ['Head', 'Neck'])
+            self.assertEqual(skeleton.find('LHand').custom_attributes, {})
+
+            skeleton.remove_joint('Neck')
+            self.assertEqual(skeleton.select('face', names=True), ['Head', 'LHand'])
@@ -0,0 +1,83 @@
+# standard library imports
+import os
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging.skeletor.skeleton import Skeleton
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
+
+
+class SkeletonMirrorTests(TestCase):
+    """ Tests mirroring the joints of a skeleton.
+    """
+
+    def setUp(self):
+        """ Setup a skeleton without its right side
+        """
+        self._full = Skeleton()
+        self._full.load(CHARACTER_PATH)
+
+        self._skeletons = []
+
+        for pooled in (False, True):
+            skeleton = Skeleton(pooled=pooled)
+            skeleton.load(CHARACTER_PATH)
+
+            for joint in list(skeleton.joints):
+                if joint.name.startswith('R') and joint.name != 'Root':
+                    skeleton.remove_joint(joint.name)
+
+            self._skeletons.append(skeleton)
+
+    def test_create(self):
+        """ Test that the missing side is created with reflected translations
+        """
+        for skeleton in self._skeletons:
+            created = skeleton.mirror('x')
+
+            self.assertEqual(sorted(joint.name for joint in created),
+                             sorted(joint.name for joint in self._full.joints
+                                    if joint.name.startswith('R') and joint.name != 'Root'))
+
+            for joint in created:
+                original = self._full.find(joint.name)
+
+                self.assertEqual(joint.parent, original.parent)
+                self.assertEqual(joint.mirrored_joint, 'L' + joint.name[1:])
+                self.assertEqual(skeleton.find(joint.mirrored_joint).mirrored_joint, joint.name)
+
+                for value, original_value in zip(joint.translation, original.translation):
+                    self.assertAlmostEqual(value, original_value, places=1)
+
+            self.assertIn('RClavicle', skeleton.find('Thorax').children)
+            self.assertEqual(sorted(skeleton.find('RWrist').children), sorted(self._full.find('RWrist').children))
+            self.assertEqual(skeleton.ancestors('RPinky_Tip', names=True)[:3], ['RPinky_Mid', 'RPinky_Base', 'RWrist'])
+
+            # running it again only links the joints
+            self.assertEqual(skeleton.mirror('x'), [])
+
+    def test_reflect(self):
+        """ Test the reflection of the rotation channels and linking existing joints
+        """
+        skeleton = self._skeletons[0]
+        clavicle = skeleton.find('LClavicle')
+        clavicle.rotation = [10.0, 20.0, 30.0]
+        clavicle.orientation = [1.0, 2.0, 3.0]
+
+        self.assertEqual(skeleton.mirror('x', create=False), [])
+        self.assertIsNone(clavicle.mirrored_joint)
+
+        skeleton.mirror('y')
+        mirrored = skeleton.find('RClavicle')
+
+        self.assertEqual(mirrored.translation[1], -clavicle.translation[1])
+        self.assertEqual(mirrored.rotation, [-10.0, 20.0, -30.0])
+        self.assertEqual(mirrored.orientation, [-1.0, 2.0, -3.0])
+
+        self.assertEqual(self._full.mirror('x', create=False), [])
+        self.assertEqual(self._full.find('LKnee').mirrored_joint, 'RKnee')
+        self.assertEqual(self._full.find('RKnee').mirrored_joint, 'LKnee')
+
+        self.assertRaises(ValueError, skeleton.mirror, 'w')
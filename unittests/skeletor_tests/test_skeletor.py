@@ -1,8 +1,15 @@
 # standard library imports
+import os
+import json
+import shutil
+import tempfile
 from unittest import TestCase
 
 # tools imports
-from tools.maya.rigging.skeletor.skeletor import Skeletor, Skeleton
+from tools.maya.rigging.skeletor.skeletor import Skeletor, Skeleton, SkeletonBuildSummary
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'tools', 'maya', 'rigging', 'skeletor', 'data',
+                              'character.json')
 
 
 class SkeletorTests(TestCase):
@@ -28,3 +35,34 @@ class SkeletorTests(TestCase):
         self.assertRaises(ValueError, Skeletor.build_skeletons, self._skeletor)
 
         self.assertEquals(Skeletor.build_skeletons([self._skeletor]), True)
+
+    def test_build_skeletons_parallel(self):
+        """ Test loading the definitions across worker processes
+        """
+        temp_dir = tempfile.mkdtemp()
+
+        try:
+            # a definition with a joint defined twice should be reported and not built
+            with open(CHARACTER_PATH) as character_file:
+                data = json.load(character_file)
+
+            data['_joints'].append(data['_joints'][0])
+
+            invalid_path = os.path.join(temp_dir, 'invalid.json')
+
+            with open(invalid_path, 'w') as invalid_file:
+                json.dump(data, invalid_file)
+
+            missing_path = os.path.join(temp_dir, 'missing.json')
+
+            summary = Skeletor.build_skeletons([CHARACTER_PATH, invalid_path, CHARACTER_PATH, missing_path],
+                                               workers=2, summary=True)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertIsInstance(summary, SkeletonBuildSummary)
+        self.assertEqual([timing.name for timing in summary.skeletons],
+                         [CHARACTER_PATH, invalid_path, CHARACTER_PATH, missing_path])
+        self.assertEqual(summary.skeletons[0].joint_count, 61)
+        self.assertEqual([timing.name for timing in summary.failed], [invalid_path, missing_path])
+        self.assertIn('Parent', summary.skeletons[1].errors[0])
@@ -0,0 +1,70 @@
+# standard library imports
+import os
+import sys
+from unittest import TestCase
+
+# tools imports
+from tools.maya.rigging import Utils
+from tools.maya.rigging.Utils import using_maya, set_backend, get_backend, lazy_import, LazyModule
+from tools.maya.rigging.skeletor.skeletor import Skeletor
+from tools.maya.rigging.skeletor.maya_skeleton import MayaSkeleton
+
+
+class BackendTests(TestCase):
+    """ Tests detecting whether Maya is used and the lazy imports.
+    """
+
+    def tearDown(self):
+        """ Detect the backend again for the other tests
+        """
+        os.environ.pop(Utils.BACKEND_ENVIRONMENT_VARIABLE, None)
+        set_backend(None)
+
+    def test_override(self):
+        """ Test forcing the backend
+        """
+        set_backend('maya')
+        self.assertTrue(using_maya())
+        self.assertIsInstance(Skeletor(), MayaSkeleton)
+
+        set_backend('standalone')
+        self.assertFalse(using_maya())
+        self.assertNotIsInstance(Skeletor(), MayaSkeleton)
+
+        self.assertRaises(ValueError, set_backend, 'houdini')
+
+    def test_environment(self):
+        """ Test picking the backend from the environment, it is only detected once
+        """
+        os.environ[Utils.BACKEND_ENVIRONMENT_VARIABLE] = 'maya'
+        set_backend(None)
+        self.assertEqual(get_backend(), 'maya')
+
+        os.environ[Utils.BACKEND_ENVIRONMENT_VARIABLE] = 'standalone'
+        self.assertEqual(get_backend(), 'maya')
+
+        set_backend(None)
+        self.assertEqual(get_backend(), 'standalone')
+
+    def test_lazy_import(self):
+        """ Test that a module is only imported when it is used
+        """
+        sys.modules.pop('wave', None)
+
+        wave = lazy_import('wave')
+
+        self.assertIsInstance(wave, LazyModule)
+        self.assertNotIn('wave', sys.modules)
+
+        self.assertTrue(callable(wave.open))
+        self.assertIn('wave', sys.modules)
+
+        self.assertIs(lazy_import('wave'), sys.modules['wave'])
+
+    def test_process_map(self):
+        """ Test that the results of the worker processes keep the order of the items, and that errors are raised
+        """
+        paths = ['/a/one.json', '/b/two.json', '/c/three.json', '/d/four.json', '/e/five.json']
+
+        self.assertEqual(Utils.process_map(os.path.basename, paths, 2), [os.path.basename(path) for path in paths])
+        self.assertRaises(RuntimeError, Utils.process_map, int, ['1', 'two'], 2)